@@ -27,6 +27,8 @@ class EventLogAdmin(admin.ModelAdmin):
         "object_type",
         "object_id",
     )
-    list_filter = ("event_type", "user", "timestamp")
+    list_filter = ("event_type", "timestamp")
+    list_select_related = ("user",)
     search_fields = ("event_name", "metadata", "user__email")
+    raw_id_fields = ("user",)
     readonly_fields = ("timestamp",)
@@ -5,3 +5,6 @@ class AnalyticsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.analytics"
     verbose_name = "분석"
+
+    def ready(self):
+        import apps.analytics.signals  # noqa
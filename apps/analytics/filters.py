@@ -0,0 +1,24 @@
+import django_filters
+
+from .models import EventLog
+
+
+class EventLogFilter(django_filters.FilterSet):
+    start_timestamp = django_filters.DateTimeFilter(field_name="timestamp", lookup_expr="gte")
+    end_timestamp = django_filters.DateTimeFilter(field_name="timestamp", lookup_expr="lte")
+    # GeneratedField는 자동 필터 생성 대상이 아니므로 명시적으로 선언
+    campaign = django_filters.CharFilter(field_name="campaign")
+    utm_source = django_filters.CharFilter(field_name="utm_source")
+
+    class Meta:
+        model = EventLog
+        fields = [
+            "event_type",
+            "user",
+            "object_type",
+            "object_id",
+            "campaign",
+            "utm_source",
+            "start_timestamp",
+            "end_timestamp",
+        ]
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.fields.json import KT
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from apps.user.models import User  # 사용자 모델 임포트
@@ -42,6 +44,8 @@ class EventLog(models.Model):
         related_name="event_logs",
         verbose_name="사용자",
     )
+    # __str__에서 사용자 조회 쿼리가 발생하지 않도록 생성 시점의 이메일을 저장
+    user_email_snapshot = models.CharField(max_length=254, blank=True, editable=False, verbose_name="사용자 이메일")
     event_name = models.CharField(max_length=255, verbose_name="이벤트 이름")
     event_type = models.CharField(
         _("이벤트 타입"),
@@ -50,15 +54,44 @@ class EventLog(models.Model):
         default=EventType.OTHER,
     )
     value = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True, verbose_name="값")
-    timestamp = models.DateTimeField(auto_now_add=True, verbose_name="타임스탬프")
-    object_id = models.PositiveIntegerField(blank=True, null=True, verbose_name="관련 객체 ID")
+    # Redis 큐를 거쳐 나중에 저장되는 이벤트도 발생 시각을 유지하도록 auto_now_add 대신 기본값으로 지정
+    timestamp = models.DateTimeField(default=timezone.now, editable=False, verbose_name="타임스탬프")
+    # 분석 규모에서 32비트 범위를 넘을 수 있고, object_id 단독 필터도 인덱스를 타도록 설정
+    object_id = models.PositiveBigIntegerField(blank=True, null=True, db_index=True, verbose_name="관련 객체 ID")
     object_type = models.CharField(max_length=100, blank=True, null=True, verbose_name="관련 객체 타입")
     metadata = models.JSONField(blank=True, null=True, verbose_name="메타데이터")
+    # 자주 조회되는 metadata 키는 저장형 생성 컬럼으로 추출해 일반 인덱스로 필터링
+    campaign = models.GeneratedField(
+        expression=KT("metadata__campaign"),
+        output_field=models.CharField(max_length=255, null=True),
+        db_persist=True,
+        verbose_name="캠페인",
+    )
+    utm_source = models.GeneratedField(
+        expression=KT("metadata__utm_source"),
+        output_field=models.CharField(max_length=255, null=True),
+        db_persist=True,
+        verbose_name="유입 경로",
+    )
 
     class Meta:
         verbose_name = "이벤트 로그"
         verbose_name_plural = "이벤트 로그"
         ordering = ["-timestamp"]
+        # 목록 API의 필터 + 기본 정렬(-timestamp) 조합을 인덱스 범위 스캔으로 처리
+        indexes = [
+            models.Index(fields=["-timestamp"]),
+            models.Index(fields=["user", "-timestamp"]),
+            models.Index(fields=["event_type", "-timestamp"]),
+            models.Index(fields=["object_type", "object_id"]),
+            models.Index(fields=["campaign"]),
+            models.Index(fields=["utm_source"]),
+        ]
+
+    def save(self, *args, **kwargs):
+        if self.user_id and not self.user_email_snapshot:
+            self.user_email_snapshot = self.user.email
+        super().save(*args, **kwargs)
 
     def __str__(self):
-        return f"[{self.event_type}] {self.event_name} by {self.user.email if self.user else 'Anonymous'} at {self.timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
+        return f"[{self.event_type}] {self.event_name} by {self.user_email_snapshot or 'Anonymous'} at {self.timestamp.isoformat(timespec='seconds')}"
@@ -0,0 +1,13 @@
+from rest_framework.pagination import CursorPagination
+
+
+class EventLogCursorPagination(CursorPagination):
+    """
+    이벤트 로그 목록용 커서(keyset) 페이지네이션
+    OFFSET 대신 WHERE timestamp < ? 조건으로 (-timestamp) 인덱스를 따라 페이지를 이동합니다.
+    """
+
+    ordering = ("-timestamp", "-id")
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
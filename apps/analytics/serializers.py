@@ -1,25 +1,78 @@
 from rest_framework import serializers
 
-from apps.user.serializers import UserSerializer  # 사용자 시리얼라이저 임포트
+from apps.user.models import User
+from utils.serializers import CachedFieldsModelSerializer
 
 from .models import DailyAnalytics, EventLog
 
+# 목록 조회 시 모델 인스턴스 생성 없이 values()로 가져올 컬럼
+EVENT_LOG_LIST_VALUES = (
+    "id",
+    "event_name",
+    "event_type",
+    "value",
+    "timestamp",
+    "object_id",
+    "object_type",
+    "metadata",
+    "user_id",
+)
 
-class DailyAnalyticsSerializer(serializers.ModelSerializer):
+# 상세 조회 시 EventLogSerializer가 읽는 컬럼만 로드 (사용자는 평탄화된 컬럼만)
+EVENT_LOG_DETAIL_FIELDS = (
+    "id",
+    "event_name",
+    "event_type",
+    "value",
+    "timestamp",
+    "object_id",
+    "object_type",
+    "metadata",
+    "user__id",
+    "user__email",
+    "user__nickname",
+)
+
+_timestamp_field = serializers.DateTimeField(read_only=True)
+_value_field = serializers.DecimalField(max_digits=10, decimal_places=2, read_only=True)
+
+
+def has_null_characters(value):
+    """JSON 값(중첩된 dict 키/값, list 포함)에 NUL 문자가 있는지 확인합니다. (PostgreSQL text/jsonb는 NUL을 저장하지 못함)"""
+    if isinstance(value, str):
+        return "\x00" in value
+    if isinstance(value, dict):
+        return any(has_null_characters(key) or has_null_characters(item) for key, item in value.items())
+    if isinstance(value, list):
+        return any(has_null_characters(item) for item in value)
+    return False
+
+
+class DailyAnalyticsSerializer(CachedFieldsModelSerializer):
     class Meta:
         model = DailyAnalytics
         fields = "__all__"
         read_only_fields = ("created_at", "updated_at")
 
 
-class EventLogSerializer(serializers.ModelSerializer):
-    user = UserSerializer(read_only=True)  # 사용자 정보를 읽기 전용으로 표시
+class DailyAnalyticsSummarySerializer(DailyAnalyticsSerializer):
+    total_orders = serializers.IntegerField(read_only=True)
+    avg_rating = serializers.FloatField(read_only=True, allow_null=True)
+
+
+class EventLogSerializer(CachedFieldsModelSerializer):
+    # 중첩 UserSerializer 대신 필요한 사용자 컬럼만 평탄화해서 읽음
+    user_id = serializers.IntegerField(read_only=True)
+    user_email = serializers.EmailField(source="user.email", read_only=True)
+    user_nickname = serializers.CharField(source="user.nickname", read_only=True)
 
     class Meta:
         model = EventLog
         fields = (
             "id",
-            "user",
+            "user_id",
+            "user_email",
+            "user_nickname",
             "event_name",
             "event_type",
             "value",
@@ -29,3 +82,44 @@ class EventLogSerializer(serializers.ModelSerializer):
             "metadata",
         )
         read_only_fields = ("timestamp",)
+
+    def validate_metadata(self, value):
+        # 문자열 필드는 DRF CharField가 NUL을 거부하지만 JSON 값은 검사하지 않음 (큐 적재 후 flush 단계에서 실패)
+        if has_null_characters(value):
+            raise serializers.ValidationError("NUL 문자는 사용할 수 없습니다.")
+        return value
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # 기존 응답 형태({"user": {...}})를 유지
+        user_id = data.pop("user_id", None)
+        user = {
+            "id": user_id,
+            "email": data.pop("user_email", None),
+            "nickname": data.pop("user_nickname", None),
+        }
+        return {"id": data.pop("id"), "user": user if user_id is not None else None, **data}
+
+
+def get_event_log_users(rows):
+    """values() 결과에 등장하는 사용자를 한 번의 IN 쿼리로 조회해 {id: {id, email, nickname}}로 반환합니다."""
+    user_ids = {row["user_id"] for row in rows if row["user_id"] is not None}
+    if not user_ids:
+        return {}
+    return {user["id"]: user for user in User.objects.filter(pk__in=user_ids).values("id", "email", "nickname")}
+
+
+def event_log_values_to_representation(row, users):
+    """values() 결과 dict를 EventLogSerializer 응답과 같은 형태의 dict로 변환합니다."""
+    user_id = row["user_id"]
+    return {
+        "id": row["id"],
+        "user": users.get(user_id) if user_id is not None else None,
+        "event_name": row["event_name"],
+        "event_type": row["event_type"],
+        "value": _value_field.to_representation(row["value"]) if row["value"] is not None else None,
+        "timestamp": _timestamp_field.to_representation(row["timestamp"]),
+        "object_id": row["object_id"],
+        "object_type": row["object_type"],
+        "metadata": row["metadata"],
+    }
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from utils.cache_helpers import invalidate_daily_analytics_cache
+
+from .models import DailyAnalytics
+
+
+@receiver([post_save, post_delete], sender=DailyAnalytics)
+def invalidate_daily_analytics_list_cache(sender, instance, **kwargs):
+    """일별 분석 데이터가 저장/삭제되면 목록 캐시를 무효화합니다."""
+    invalidate_daily_analytics_cache()
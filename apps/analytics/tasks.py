@@ -0,0 +1,168 @@
+import json
+import logging
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+from celery import shared_task
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DataError, IntegrityError, transaction
+from django.db.models import Avg, Count, Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django_redis import get_redis_connection
+
+from apps.order.models import Order
+
+from .models import DailyAnalytics, EventLog
+
+logger = logging.getLogger("apps")
+
+EVENT_LOG_QUEUE_KEY = "analytics:event_log_queue"
+EVENT_LOG_FLUSH_LOCK_KEY = "analytics:event_log_queue:flush_lock"
+# 다시 시도해도 저장할 수 없는 이벤트(잘못된 payload, 제약 조건 위반 등)를 옮겨 두는 목록
+EVENT_LOG_DEAD_LETTER_KEY = "analytics:event_log_queue:dead_letter"
+EVENT_LOG_FLUSH_LOCK_TIMEOUT = 5 * 60  # 5분
+EVENT_LOG_FLUSH_BATCH_SIZE = 1000
+EVENT_LOG_PURGE_BATCH_SIZE = 5000
+
+
+def enqueue_event_log(user, data):
+    """
+    검증된 이벤트 로그 데이터를 Redis 큐에 적재합니다. (DB 저장은 flush_event_log_queue가 담당)
+    익명 이벤트는 user=None으로 적재합니다.
+    """
+    # bulk_create는 save()를 거치지 않으므로 이메일 스냅샷을 적재 시점에 함께 저장
+    # 저장(flush) 시각이 아닌 이벤트 발생 시각으로 집계되도록 timestamp도 적재 시점에 기록
+    payload = json.dumps(
+        {
+            "user_id": user.pk if user else None,
+            "user_email_snapshot": user.email if user else "",
+            **data,
+            "timestamp": timezone.now(),
+        },
+        cls=DjangoJSONEncoder,
+    )
+    get_redis_connection("default").rpush(EVENT_LOG_QUEUE_KEY, payload)
+
+
+# 재시도해도 같은 결과가 나오는 오류. 그 밖의 DB 오류(연결 끊김 등)는 배치를 큐에 남겨 다음 실행에서 다시 저장
+EVENT_LOG_PERMANENT_ERRORS = (DataError, IntegrityError, ValidationError, ValueError, TypeError)
+
+
+def _event_log_from_payload(item):
+    data = json.loads(item)
+    if data.get("timestamp"):
+        data["timestamp"] = parse_datetime(data["timestamp"])
+    return EventLog(**data)
+
+
+def _save_event_logs(items, batch_size):
+    """
+    배치를 한 번에 저장하고, 영구 오류가 나면 한 건씩 다시 저장해 저장하지 못한 원본 항목 목록을 반환합니다.
+    한 건씩 저장하는 동안 일시적인 오류가 나면 전체를 롤백하고 예외를 그대로 올립니다.
+    """
+    try:
+        with transaction.atomic():
+            EventLog.objects.bulk_create([_event_log_from_payload(item) for item in items], batch_size=batch_size)
+        return []
+    except EVENT_LOG_PERMANENT_ERRORS:
+        pass
+    failed = []
+    with transaction.atomic():
+        for item in items:
+            try:
+                with transaction.atomic():
+                    EventLog.objects.bulk_create([_event_log_from_payload(item)])
+            except EVENT_LOG_PERMANENT_ERRORS:
+                failed.append(item)
+    return failed
+
+
+@shared_task
+def flush_event_log_queue(batch_size=EVENT_LOG_FLUSH_BATCH_SIZE):
+    """
+    Redis 큐에 쌓인 이벤트 로그를 batch_size 단위로 꺼내 bulk_create로 저장합니다. (주기 실행)
+    저장이 커밋된 뒤에만 큐에서 제거하므로 일시적인 DB 오류가 나면 해당 배치는 큐에 남아 다음 실행에서 다시 저장됩니다.
+    저장할 수 없는 이벤트는 EVENT_LOG_DEAD_LETTER_KEY 목록으로 옮겨 뒤의 이벤트 저장을 막지 않습니다.
+    """
+    connection = get_redis_connection("default")
+    # 큐 앞부분을 읽고 저장 후 잘라내는 방식이라 동시에 하나의 작업만 flush (중복 저장 방지)
+    lock = connection.lock(EVENT_LOG_FLUSH_LOCK_KEY, timeout=EVENT_LOG_FLUSH_LOCK_TIMEOUT)
+    if not lock.acquire(blocking=False):
+        return 0
+    created = 0
+    try:
+        while True:
+            items = connection.lrange(EVENT_LOG_QUEUE_KEY, 0, batch_size - 1)
+            if not items:
+                break
+            failed = _save_event_logs(items, batch_size)
+            if failed:
+                logger.error("Moved %s unsavable event logs to %s", len(failed), EVENT_LOG_DEAD_LETTER_KEY)
+                connection.rpush(EVENT_LOG_DEAD_LETTER_KEY, *failed)
+            # 새 이벤트는 큐 끝에만 추가되므로 읽은 개수만큼 앞에서 제거
+            connection.ltrim(EVENT_LOG_QUEUE_KEY, len(items), -1)
+            created += len(items) - len(failed)
+            if len(items) < batch_size:
+                break
+    finally:
+        lock.release()
+    return created
+
+
+@shared_task
+def purge_old_event_logs(batch_size=EVENT_LOG_PURGE_BATCH_SIZE):
+    """
+    보존 기간(ANALYTICS_EVENT_LOG_RETENTION_DAYS)이 지난 이벤트 로그를 batch_size 단위로 삭제합니다. (예약 작업)
+    보존 기간을 설정하지 않았으면 아무것도 삭제하지 않습니다.
+    """
+    if not settings.ANALYTICS_EVENT_LOG_RETENTION_DAYS:
+        return 0
+    threshold = timezone.now() - timedelta(days=settings.ANALYTICS_EVENT_LOG_RETENTION_DAYS)
+    deleted = 0
+    while True:
+        # timestamp 인덱스로 오래된 행의 id만 찾아 짧은 DELETE를 반복 (긴 잠금 방지)
+        ids = list(EventLog.objects.filter(timestamp__lt=threshold).values_list("id", flat=True)[:batch_size])
+        if not ids:
+            break
+        count, _ = EventLog.objects.filter(id__in=ids).delete()
+        deleted += count
+    return deleted
+
+
+@shared_task
+def refresh_daily_analytics(target_date=None):
+    """
+    target_date(ISO 문자열, 기본값: 어제) 하루치 EventLog/Order를 집계해 DailyAnalytics 행을 갱신합니다. (예약 작업)
+    """
+    day = date.fromisoformat(target_date) if target_date else timezone.localdate() - timedelta(days=1)
+    # __date 변환 대신 시각 범위로 조회해 timestamp/created_at 인덱스를 사용
+    start = timezone.make_aware(datetime.combine(day, time.min))
+    end = start + timedelta(days=1)
+
+    page_view = Q(event_type=EventLog.EventType.PAGE_VIEW)
+    events = EventLog.objects.filter(timestamp__gte=start, timestamp__lt=end).aggregate(
+        page_views=Count("id", filter=page_view),
+        unique_visitors=Count("user", filter=page_view, distinct=True),
+    )
+    orders = Order.objects.filter(created_at__gte=start, created_at__lt=end).aggregate(
+        buyers=Count("user", distinct=True),
+        average_order_value=Avg("total_amount"),
+    )
+
+    conversion_rate = Decimal("0")
+    if events["unique_visitors"]:
+        conversion_rate = min(Decimal(orders["buyers"] * 100) / events["unique_visitors"], Decimal("100"))
+
+    daily_analytics, _ = DailyAnalytics.objects.update_or_create(
+        date=day,
+        defaults={
+            "page_views": events["page_views"],
+            "unique_visitors": events["unique_visitors"],
+            "conversion_rate": conversion_rate.quantize(Decimal("0.01")),
+            "average_order_value": (orders["average_order_value"] or Decimal("0")).quantize(Decimal("0.01")),
+        },
+    )
+    return daily_analytics.pk
@@ -0,0 +1,222 @@
+import json
+from decimal import Decimal
+from unittest.mock import patch
+
+import fakeredis
+import pytest
+from django.db import OperationalError
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.analytics.models import DailyAnalytics, EventLog
+from apps.analytics.tasks import (
+    EVENT_LOG_DEAD_LETTER_KEY,
+    EVENT_LOG_QUEUE_KEY,
+    enqueue_event_log,
+    flush_event_log_queue,
+    purge_old_event_logs,
+    refresh_daily_analytics,
+)
+
+
+@pytest.fixture
+def fake_redis():
+    connection = fakeredis.FakeRedis()
+    with patch("apps.analytics.tasks.get_redis_connection", return_value=connection):
+        yield connection
+
+
+@pytest.mark.django_db
+def test_flush_event_log_queue_bulk_creates_queued_events(fake_redis, user_factory):
+    user = user_factory()
+    for i in range(5):
+        enqueue_event_log(user, {"event_name": f"큐 이벤트 {i}", "event_type": EventLog.EventType.CLICK})
+
+    created = flush_event_log_queue(batch_size=2)
+
+    assert created == 5
+    assert EventLog.objects.filter(user=user, event_type=EventLog.EventType.CLICK).count() == 5
+    assert set(EventLog.objects.values_list("user_email_snapshot", flat=True)) == {user.email}
+    assert fake_redis.llen(EVENT_LOG_QUEUE_KEY) == 0
+
+
+@pytest.mark.django_db
+def test_flush_event_log_queue_keeps_batch_on_transient_db_error(fake_redis):
+    for i in range(3):
+        enqueue_event_log(None, {"event_name": f"큐 이벤트 {i}"})
+
+    with patch.object(EventLog.objects, "bulk_create", side_effect=OperationalError("db down")):
+        with pytest.raises(OperationalError):
+            flush_event_log_queue()
+    assert fake_redis.llen(EVENT_LOG_QUEUE_KEY) == 3
+
+    assert flush_event_log_queue() == 3
+    assert fake_redis.llen(EVENT_LOG_QUEUE_KEY) == 0
+
+
+@pytest.mark.django_db
+def test_flush_event_log_queue_moves_unsavable_events_to_dead_letter(fake_redis):
+    enqueue_event_log(None, {"event_name": "정상 이벤트 1"})
+    bad_items = [b"not-json", json.dumps({"event_name": "없는 필드", "unknown_field": 1})]
+    fake_redis.rpush(EVENT_LOG_QUEUE_KEY, *bad_items)
+    enqueue_event_log(None, {"event_name": "정상 이벤트 2"})
+
+    created = flush_event_log_queue(batch_size=10)
+
+    assert created == 2
+    assert set(EventLog.objects.values_list("event_name", flat=True)) == {"정상 이벤트 1", "정상 이벤트 2"}
+    assert fake_redis.llen(EVENT_LOG_QUEUE_KEY) == 0
+    assert fake_redis.lrange(EVENT_LOG_DEAD_LETTER_KEY, 0, -1) == [b"not-json", bad_items[1].encode()]
+
+    # 뒤에 쌓인 이벤트는 막히지 않고 저장됨
+    enqueue_event_log(None, {"event_name": "정상 이벤트 3"})
+    assert flush_event_log_queue() == 1
+
+
+@pytest.mark.django_db
+def test_flush_event_log_queue_keeps_enqueue_time(fake_redis):
+    event_time = (timezone.now() - timezone.timedelta(hours=1)).replace(microsecond=0)
+    with patch("apps.analytics.tasks.timezone.now", return_value=event_time):
+        enqueue_event_log(None, {"event_name": "자정 직전 이벤트"})
+
+    flush_event_log_queue()
+
+    assert EventLog.objects.get(event_name="자정 직전 이벤트").timestamp == event_time
+
+
+@pytest.mark.django_db
+def test_create_event_log_enqueues_when_queue_enabled(fake_redis, authenticated_client, settings):
+    settings.ANALYTICS_EVENT_LOG_QUEUE_ENABLED = True
+    client, user = authenticated_client()
+    url = reverse("analytics:event-log-list-create")
+    response = client.post(url, {"event_name": "비동기 이벤트", "value": "1.50"}, format="json")
+
+    assert response.status_code == 202
+    assert not EventLog.objects.filter(user=user).exists()
+    assert fake_redis.llen(EVENT_LOG_QUEUE_KEY) == 1
+
+    flush_event_log_queue()
+    event_log = EventLog.objects.get(user=user)
+    assert event_log.event_name == "비동기 이벤트"
+    assert str(event_log.value) == "1.50"
+
+
+@pytest.mark.django_db
+def test_collect_event_log_enqueues_anonymous_event(fake_redis, api_client, settings):
+    settings.ANALYTICS_EVENT_LOG_QUEUE_ENABLED = True
+    url = reverse("analytics:event-log-collect")
+    body = {"event_name": "랜딩 조회", "event_type": EventLog.EventType.PAGE_VIEW, "metadata": {"campaign": "summer"}}
+    response = api_client.post(url, body, format="json")
+
+    assert response.status_code == 202
+    assert fake_redis.llen(EVENT_LOG_QUEUE_KEY) == 1
+
+    flush_event_log_queue()
+    event_log = EventLog.objects.get(event_name="랜딩 조회")
+    assert event_log.user is None
+    assert event_log.event_type == EventLog.EventType.PAGE_VIEW
+    assert event_log.metadata == {"campaign": "summer"}
+
+
+@pytest.mark.django_db
+def test_collect_event_log_rejects_invalid_payload(fake_redis, api_client):
+    url = reverse("analytics:event-log-collect")
+
+    assert api_client.post(url, "not-json", content_type="application/json").status_code == 400
+    assert api_client.post(url, {"event_type": EventLog.EventType.CLICK}, format="json").status_code == 400
+    response = api_client.post(url, {"event_name": "잘못된 타입", "event_type": "UNKNOWN"}, format="json")
+    assert response.status_code == 400
+    assert api_client.get(url).status_code == 405
+    assert fake_redis.llen(EVENT_LOG_QUEUE_KEY) == 0
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"event_name": "NUL\u0000이벤트"},
+        {"event_name": "NUL 메타데이터", "metadata": {"items": [{"name": "a\u0000b"}]}},
+        {"event_name": "NUL 메타데이터 키", "metadata": {"ke\u0000y": 1}},
+    ],
+)
+def test_collect_event_log_rejects_null_characters(fake_redis, api_client, settings, body):
+    settings.ANALYTICS_EVENT_LOG_QUEUE_ENABLED = True
+    response = api_client.post(reverse("analytics:event-log-collect"), body, format="json")
+
+    assert response.status_code == 400
+    assert fake_redis.llen(EVENT_LOG_QUEUE_KEY) == 0
+
+
+@pytest.mark.django_db
+def test_collect_event_log_saves_directly_when_queue_disabled(fake_redis, api_client, settings):
+    settings.ANALYTICS_EVENT_LOG_QUEUE_ENABLED = False
+    body = {"event_name": "동기 수집 이벤트", "event_type": EventLog.EventType.PAGE_VIEW}
+    response = api_client.post(reverse("analytics:event-log-collect"), body, format="json")
+
+    assert response.status_code == 201
+    assert fake_redis.llen(EVENT_LOG_QUEUE_KEY) == 0
+    assert EventLog.objects.get(event_name="동기 수집 이벤트").user is None
+
+
+@pytest.mark.django_db
+def test_create_event_log_rejects_null_characters_in_metadata(fake_redis, authenticated_client, settings):
+    settings.ANALYTICS_EVENT_LOG_QUEUE_ENABLED = True
+    client, _ = authenticated_client()
+    body = {"event_name": "NUL 메타데이터", "metadata": {"note": "a\u0000b"}}
+    response = client.post(reverse("analytics:event-log-list-create"), body, format="json")
+
+    assert response.status_code == 400
+    assert fake_redis.llen(EVENT_LOG_QUEUE_KEY) == 0
+
+
+@pytest.mark.django_db
+def test_purge_old_event_logs_deletes_only_expired_events(settings):
+    settings.ANALYTICS_EVENT_LOG_RETENTION_DAYS = 30
+    old_logs = EventLog.objects.bulk_create([EventLog(event_name=f"오래된 이벤트 {i}") for i in range(3)])
+    recent_log = EventLog.objects.create(event_name="최근 이벤트")
+    # timestamp(auto_now_add)를 31일 전으로 강제 수정
+    EventLog.objects.filter(id__in=[log.id for log in old_logs]).update(
+        timestamp=timezone.now() - timezone.timedelta(days=31)
+    )
+
+    deleted = purge_old_event_logs(batch_size=2)
+
+    assert deleted == 3
+    assert list(EventLog.objects.values_list("id", flat=True)) == [recent_log.id]
+
+
+@pytest.mark.django_db
+def test_purge_old_event_logs_is_disabled_without_retention(settings):
+    settings.ANALYTICS_EVENT_LOG_RETENTION_DAYS = None
+    log = EventLog.objects.create(event_name="오래된 이벤트")
+    EventLog.objects.filter(id=log.id).update(timestamp=timezone.now() - timezone.timedelta(days=3650))
+
+    assert purge_old_event_logs() == 0
+    assert EventLog.objects.filter(id=log.id).exists()
+
+
+@pytest.mark.django_db
+def test_refresh_daily_analytics_aggregates_events_and_orders(user_factory, create_order):
+    visitor, buyer = user_factory(), user_factory()
+    EventLog.objects.bulk_create(
+        [
+            EventLog(user=visitor, event_name="메인", event_type=EventLog.EventType.PAGE_VIEW),
+            EventLog(user=visitor, event_name="상품", event_type=EventLog.EventType.PAGE_VIEW),
+            EventLog(user=buyer, event_name="메인", event_type=EventLog.EventType.PAGE_VIEW),
+            EventLog(user=buyer, event_name="구매", event_type=EventLog.EventType.PURCHASE),
+        ]
+    )
+    create_order(user=buyer, total_amount="100.00")
+    create_order(user=buyer, total_amount="50.00")
+    today = timezone.localdate()
+
+    refresh_daily_analytics(today.isoformat())
+    # 같은 날짜를 다시 집계해도 행이 중복 생성되지 않아야 함
+    refresh_daily_analytics(today.isoformat())
+
+    daily_analytics = DailyAnalytics.objects.get(date=today)
+    assert DailyAnalytics.objects.count() == 1
+    assert daily_analytics.page_views == 3
+    assert daily_analytics.unique_visitors == 2
+    assert daily_analytics.conversion_rate == Decimal("50.00")
+    assert daily_analytics.average_order_value == Decimal("75.00")
@@ -1,12 +1,17 @@
 import json
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
+from apps.order.models import Order
+
 from .models import DailyAnalytics, EventLog
+from .serializers import DailyAnalyticsSerializer, EventLogSerializer
 
 
 @pytest.fixture
@@ -57,6 +62,41 @@ class TestDailyAnalytics:
         assert float(analytics["conversion_rate"]) == float(daily_analytics.conversion_rate)
         assert float(analytics["average_order_value"]) == float(daily_analytics.average_order_value)
 
+    def test_serializer_fields_are_copied_per_instance(self, daily_analytics):
+        """캐시된 필드 트리를 사용해도 인스턴스마다 별도의 필드 객체가 바인딩되는지 테스트합니다."""
+        first = DailyAnalyticsSerializer(daily_analytics)
+        second = DailyAnalyticsSerializer(daily_analytics)
+
+        assert first.fields["date"] is not second.fields["date"]
+        assert first.fields["date"].parent is first
+        assert first.data == second.data
+
+    def test_daily_analytics_list_renders_json(self, authenticated_client, daily_analytics):
+        """일별 분석 목록 응답 본문이 JSON으로 렌더링되는지 테스트합니다."""
+        client, _ = authenticated_client(is_staff=True)
+        url = reverse("analytics:daily-analytics-list")
+        response = client.get(url)
+
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("application/json")
+        body = json.loads(response.content)
+        assert body["results"][0]["date"] == daily_analytics.date.isoformat()
+        assert body["results"][0]["conversion_rate"] == "2.50"
+
+    def test_daily_analytics_list_is_cached_until_data_changes(self, authenticated_client, daily_analytics):
+        """일별 분석 목록이 캐시되고, 데이터 저장 시 캐시가 무효화되는지 테스트합니다."""
+        client, _ = authenticated_client(is_staff=True)
+        url = reverse("analytics:daily-analytics-list")
+        assert client.get(url).data["results"][0]["page_views"] == 100
+
+        # signal 없이 변경된 값은 캐시된 응답에 반영되지 않음
+        DailyAnalytics.objects.filter(pk=daily_analytics.pk).update(page_views=200)
+        assert client.get(url).data["results"][0]["page_views"] == 100
+
+        daily_analytics.page_views = 300
+        daily_analytics.save()
+        assert client.get(url).data["results"][0]["page_views"] == 300
+
     def test_get_daily_analytics_list_non_admin(self, authenticated_client, daily_analytics):
         """일반 사용자의 일별 분석 목록 조회 시도를 테스트합니다."""
         client, _ = authenticated_client(is_staff=False)
@@ -80,9 +120,101 @@ class TestDailyAnalytics:
         assert "results" in data
         assert len(data["results"]) >= 1
 
+    def test_export_daily_analytics_csv(self, authenticated_client, daily_analytics):
+        """일별 통계를 날짜 범위 조건과 함께 CSV로 내보내는지 테스트합니다."""
+        client, _ = authenticated_client(is_staff=True)
+        DailyAnalytics.objects.create(date=date.today() - timedelta(days=30), page_views=1)
+        url = reverse("analytics:daily-analytics-export")
+        response = client.get(url, {"start_date": (date.today() - timedelta(days=1)).isoformat()})
+
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/csv")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert lines == [
+            "date,page_views,unique_visitors,conversion_rate,average_order_value",
+            f"{daily_analytics.date.isoformat()},100,50,2.50,75.50",
+        ]
+
+    def test_export_daily_analytics_csv_with_csv_accept_header(self, authenticated_client, daily_analytics):
+        """Accept: text/csv 요청도 CSV로 내보내는지 테스트합니다."""
+        client, _ = authenticated_client(is_staff=True)
+        response = client.get(reverse("analytics:daily-analytics-export"), HTTP_ACCEPT="text/csv")
+
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/csv")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert lines[0] == "date,page_views,unique_visitors,conversion_rate,average_order_value"
+        assert lines[1].startswith(daily_analytics.date.isoformat())
+
+        # 권한 오류도 CSV 협상 결과로 응답
+        client, _ = authenticated_client(is_staff=False)
+        response = client.get(reverse("analytics:daily-analytics-export"), HTTP_ACCEPT="text/csv")
+        assert response.status_code == 403
+        assert response["Content-Type"].startswith("text/csv")
+
+    def test_export_daily_analytics_csv_non_admin(self, authenticated_client):
+        """일반 사용자는 일별 통계를 내보낼 수 없는지 테스트합니다."""
+        client, _ = authenticated_client(is_staff=False)
+        response = client.get(reverse("analytics:daily-analytics-export"))
+        assert response.status_code == 403
+
+    def test_get_daily_analytics_summary(self, authenticated_client, create_order):
+        """일별 통계 요약이 날짜별 주문 수와 평균 평점을 함께 반환하는지 테스트합니다."""
+        from apps.review.models import Review
+
+        client, user = authenticated_client(is_staff=True)
+        order = create_order(user=user)
+        create_order(user=user)
+        Review.objects.create(order=order, reviewer=user, rating=4)
+        # 주문/리뷰의 created_at__date는 TIME_ZONE 기준이므로 localdate 사용
+        daily_analytics = DailyAnalytics.objects.create(date=timezone.localdate(), page_views=10)
+        empty_day = DailyAnalytics.objects.create(date=timezone.localdate() - timedelta(days=1))
+
+        url = reverse("analytics:daily-analytics-summary")
+        response = client.get(url)
+
+        assert response.status_code == 200
+        results = {row["date"]: row for row in response.data["results"]}
+        today = results[daily_analytics.date.isoformat()]
+        assert today["total_orders"] == 2
+        assert today["avg_rating"] == 4.0
+        assert today["page_views"] == daily_analytics.page_views
+        yesterday = results[empty_day.date.isoformat()]
+        assert yesterday["total_orders"] == 0
+        assert yesterday["avg_rating"] is None
+
+    def test_daily_analytics_summary_counts_orders_by_local_day_range(self, authenticated_client, create_order):
+        """주문 수를 현지 시간 [자정, 다음날 자정) 범위로 집계하는지 테스트합니다."""
+        client, user = authenticated_client(is_staff=True)
+        day = timezone.localdate() - timedelta(days=2)
+        midnight = timezone.make_aware(datetime.combine(day, time.min))
+        inside = [create_order(user=user), create_order(user=user)]
+        outside = [create_order(user=user), create_order(user=user)]
+        Order.objects.filter(pk=inside[0].pk).update(created_at=midnight)
+        Order.objects.filter(pk=inside[1].pk).update(created_at=midnight + timedelta(hours=23, minutes=59))
+        Order.objects.filter(pk=outside[0].pk).update(created_at=midnight - timedelta(seconds=1))
+        Order.objects.filter(pk=outside[1].pk).update(created_at=midnight + timedelta(days=1))
+        DailyAnalytics.objects.create(date=day)
+
+        response = client.get(reverse("analytics:daily-analytics-summary"))
+
+        assert response.status_code == 200
+        results = {row["date"]: row for row in response.data["results"]}
+        assert results[day.isoformat()]["total_orders"] == 2
+
 
 @pytest.mark.django_db
 class TestEventLog:
+    def test_event_log_str_does_not_query_user(self, event_log, admin_user, django_assert_num_queries):
+        """EventLog.__str__가 사용자 조회 쿼리 없이 이메일 스냅샷을 사용하는지 테스트합니다."""
+        event_log = EventLog.objects.get(pk=event_log.pk)
+        with django_assert_num_queries(0):
+            text = str(event_log)
+        assert text == (
+            f"[{event_log.event_type}] {event_log.event_name} by {admin_user.email} "
+            f"at {event_log.timestamp.isoformat(timespec='seconds')}"
+        )
+
     def test_create_event_log(self, authenticated_client):
         """이벤트 로그 생성을 테스트합니다."""
         client, user = authenticated_client()
@@ -102,6 +234,31 @@ class TestEventLog:
         assert response.data["data"]["event_type"] == data["event_type"]
         assert response.data["data"]["user"]["id"] == user.id
 
+    def test_batch_create_event_logs(self, authenticated_client):
+        """이벤트 로그 일괄 생성을 테스트합니다."""
+        client, user = authenticated_client()
+        url = reverse("analytics:event-log-batch-create")
+        data = [
+            {"event_name": f"배치 이벤트 {i}", "event_type": EventLog.EventType.CLICK, "metadata": {"index": i}}
+            for i in range(3)
+        ]
+        response = client.post(url, data, format="json")
+
+        assert response.status_code == 201
+        assert response.data["data"]["count"] == 3
+        assert EventLog.objects.filter(user=user, event_type=EventLog.EventType.CLICK).count() == 3
+        assert set(EventLog.objects.filter(user=user).values_list("user_email_snapshot", flat=True)) == {user.email}
+
+    def test_batch_create_event_logs_invalid(self, authenticated_client):
+        """일괄 생성 시 하나라도 유효하지 않으면 아무것도 생성되지 않는지 테스트합니다."""
+        client, user = authenticated_client()
+        url = reverse("analytics:event-log-batch-create")
+        data = [{"event_name": "정상 이벤트"}, {"event_type": "INVALID"}]
+        response = client.post(url, data, format="json")
+
+        assert response.status_code == 400
+        assert not EventLog.objects.filter(user=user).exists()
+
     def test_get_event_logs(self, authenticated_client, event_log):
         """이벤트 로그 목록 조회를 테스트합니다."""
         client, user = authenticated_client(is_staff=True)
@@ -118,6 +275,75 @@ class TestEventLog:
         assert "event_type" in first_event
         assert "user" in first_event
 
+    def test_event_log_list_matches_serializer_format(self, authenticated_client, event_log):
+        """values() 기반 목록 응답이 시리얼라이저와 같은 값 형식을 유지하는지 테스트합니다."""
+        client, _ = authenticated_client(is_staff=True)
+        url = reverse("analytics:event-log-list-create")
+        response = client.get(url)
+
+        assert response.status_code == 200
+        first_event = response.data["results"][0]
+        assert first_event == EventLogSerializer(event_log).data
+        assert first_event["user"] == {
+            "id": event_log.user_id,
+            "email": event_log.user.email,
+            "nickname": event_log.user.nickname,
+        }
+
+    def test_event_log_list_fetches_users_once(self, authenticated_client, user_factory):
+        """목록 조회 시 페이지에 등장한 사용자를 한 번의 쿼리로 가져오는지 테스트합니다."""
+        client, _ = authenticated_client(is_staff=True)
+        users = [user_factory(), user_factory()]
+        EventLog.objects.bulk_create(
+            [EventLog(user=users[i % 2], event_name=f"이벤트 {i}") for i in range(10)] + [EventLog(event_name="익명")]
+        )
+        url = reverse("analytics:event-log-list-create")
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(url)
+
+        assert response.status_code == 200
+        user_queries = [q["sql"] for q in ctx.captured_queries if 'FROM "user"' in q["sql"] and "IN" in q["sql"]]
+        assert len(user_queries) == 1
+        emails = {e["user"]["email"] for e in response.data["results"] if e["user"] is not None}
+        assert emails == {user.email for user in users}
+        assert any(e["user"] is None for e in response.data["results"])
+
+    def test_event_log_list_without_pagination_reads_in_chunks(self, authenticated_client, monkeypatch):
+        """페이지네이션이 없을 때 청크 단위로 읽어도 전체 결과를 순서대로 반환하는지 테스트합니다."""
+        from .views import EventLogListCreateView
+
+        monkeypatch.setattr(EventLogListCreateView, "pagination_class", None)
+        monkeypatch.setattr(EventLogListCreateView, "iterator_chunk_size", 2)
+        client, user = authenticated_client()
+        EventLog.objects.bulk_create([EventLog(user=user, event_name=f"이벤트 {i}") for i in range(5)])
+
+        response = client.get(reverse("analytics:event-log-list-create"))
+
+        assert response.status_code == 200
+        assert len(response.data) == 5
+        assert all(e["user"]["id"] == user.id for e in response.data)
+        timestamps = [e["timestamp"] for e in response.data]
+        assert timestamps == sorted(timestamps, reverse=True)
+
+    def test_event_logs_cursor_pagination(self, authenticated_client):
+        """이벤트 로그 목록이 커서 기반으로 중복/누락 없이 페이지를 넘기는지 테스트합니다."""
+        client, user = authenticated_client()
+        EventLog.objects.bulk_create([EventLog(user=user, event_name=f"이벤트 {i}") for i in range(5)])
+        url = reverse("analytics:event-log-list-create")
+
+        seen_ids = []
+        next_url = f"{url}?page_size=2"
+        while next_url:
+            response = client.get(next_url)
+            assert response.status_code == 200
+            assert "count" not in response.data
+            seen_ids.extend(event["id"] for event in response.data["results"])
+            next_url = response.data["next"]
+
+        assert len(seen_ids) == 5
+        assert seen_ids == sorted(seen_ids, reverse=True)
+
     def test_filter_event_logs(self, authenticated_client, event_log):
         """이벤트 로그 필터링을 테스트합니다."""
         client, _ = authenticated_client(is_staff=True)
@@ -132,6 +358,52 @@ class TestEventLog:
         assert len(data["results"]) >= 1
         assert all(e["event_type"] == EventLog.EventType.PAGE_VIEW for e in data["results"])
 
+    def test_filter_event_logs_by_timestamp_range(self, authenticated_client, event_log):
+        """start_timestamp/end_timestamp 범위로 이벤트 로그를 필터링하는지 테스트합니다."""
+        client, _ = authenticated_client(is_staff=True)
+        url = reverse("analytics:event-log-list-create")
+        old_event = EventLog.objects.create(event_name="지난 이벤트")
+        EventLog.objects.filter(pk=old_event.pk).update(timestamp=timezone.now() - timedelta(days=10))
+
+        start = (timezone.now() - timedelta(days=1)).isoformat()
+        response = client.get(url, {"start_timestamp": start})
+        assert response.status_code == 200
+        assert [e["id"] for e in response.data["results"]] == [event_log.id]
+
+        end = (timezone.now() - timedelta(days=5)).isoformat()
+        response = client.get(url, {"end_timestamp": end})
+        assert [e["id"] for e in response.data["results"]] == [old_event.id]
+
+        response = client.get(url, {"start_timestamp": "not-a-date"})
+        assert response.status_code == 400
+
+    def test_filter_event_logs_by_large_object_id(self, authenticated_client, event_log):
+        """32비트 범위를 넘는 object_id로 저장/필터링되는지 테스트합니다."""
+        client, _ = authenticated_client(is_staff=True)
+        url = reverse("analytics:event-log-list-create")
+        big_event = EventLog.objects.create(event_name="대용량 ID", object_type="order", object_id=2**40)
+
+        response = client.get(url, {"object_type": "order", "object_id": 2**40})
+        assert response.status_code == 200
+        assert [e["id"] for e in response.data["results"]] == [big_event.id]
+
+    def test_filter_event_logs_by_campaign(self, authenticated_client, event_log):
+        """metadata에서 추출된 campaign/utm_source 컬럼으로 필터링되는지 테스트합니다."""
+        client, _ = authenticated_client(is_staff=True)
+        url = reverse("analytics:event-log-list-create")
+        campaign_event = EventLog.objects.create(
+            event_name="캠페인 유입", metadata={"campaign": "summer", "utm_source": "newsletter"}
+        )
+        campaign_event.refresh_from_db()
+        assert campaign_event.campaign == "summer"
+
+        response = client.get(url, {"campaign": "summer"})
+        assert response.status_code == 200
+        assert [e["id"] for e in response.data["results"]] == [campaign_event.id]
+
+        response = client.get(url, {"utm_source": "newsletter"})
+        assert [e["id"] for e in response.data["results"]] == [campaign_event.id]
+
     def test_search_event_logs(self, authenticated_client, event_log):
         """이벤트 로그 검색을 테스트합니다."""
         client, _ = authenticated_client(is_staff=True)
@@ -145,6 +417,36 @@ class TestEventLog:
         assert "results" in data
         assert len(data["results"]) >= 1
 
+    def test_filter_event_logs_by_metadata(self, authenticated_client, event_log):
+        """metadata_contains 파라미터로 이벤트 로그를 필터링하는지 테스트합니다."""
+        client, _ = authenticated_client(is_staff=True)
+        url = reverse("analytics:event-log-list-create")
+
+        response = client.get(url, {"metadata_contains": json.dumps({"test": "data"})})
+        assert response.status_code == 200
+        assert [e["id"] for e in response.data["results"]] == [event_log.id]
+
+        response = client.get(url, {"metadata_contains": json.dumps({"test": "other"})})
+        assert response.status_code == 200
+        assert response.data["results"] == []
+
+        response = client.get(url, {"metadata_contains": "not-json"})
+        assert response.status_code == 400
+
+    def test_filter_event_logs_by_metadata_rejects_lookup_keys(self, authenticated_client, event_log):
+        """metadata_contains 키로 조회 경로나 lookup을 조합할 수 없는지 테스트합니다."""
+        client, _ = authenticated_client(is_staff=True)
+        url = reverse("analytics:event-log-list-create")
+
+        for key in ("test__regex", "test__nested__path", "_test", "te-st", ""):
+            response = client.get(url, {"metadata_contains": json.dumps({key: "data"})})
+            assert response.status_code == 400
+
+        # 식별자 형식의 lookup 이름도 lookup이 아닌 JSON 키로만 비교
+        response = client.get(url, {"metadata_contains": json.dumps({"regex": ".*"})})
+        assert response.status_code == 200
+        assert response.data["results"] == []
+
     def test_non_admin_user_sees_only_own_events(self, authenticated_client, event_log):
         """일반 사용자가 자신의 이벤트만 볼 수 있는지 테스트합니다."""
         client, user = authenticated_client(is_staff=False)
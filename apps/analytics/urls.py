@@ -1,6 +1,14 @@
 from django.urls import path
 
-from .views import DailyAnalyticsListView, EventLogDetailView, EventLogListCreateView
+from .views import (
+    AnalyticsSummaryView,
+    DailyAnalyticsExportView,
+    DailyAnalyticsListView,
+    EventLogBatchCreateView,
+    EventLogDetailView,
+    EventLogListCreateView,
+    collect_event_log,
+)
 
 app_name = "analytics"
 
@@ -10,6 +18,10 @@ urlpatterns = [
         DailyAnalyticsListView.as_view(),
         name="daily-analytics-list",
     ),
+    path("daily-analytics/export/", DailyAnalyticsExportView.as_view(), name="daily-analytics-export"),
+    path("daily-analytics/summary/", AnalyticsSummaryView.as_view(), name="daily-analytics-summary"),
     path("event-logs/", EventLogListCreateView.as_view(), name="event-log-list-create"),
+    path("event-logs/collect/", collect_event_log, name="event-log-collect"),
+    path("event-logs/batch/", EventLogBatchCreateView.as_view(), name="event-log-batch-create"),
     path("event-logs/<int:pk>/", EventLogDetailView.as_view(), name="event-log-detail"),
 ]
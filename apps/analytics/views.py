@@ -1,26 +1,90 @@
-from django.db.models import Avg, Count, F
+import csv
+import json
+import re
+from itertools import islice
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connection
+from django.db.models import DateTimeField, F, FloatField, Func, IntegerField, OuterRef, Subquery, Value
+from django.db.models.fields.json import KeyTransform
+from django.db.models.functions import Coalesce
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
-from rest_framework import filters, generics, permissions
+from rest_framework import filters, generics, permissions, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.response import Response
 
+from apps.order.models import Order
+from apps.review.models import Review
 from apps.user.permissions_role import IsAdmin
+from utils.cache_helpers import get_daily_analytics_cache_version
+from utils.cache_keys import DAILY_ANALYTICS_LIST_CACHE_TIMEOUT, get_daily_analytics_list_cache_key
+from utils.renderers import CSVRenderer, ORJSONRenderer
 from utils.response import BaseResponseMixin
+from utils.views import SwaggerFakeViewMixin
 
+from .filters import EventLogFilter
 from .models import DailyAnalytics, EventLog
-from .serializers import DailyAnalyticsSerializer, EventLogSerializer
+from .pagination import EventLogCursorPagination
+from .serializers import (
+    EVENT_LOG_DETAIL_FIELDS,
+    EVENT_LOG_LIST_VALUES,
+    DailyAnalyticsSerializer,
+    DailyAnalyticsSummarySerializer,
+    EventLogSerializer,
+    event_log_values_to_representation,
+    get_event_log_users,
+    has_null_characters,
+)
+from .tasks import enqueue_event_log
 
 
-class DailyAnalyticsListView(generics.ListAPIView):
+class LocalDayStart(Func):
+    """
+    날짜(DateField) 값에 days일을 더한 날의 현지 시간(TIME_ZONE) 자정을 datetime으로 반환합니다.
+    created_at__date처럼 컬럼을 날짜로 변환하지 않고 created_at 범위 비교로 인덱스를 사용하기 위함
+    """
+
+    output_field = DateTimeField()
+
+    def __init__(self, expression, days=0):
+        self.days = days
+        super().__init__(expression)
+
+    def as_postgresql(self, compiler, connection):
+        sql, params = compiler.compile(self.source_expressions[0])
+        return f"(({sql} + %s)::timestamp AT TIME ZONE %s)", (*params, self.days, timezone.get_current_timezone_name())
+
+    def as_sqlite(self, compiler, connection):
+        # SQLite에는 시간대 정보가 없으므로 현재 UTC 오프셋만큼 이동 (datetime은 UTC 문자열로 저장됨)
+        sql, params = compiler.compile(self.source_expressions[0])
+        offset_minutes = int(timezone.localtime().utcoffset().total_seconds() // 60)
+        return f"datetime({sql}, %s, %s)", (*params, f"{self.days:+d} days", f"{-offset_minutes:+d} minutes")
+
+
+# metadata_contains 필터에 허용하는 키 형식: 영문자로 시작, 밑줄은 단어 사이 하나만 (__ 조회 경로 조합 방지)
+METADATA_KEY_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9]*(?:_[A-Za-z0-9]+)*")
+
+
+class DailyAnalyticsListView(SwaggerFakeViewMixin, generics.ListAPIView):
     queryset = DailyAnalytics.objects.all()
     serializer_class = DailyAnalyticsSerializer
     permission_classes = [IsAdmin]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ["date"]
     ordering_fields = ["date"]
 
     def get_queryset(self):
-        if getattr(self, "swagger_fake_view", False):
+        if self.swagger_fake_view:
             return DailyAnalytics.objects.none()
         queryset = super().get_queryset()
         start_date = self.request.query_params.get("start_date")
@@ -32,6 +96,15 @@ class DailyAnalyticsListView(generics.ListAPIView):
             queryset = queryset.filter(date__lte=end_date)
         return queryset
 
+    def list(self, request, *args, **kwargs):
+        # 집계가 끝난 일별 통계는 거의 바뀌지 않으므로 조회 조건별로 응답 데이터를 캐시
+        cache_key = get_daily_analytics_list_cache_key(get_daily_analytics_cache_version(), request.query_params.dict())
+        data = cache.get(cache_key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(cache_key, data, DAILY_ANALYTICS_LIST_CACHE_TIMEOUT)
+        return Response(data)
+
     @swagger_auto_schema(
         operation_summary="일별 통계 목록 조회",
         operation_description="관리자 권한으로 일별 통계 데이터 목록을 조회합니다. 날짜별 필터링이 가능합니다.",
@@ -47,37 +120,102 @@ class DailyAnalyticsListView(generics.ListAPIView):
         return super().get(request, *args, **kwargs)
 
 
-class EventLogListCreateView(BaseResponseMixin, generics.ListCreateAPIView):
+DAILY_ANALYTICS_EXPORT_COLUMNS = ("date", "page_views", "unique_visitors", "conversion_rate", "average_order_value")
+DAILY_ANALYTICS_EXPORT_CHUNK_SIZE = 5000
+
+
+class _Echo:
+    """csv.writer가 쓴 한 줄을 그대로 반환하는 의사 버퍼 (StreamingHttpResponse용)"""
+
+    def write(self, value):
+        return value
+
+
+class DailyAnalyticsExportView(DailyAnalyticsListView):
+    # 권한/날짜 범위/정렬 조건은 목록 조회와 동일하게 적용
+    pagination_class = None
+    # Accept: text/csv 요청이 406으로 거절되지 않도록 CSV 렌더러로 협상 (오류 응답은 JSON이 기본)
+    renderer_classes = [ORJSONRenderer, CSVRenderer]
+
+    @swagger_auto_schema(
+        operation_summary="일별 통계 CSV 내보내기",
+        operation_description="일별 통계를 CSV로 스트리밍합니다. 시리얼라이저 없이 values_list를 청크 단위로 읽어 메모리 사용량이 행 수와 무관합니다.",
+        tags=["Analytics"],
+        responses={
+            200: openapi.Response("CSV 파일"),
+            401: "인증되지 않은 사용자입니다.",
+            403: "접근 권한이 없습니다.",
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        """일별 통계 CSV 내보내기"""
+        rows = (
+            self.filter_queryset(self.get_queryset())
+            .values_list(*DAILY_ANALYTICS_EXPORT_COLUMNS)
+            .iterator(chunk_size=DAILY_ANALYTICS_EXPORT_CHUNK_SIZE)
+        )
+        writer = csv.writer(_Echo())
+
+        def stream():
+            yield writer.writerow(DAILY_ANALYTICS_EXPORT_COLUMNS)
+            for row in rows:
+                yield writer.writerow(row)
+
+        response = StreamingHttpResponse(stream(), content_type="text/csv; charset=utf-8")
+        response["Content-Disposition"] = 'attachment; filename="daily_analytics.csv"'
+        return response
+
+
+class EventLogListCreateView(SwaggerFakeViewMixin, BaseResponseMixin, generics.ListCreateAPIView):
     serializer_class = EventLogSerializer
     permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    pagination_class = EventLogCursorPagination
     filter_backends = [
         DjangoFilterBackend,
         filters.SearchFilter,
         filters.OrderingFilter,
     ]
-    filterset_fields = ["event_type", "user", "object_type", "object_id"]
-    search_fields = ["event_name", "metadata"]
-    ordering_fields = ["timestamp", "event_type", "user"]
+    filterset_class = EventLogFilter
+    # metadata(JSON) ILIKE 검색은 인덱스를 탈 수 없어 제외 → metadata_contains 파라미터 사용
+    search_fields = ["event_name"]
+    # 커서 페이지네이션은 (거의) 유일한 정렬 키가 필요하므로 timestamp 정렬만 허용
+    ordering_fields = ["timestamp"]
+    iterator_chunk_size = 200
 
     def get_queryset(self):
-        if getattr(self, "swagger_fake_view", False):
+        if self.swagger_fake_view:
             return EventLog.objects.none()
-        qs = EventLog.objects.select_related("user").only("id", "user", "event_type", "timestamp")
-        if self.request.user.is_staff:
-            queryset = qs
-        else:
-            queryset = qs.filter(user=self.request.user)
+        queryset = EventLog.objects.all()
+        if not self.request.user.is_staff:
+            queryset = queryset.filter(user=self.request.user)
 
-        start_timestamp = self.request.query_params.get("start_timestamp")
-        end_timestamp = self.request.query_params.get("end_timestamp")
-
-        if start_timestamp:
-            queryset = queryset.filter(timestamp__gte=start_timestamp)
-        if end_timestamp:
-            queryset = queryset.filter(timestamp__lte=end_timestamp)
+        metadata_contains = self.request.query_params.get("metadata_contains")
+        if metadata_contains:
+            queryset = self.filter_metadata_contains(queryset, metadata_contains)
 
         return queryset
 
+    def filter_metadata_contains(self, queryset, raw_value):
+        """?metadata_contains={"key": "value"} 조건으로 metadata를 필터링합니다."""
+        try:
+            metadata = json.loads(raw_value)
+        except ValueError:
+            raise ValidationError({"metadata_contains": "JSON 객체 형식이어야 합니다."})
+        if not isinstance(metadata, dict):
+            raise ValidationError({"metadata_contains": "JSON 객체 형식이어야 합니다."})
+        if not all(METADATA_KEY_PATTERN.fullmatch(key) for key in metadata):
+            raise ValidationError(
+                {"metadata_contains": "키는 영문자로 시작하고 영문자, 숫자, 단일 밑줄(_)만 사용할 수 있습니다."}
+            )
+        if connection.features.supports_json_field_contains:
+            # PostgreSQL: jsonb @> 연산자로 처리되어 GIN 인덱스를 사용할 수 있음
+            return queryset.filter(metadata__contains=metadata)
+        # 키를 metadata__{key} 조회 경로로 조합하면 regex/contains 같은 lookup으로 해석될 수 있으므로
+        # KeyTransform으로 항상 JSON 키 하나로만 취급
+        aliases = {f"_metadata_{index}": KeyTransform(key, "metadata") for index, key in enumerate(metadata)}
+        return queryset.alias(**aliases).filter(**dict(zip(aliases, metadata.values())))
+
     @swagger_auto_schema(
         operation_summary="이벤트 로그 목록 조회",
         operation_description="이벤트 로그 목록을 조회합니다. 관리자는 전체, 일반 사용자는 본인 이벤트만 조회할 수 있습니다.",
@@ -97,6 +235,7 @@ class EventLogListCreateView(BaseResponseMixin, generics.ListCreateAPIView):
         tags=["Analytics"],
         responses={
             201: openapi.Response("이벤트 로그가 정상적으로 생성되었습니다."),
+            202: openapi.Response("이벤트 로그가 큐에 접수되었습니다. (비동기 저장 사용 시)"),
             400: "요청 데이터가 올바르지 않습니다.",
             401: "인증되지 않은 사용자입니다.",
         },
@@ -105,6 +244,28 @@ class EventLogListCreateView(BaseResponseMixin, generics.ListCreateAPIView):
         """이벤트 로그 생성"""
         return super().post(request, *args, **kwargs)
 
+    def list(self, request, *args, **kwargs):
+        # 목록은 values() 결과를 그대로 dict로 변환해 모델/시리얼라이저 생성 비용을 생략
+        queryset = self.filter_queryset(self.get_queryset()).values(*EVENT_LOG_LIST_VALUES)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.rows_to_representation(page))
+
+        # 페이지네이션이 없으면 전체 결과를 한 번에 가져오지 않고 청크 단위(서버 사이드 커서)로 변환
+        data = []
+        rows = queryset.iterator(chunk_size=self.iterator_chunk_size)
+        while chunk := list(islice(rows, self.iterator_chunk_size)):
+            data.extend(self.rows_to_representation(chunk))
+        return Response(data)
+
+    def rows_to_representation(self, rows):
+        """values() 행 목록을 응답 형태로 제자리 변환합니다. (원본 행과 변환 결과를 동시에 들고 있지 않음)"""
+        # 행마다 사용자 컬럼을 JOIN으로 반복해 싣지 않고, 등장한 사용자만 한 번에 조회
+        users = get_event_log_users(rows)
+        for index, row in enumerate(rows):
+            rows[index] = event_log_values_to_representation(row, users)
+        return rows
+
     def perform_create(self, serializer):
         if self.request.user.is_authenticated:
             serializer.save(user=self.request.user)
@@ -112,23 +273,106 @@ class EventLogListCreateView(BaseResponseMixin, generics.ListCreateAPIView):
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
+        if settings.ANALYTICS_EVENT_LOG_QUEUE_ENABLED:
+            # 요청 경로에서는 큐에만 적재하고, DB 저장은 flush_event_log_queue 태스크가 일괄 처리
+            enqueue_event_log(request.user, serializer.validated_data)
+            return self.success(message="이벤트 로그가 접수되었습니다.", code=202, status=202)
         self.perform_create(serializer)
         data = serializer.data
-        self.logger.info(f"EventLog created by {request.user.email if request.user.is_authenticated else 'anonymous'}")
+        self.logger.info("EventLog created by %s", request.user.email)
         return self.success(data=data, message="이벤트 로그가 생성되었습니다.", status=201)
 
 
-class EventLogDetailView(generics.RetrieveAPIView):
+class EventLogBatchCreateView(BaseResponseMixin, generics.GenericAPIView):
+    serializer_class = EventLogSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    max_batch_size = 1000
+
+    @swagger_auto_schema(
+        operation_summary="이벤트 로그 일괄 생성",
+        operation_description="이벤트 로그 배열을 받아 한 번의 INSERT로 일괄 생성합니다. (최대 1000건)",
+        tags=["Analytics"],
+        request_body=EventLogSerializer(many=True),
+        responses={
+            201: openapi.Response("이벤트 로그가 정상적으로 일괄 생성되었습니다."),
+            400: "요청 데이터가 올바르지 않습니다.",
+            401: "인증되지 않은 사용자입니다.",
+        },
+    )
+    def post(self, request, *args, **kwargs):
+        """이벤트 로그 일괄 생성"""
+        serializer = self.get_serializer(data=request.data, many=True, max_length=self.max_batch_size)
+        serializer.is_valid(raise_exception=True)
+        event_logs = EventLog.objects.bulk_create(
+            [
+                EventLog(user=request.user, user_email_snapshot=request.user.email, **data)
+                for data in serializer.validated_data
+            ],
+            batch_size=self.max_batch_size,
+        )
+        self.logger.info("%s EventLogs created by %s", len(event_logs), request.user.email)
+        return self.success(
+            data={"count": len(event_logs)},
+            message="이벤트 로그가 일괄 생성되었습니다.",
+            status=status.HTTP_201_CREATED,
+        )
+
+
+COLLECT_EVENT_FIELDS = ("event_name", "event_type", "value", "object_id", "object_type", "metadata")
+COLLECT_MAX_BODY_SIZE = 16 * 1024  # 16KB
+
+
+@csrf_exempt
+@require_POST
+def collect_event_log(request):
+    """
+    익명 이벤트(페이지 조회 등)를 DRF 인증/권한/시리얼라이저 파이프라인 없이 저장합니다.
+
+    모델 필드의 clean()과 NUL 문자 검사로 최소한의 검증만 합니다. ANALYTICS_EVENT_LOG_QUEUE_ENABLED이면
+    Redis 큐에 적재하고 202를 반환하며(DB 저장은 flush_event_log_queue가 일괄 처리), 아니면 바로 저장하고 201을 반환합니다.
+    """
+    if len(request.body) > COLLECT_MAX_BODY_SIZE:
+        return JsonResponse({"success": False, "code": 413, "message": "요청 본문이 너무 큽니다."}, status=413)
+    try:
+        payload = json.loads(request.body)
+    except ValueError:
+        payload = None
+    if not isinstance(payload, dict) or "event_name" not in payload:
+        return JsonResponse({"success": False, "code": 400, "message": "요청 데이터가 올바르지 않습니다."}, status=400)
+
+    data = {}
+    try:
+        for name in COLLECT_EVENT_FIELDS:
+            if name in payload:
+                # 모델 CharField/JSONField의 clean()은 NUL을 거부하지 않지만 PostgreSQL은 저장하지 못함
+                if has_null_characters(payload[name]):
+                    raise DjangoValidationError("NUL 문자는 사용할 수 없습니다.")
+                data[name] = EventLog._meta.get_field(name).clean(payload[name], None)
+    except DjangoValidationError as e:
+        return JsonResponse(
+            {"success": False, "code": 400, "message": "요청 데이터가 올바르지 않습니다.", "data": {name: e.messages}},
+            status=400,
+        )
+
+    if not settings.ANALYTICS_EVENT_LOG_QUEUE_ENABLED:
+        EventLog.objects.create(**data)
+        return HttpResponse(status=201)
+    enqueue_event_log(None, data)
+    return HttpResponse(status=202)
+
+
+class EventLogDetailView(SwaggerFakeViewMixin, generics.RetrieveAPIView):
     queryset = EventLog.objects.all()
     serializer_class = EventLogSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        if getattr(self, "swagger_fake_view", False):
+        if self.swagger_fake_view:
             return EventLog.objects.none()
+        queryset = EventLog.objects.select_related("user").only(*EVENT_LOG_DETAIL_FIELDS)
         if self.request.user.is_staff:
-            return EventLog.objects.all()
-        return EventLog.objects.filter(user=self.request.user)
+            return queryset
+        return queryset.filter(user=self.request.user)
 
     @swagger_auto_schema(
         operation_summary="이벤트 로그 상세 조회",
@@ -158,40 +402,52 @@ class AnalyticsDetailView(generics.RetrieveAPIView):
     lookup_field = "month"  # 월로 조회
 
 
-class AnalyticsSummaryView(BaseResponseMixin, generics.ListAPIView):
-    serializer_class = DailyAnalyticsSerializer
-    permission_classes = [IsAdmin]
-
-    def get_queryset(self):
-        # annotate/only/values 집계/필드최적화 예시
-        qs = super().get_queryset()
-        qs = qs.annotate(
-            total_orders=Count("order"),
-            avg_rating=Avg("review__rating"),
-        ).only("user", "created_at")
-        return qs
-
-
-class AnalyticsAdminView(generics.ListAPIView):
+class AnalyticsSummaryView(SwaggerFakeViewMixin, BaseResponseMixin, generics.ListAPIView):
     queryset = DailyAnalytics.objects.all()
-    serializer_class = DailyAnalyticsSerializer
+    serializer_class = DailyAnalyticsSummarySerializer
     permission_classes = [IsAdmin]
-    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
-    filterset_fields = ["date"]
-    ordering_fields = ["date"]
 
     def get_queryset(self):
-        if getattr(self, "swagger_fake_view", False):
+        if self.swagger_fake_view:
             return DailyAnalytics.objects.none()
-        queryset = super().get_queryset()
-        start_date = self.request.query_params.get("start_date")
-        end_date = self.request.query_params.get("end_date")
+        # 역참조 두 개를 JOIN+집계하면 행이 곱해지므로, 날짜별 상관 서브쿼리로 각각 집계
+        # created_at__date 대신 [당일 자정, 다음날 자정) 범위로 비교해 created_at 인덱스를 사용
+        day_range = {
+            "created_at__gte": LocalDayStart(OuterRef("date")),
+            "created_at__lt": LocalDayStart(OuterRef("date"), days=1),
+        }
+        orders = Order.objects.filter(**day_range).order_by().values(count=Func(F("id"), function="COUNT"))
+        ratings = (
+            Review.objects.filter(**day_range)
+            .order_by()
+            .values(avg=Func(F("rating"), function="AVG", output_field=FloatField()))
+        )
+        return (
+            super()
+            .get_queryset()
+            .annotate(
+                total_orders=Coalesce(Subquery(orders, output_field=IntegerField()), Value(0)),
+                avg_rating=Subquery(ratings),
+            )
+        )
 
-        if start_date:
-            queryset = queryset.filter(date__gte=start_date)
-        if end_date:
-            queryset = queryset.filter(date__lte=end_date)
-        return queryset
+    @swagger_auto_schema(
+        operation_summary="일별 통계 요약 조회",
+        operation_description="관리자 권한으로 일별 통계와 날짜별 주문 수/평균 평점을 함께 조회합니다.",
+        tags=["Analytics"],
+        responses={
+            200: openapi.Response("일별 통계 요약을 정상적으로 조회하였습니다."),
+            401: "인증되지 않은 사용자입니다.",
+            403: "접근 권한이 없습니다.",
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        """일별 통계 요약 조회"""
+        return super().get(request, *args, **kwargs)
+
+
+class AnalyticsAdminView(DailyAnalyticsListView):
+    # 권한/필터/날짜 범위 조회는 DailyAnalyticsListView와 동일
 
     @swagger_auto_schema(
         tags=["Analytics"],
@@ -199,9 +455,8 @@ class AnalyticsAdminView(generics.ListAPIView):
         operation_description="관리자 권한(role=admin)만 접근 가능.",
         responses={200: "성공"},
     )
-    def get(self, request):
-        # 관리자 통계 조회 로직
-        pass
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
 
 
 # 운영 자동화/모니터링 예시:
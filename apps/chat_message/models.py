@@ -28,6 +28,11 @@ class ChatMessage(models.Model):
         ordering = ["timestamp"]
         verbose_name = "Chat Message"
         verbose_name_plural = "Chat Messages"
+        # 채팅방별 시간순 목록과 발신자 필터를 정렬 없이 인덱스 범위 스캔으로 처리
+        indexes = [
+            models.Index(fields=["chat_room", "timestamp"], name="chatmsg_room_ts_idx"),
+            models.Index(fields=["sender", "-timestamp"], name="chatmsg_sender_ts_idx"),
+        ]
 
     def __str__(self):
         return f"Message from {self.sender.nickname} in {self.chat_room.name}"
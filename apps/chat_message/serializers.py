@@ -1,13 +1,18 @@
 from rest_framework import serializers
 
-from apps.user.serializers import UserSerializer  # 사용자 시리얼라이저가 필요하다고 가정
+from apps.image.image_utils import convert_to_webp
+from apps.user.serializers import MemoizedUserSerializer, UserSerializer  # 사용자 시리얼라이저가 필요하다고 가정
+from utils.serializers import DynamicFieldsSerializerMixin
 
 from .models import ChatMessage
+from .uploads import is_upload_key
 
 
-class ChatMessageSerializer(serializers.ModelSerializer):
-    sender = UserSerializer(read_only=True)
-    read_by = UserSerializer(many=True, read_only=True)
+class ChatMessageSerializer(DynamicFieldsSerializerMixin, serializers.ModelSerializer):
+    sender = MemoizedUserSerializer(read_only=True)
+    # 읽음 상태는 행마다 M2M을 순회하지 않고 쿼리셋 주석(with_read_state)에서 읽음
+    is_read = serializers.BooleanField(source="is_read_by_user", read_only=True)
+    read_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = ChatMessage
@@ -21,25 +26,47 @@ class ChatMessageSerializer(serializers.ModelSerializer):
             "image",
             "timestamp",
             "is_read",
-            "read_by",
+            "read_count",
         )
-        read_only_fields = ("sender", "timestamp", "is_read", "read_by")
+        read_only_fields = ("sender", "timestamp")
+
+
+class ChatMessageDetailSerializer(ChatMessageSerializer):
+    # 뷰에서 Prefetch(to_attr="read_by_preview")로 앞의 일부만 로드한 읽은 사용자 목록
+    read_by = UserSerializer(source="read_by_preview", many=True, read_only=True)
+
+    class Meta(ChatMessageSerializer.Meta):
+        fields = (*ChatMessageSerializer.Meta.fields, "read_by")
 
 
 class ChatMessageCreateSerializer(serializers.ModelSerializer):
-    sender = UserSerializer(read_only=True)
-    read_by = UserSerializer(many=True, read_only=True)
-    is_read = serializers.BooleanField(read_only=True)
+    """입력 검증 전용. 생성 응답은 뷰에서 ChatMessageSerializer로 한 번만 렌더링합니다."""
+
+    # 청크 업로드 엔드포인트(messages/uploads/)가 반환한 키. 파일을 다시 보내지 않고 저장된 파일을 참조
+    upload_key = serializers.CharField(write_only=True, required=False)
 
     class Meta:
         model = ChatMessage
-        fields = ("id", "chat_room", "message_type", "content", "file", "image", "sender", "is_read", "read_by")
+        fields = ("id", "chat_room", "message_type", "content", "file", "image", "upload_key")
 
     def validate(self, data):
+        upload_key = data.pop("upload_key", None)
+        if upload_key:
+            # 업로드한 사용자가 같은 채팅방에 보내는 메시지에서만 사용 가능
+            user_id = self.context["request"].user.pk
+            if not is_upload_key(upload_key, data["message_type"], user_id, data["chat_room"].pk):
+                raise serializers.ValidationError({"upload_key": "Invalid upload key."})
+            data[data["message_type"]] = upload_key
         if data["message_type"] == "text" and not data.get("content"):
             raise serializers.ValidationError("Text messages must have content.")
         if data["message_type"] in ["image", "file"] and not (data.get("image") or data.get("file")):
             raise serializers.ValidationError(f"{data['message_type']} messages must have a file or image.")
+        # 직접 업로드된 이미지는 리사이즈 후 WebP로 저장 (upload_key로 참조한 파일은 이미 저장되어 있으므로 제외)
+        if data["message_type"] == "image" and hasattr(data.get("image"), "read"):
+            try:
+                data["image"] = convert_to_webp(data["image"])
+            except OSError as e:
+                raise serializers.ValidationError({"image": "Failed to process image."}) from e
         return data
 
 
@@ -47,3 +74,15 @@ class ChatMessageUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = ChatMessage
         fields = ("content",)
+
+    def to_representation(self, instance):
+        # 수정 응답은 상세 조회와 같은 형태로, 뷰에서 이미 로드한(select/prefetch/주석) instance를 그대로 사용
+        return ChatMessageDetailSerializer(instance, context=self.context).data
+
+
+class ChatMessageChunkUploadSerializer(serializers.Serializer):
+    """청크 업로드 요청. 청크 범위는 Content-Range 헤더(bytes start-end/total)로 전달합니다."""
+
+    file = serializers.FileField()
+    message_type = serializers.ChoiceField(choices=("file", "image"))
+    upload_id = serializers.RegexField(r"^[0-9a-f]{32}$", required=False)
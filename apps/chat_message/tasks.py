@@ -0,0 +1,9 @@
+from celery import shared_task
+
+from .uploads import purge_expired_upload_parts
+
+
+@shared_task
+def purge_expired_chat_uploads():
+    """만료된 채팅 파일 청크 업로드의 청크 파일을 삭제합니다. (예약 작업)"""
+    return purge_expired_upload_parts()
@@ -1,7 +1,10 @@
+import hashlib
 import io
+import os
 from datetime import timedelta
 
 import pytest
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.utils import timezone
 from PIL import Image
@@ -9,7 +12,10 @@ from rest_framework import status
 from rest_framework.test import APIClient
 
 from apps.chat_message.models import ChatMessage
-from apps.chat_room.models import ChatRoom
+from apps.chat_message.tasks import purge_expired_chat_uploads
+from apps.chat_message.uploads import UPLOAD_MAX_ACTIVE_PER_USER
+from apps.chat_room.models import ChatRoom, ChatRoomParticipant
+from utils.cache_keys import CHAT_UPLOAD_CACHE_TIMEOUT, get_chat_upload_cache_key
 
 
 @pytest.fixture
@@ -18,6 +24,20 @@ def chat_room(db, create_user):
     return ChatRoom.objects.create(name="Test Chat Room", created_by=user)
 
 
+@pytest.fixture
+def chunk_uploader(api_client, create_user, chat_room, settings, tmp_path):
+    """채팅방 참여자로 인증한 사용자를 만들어 반환하는 함수 (업로드 파일은 tmp_path에 저장)"""
+    settings.MEDIA_ROOT = tmp_path
+
+    def make(nickname):
+        user = create_user(nickname=nickname)
+        ChatRoomParticipant.objects.create(chat_room=chat_room, user=user)
+        api_client.force_authenticate(user=user)
+        return user
+
+    return make
+
+
 @pytest.fixture
 def image_file():
     # Create a test image file
@@ -41,6 +61,8 @@ class TestChatMessageAPI:
         assert response.data["data"]["content"] == "Hello, world!"
         assert response.data["data"]["sender"]["id"] == user.id
         assert not response.data["data"]["is_read"]
+        assert response.data["data"]["read_count"] == 0
+        assert response.data["data"]["timestamp"] is not None
 
     def test_create_text_message_without_content(self, api_client: APIClient, create_user, chat_room):
         user = create_user(nickname="msguser2")
@@ -63,7 +85,228 @@ class TestChatMessageAPI:
 
         assert response.status_code == status.HTTP_201_CREATED
         assert response.data["data"]["message_type"] == "image"
-        assert response.data["data"]["image"] is not None
+        assert response.data["data"]["image"].endswith(".webp")
+
+    def test_create_image_message_resizes_large_image(
+        self, api_client: APIClient, create_user, chat_room, settings, tmp_path
+    ):
+        settings.MEDIA_ROOT = tmp_path
+        user = create_user(nickname="imguser2")
+        api_client.force_authenticate(user=user)
+        file = io.BytesIO()
+        Image.new("RGBA", (2048, 1024), (255, 0, 0, 128)).save(file, "PNG")
+        image = SimpleUploadedFile("large.png", file.getvalue(), content_type="image/png")
+        data = {"chat_room": chat_room.id, "message_type": "image", "image": image}
+
+        response = api_client.post(f"/chat-rooms/{chat_room.id}/messages/", data=data, format="multipart")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        message = ChatMessage.objects.get(pk=response.data["data"]["id"])
+        with Image.open(message.image.path) as stored:
+            assert stored.format == "WEBP"
+            assert stored.size == (1024, 512)
+
+    def test_chunked_upload_creates_file_message(self, api_client: APIClient, chunk_uploader, chat_room, tmp_path):
+        user = chunk_uploader("chunkuser1")
+        url = f"/chat-rooms/{chat_room.id}/messages/uploads/"
+        content = b"0123456789" * 3
+
+        first = api_client.post(
+            url,
+            {"file": SimpleUploadedFile("report.txt", content[:20]), "message_type": "file"},
+            format="multipart",
+            HTTP_CONTENT_RANGE="bytes 0-19/30",
+        )
+        assert first.status_code == status.HTTP_200_OK
+        assert first.data["data"]["offset"] == 20
+        assert "upload_key" not in first.data["data"]
+
+        upload_id = first.data["data"]["upload_id"]
+        # 순서가 맞지 않는 청크는 거부
+        out_of_order = api_client.post(
+            url,
+            {"file": SimpleUploadedFile("report.txt", content[25:]), "message_type": "file", "upload_id": upload_id},
+            format="multipart",
+            HTTP_CONTENT_RANGE="bytes 25-29/30",
+        )
+        assert out_of_order.status_code == status.HTTP_400_BAD_REQUEST
+
+        last = api_client.post(
+            url,
+            {"file": SimpleUploadedFile("report.txt", content[20:]), "message_type": "file", "upload_id": upload_id},
+            format="multipart",
+            HTTP_CONTENT_RANGE="bytes 20-29/30",
+        )
+        upload_key = last.data["data"]["upload_key"]
+        assert upload_key == f"chat_files/{hashlib.md5(content).hexdigest()}.txt"
+        assert (tmp_path / upload_key).read_bytes() == content
+        # 조립이 끝난 청크 파일은 삭제
+        assert list((tmp_path / "chat_uploads").iterdir()) == []
+
+        data = {"chat_room": chat_room.id, "message_type": "file", "upload_key": upload_key}
+        response = api_client.post(f"/chat-rooms/{chat_room.id}/messages/", data=data, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        message = ChatMessage.objects.get(pk=response.data["data"]["id"])
+        assert message.file.name == upload_key
+        assert message.sender == user
+
+    def test_chunked_upload_skips_storing_duplicate_file(
+        self, api_client: APIClient, chunk_uploader, chat_room, tmp_path
+    ):
+        chunk_uploader("chunkuser2")
+        url = f"/chat-rooms/{chat_room.id}/messages/uploads/"
+
+        keys = [
+            api_client.post(
+                url, {"file": SimpleUploadedFile("a.txt", b"same"), "message_type": "file"}, format="multipart"
+            ).data["data"]["upload_key"]
+            for _ in range(2)
+        ]
+
+        assert keys[0] == keys[1]
+        assert len(list((tmp_path / "chat_files").iterdir())) == 1
+
+    def test_chunked_image_upload_is_converted_to_webp(
+        self, api_client: APIClient, chunk_uploader, chat_room, image_file, tmp_path
+    ):
+        chunk_uploader("chunkuser4")
+        response = api_client.post(
+            f"/chat-rooms/{chat_room.id}/messages/uploads/",
+            {"file": image_file, "message_type": "image"},
+            format="multipart",
+        )
+
+        upload_key = response.data["data"]["upload_key"]
+        assert upload_key.startswith("chat_images/") and upload_key.endswith(".webp")
+        with Image.open(tmp_path / upload_key) as stored:
+            assert stored.format == "WEBP"
+
+    def test_chunked_upload_rejects_invalid_image_and_cleans_parts(
+        self, api_client: APIClient, chunk_uploader, chat_room, tmp_path
+    ):
+        chunk_uploader("chunkuser5")
+        response = api_client.post(
+            f"/chat-rooms/{chat_room.id}/messages/uploads/",
+            {"file": SimpleUploadedFile("fake.png", b"<html></html>"), "message_type": "image"},
+            format="multipart",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not (tmp_path / "chat_images").exists()
+        assert list((tmp_path / "chat_uploads").iterdir()) == []
+
+    @pytest.mark.parametrize(
+        "filename, message_type", [("page.html", "file"), ("photo.svg", "image"), ("report.txt", "image")]
+    )
+    def test_chunked_upload_rejects_disallowed_extension(
+        self, api_client: APIClient, chunk_uploader, chat_room, filename, message_type
+    ):
+        chunk_uploader("chunkuser6")
+        response = api_client.post(
+            f"/chat-rooms/{chat_room.id}/messages/uploads/",
+            {"file": SimpleUploadedFile(filename, b"data"), "message_type": message_type},
+            format="multipart",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_chunked_upload_requires_room_membership(self, api_client: APIClient, create_user, chat_room):
+        api_client.force_authenticate(user=create_user(nickname="chunkuser7"))
+        response = api_client.post(
+            f"/chat-rooms/{chat_room.id}/messages/uploads/",
+            {"file": SimpleUploadedFile("a.txt", b"data"), "message_type": "file"},
+            format="multipart",
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_chunked_upload_limits_active_uploads_per_user(self, api_client: APIClient, chunk_uploader, chat_room):
+        chunk_uploader("chunkuser8")
+        url = f"/chat-rooms/{chat_room.id}/messages/uploads/"
+
+        def start_upload():
+            return api_client.post(
+                url,
+                {"file": SimpleUploadedFile("a.txt", b"0123"), "message_type": "file"},
+                format="multipart",
+                HTTP_CONTENT_RANGE="bytes 0-3/8",
+            )
+
+        assert all(start_upload().status_code == status.HTTP_200_OK for _ in range(UPLOAD_MAX_ACTIVE_PER_USER))
+        assert start_upload().status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_chunked_upload_cannot_be_continued_by_another_user(self, api_client: APIClient, chunk_uploader, chat_room):
+        chunk_uploader("chunkuser9")
+        url = f"/chat-rooms/{chat_room.id}/messages/uploads/"
+        upload_id = api_client.post(
+            url,
+            {"file": SimpleUploadedFile("a.txt", b"0123"), "message_type": "file"},
+            format="multipart",
+            HTTP_CONTENT_RANGE="bytes 0-3/8",
+        ).data["data"]["upload_id"]
+
+        chunk_uploader("chunkuser10")
+        response = api_client.post(
+            url,
+            {"file": SimpleUploadedFile("a.txt", b"4567"), "message_type": "file", "upload_id": upload_id},
+            format="multipart",
+            HTTP_CONTENT_RANGE="bytes 4-7/8",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_upload_key_is_bound_to_uploader_and_room(
+        self, api_client: APIClient, chunk_uploader, chat_room, create_user
+    ):
+        uploader = chunk_uploader("chunkuser11")
+        upload_key = api_client.post(
+            f"/chat-rooms/{chat_room.id}/messages/uploads/",
+            {"file": SimpleUploadedFile("a.txt", b"bound"), "message_type": "file"},
+            format="multipart",
+        ).data["data"]["upload_key"]
+
+        other_room = ChatRoom.objects.create(name="Other Room", created_by=uploader)
+        ChatRoomParticipant.objects.create(chat_room=other_room, user=uploader)
+        other_room_data = {"chat_room": other_room.id, "message_type": "file", "upload_key": upload_key}
+        response = api_client.post(f"/chat-rooms/{other_room.id}/messages/", data=other_room_data, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        chunk_uploader("chunkuser12")
+        data = {"chat_room": chat_room.id, "message_type": "file", "upload_key": upload_key}
+        response = api_client.post(f"/chat-rooms/{chat_room.id}/messages/", data=data, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_purge_expired_chat_uploads_removes_abandoned_parts(
+        self, api_client: APIClient, chunk_uploader, chat_room, tmp_path
+    ):
+        chunk_uploader("chunkuser13")
+        url = f"/chat-rooms/{chat_room.id}/messages/uploads/"
+        for _ in range(2):
+            api_client.post(
+                url,
+                {"file": SimpleUploadedFile("a.txt", b"0123"), "message_type": "file"},
+                format="multipart",
+                HTTP_CONTENT_RANGE="bytes 0-3/8",
+            )
+        abandoned, active = sorted((tmp_path / "chat_uploads").iterdir())
+        # 하나는 상태가 만료되고 마지막 청크도 만료 시간보다 오래된 업로드
+        cache.delete(get_chat_upload_cache_key(abandoned.name.split("_")[0]))
+        expired_at = (timezone.now() - timedelta(seconds=CHAT_UPLOAD_CACHE_TIMEOUT + 60)).timestamp()
+        for part in (abandoned, active):
+            os.utime(part, (expired_at, expired_at))
+
+        assert purge_expired_chat_uploads() == 1
+        assert list((tmp_path / "chat_uploads").iterdir()) == [active]
+
+    def test_create_message_rejects_invalid_upload_key(self, api_client: APIClient, create_user, chat_room):
+        user = create_user(nickname="chunkuser3")
+        api_client.force_authenticate(user=user)
+        data = {"chat_room": chat_room.id, "message_type": "file", "upload_key": "../settings.py"}
+
+        response = api_client.post(f"/chat-rooms/{chat_room.id}/messages/", data=data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
 
     def test_list_messages(self, api_client: APIClient, create_user, chat_room):
         user = create_user(nickname="msguser3")
@@ -78,6 +321,134 @@ class TestChatMessageAPI:
         assert len(response.data) >= 1
         assert response.data[0]["content"] == text_message.content
 
+    def test_list_messages_query_count_does_not_grow(
+        self, api_client: APIClient, create_user, chat_room, django_assert_max_num_queries
+    ):
+        user = create_user(nickname="msguser_nplus1")
+        readers = [create_user(nickname=f"reader{i}") for i in range(3)]
+        api_client.force_authenticate(user=user)
+        for i in range(10):
+            message = ChatMessage.objects.create(chat_room=chat_room, sender=user, content=f"message {i}")
+            message.read_by.set(readers)
+
+        # 메시지 수와 무관하게 sender/read_by/프로필 이미지를 고정된 쿼리 수로 로드
+        with django_assert_max_num_queries(5):
+            response = api_client.get(f"/chat-rooms/{chat_room.id}/messages/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data) == 10
+        assert response.data[0]["read_count"] == 3
+        assert response.data[0]["is_read"] is False
+
+    def test_list_messages_with_sparse_fields(
+        self, api_client: APIClient, create_user, chat_room, django_assert_max_num_queries
+    ):
+        user = create_user(nickname="msguser_fields")
+        api_client.force_authenticate(user=user)
+        message = ChatMessage.objects.create(chat_room=chat_room, sender=user, content="sparse")
+        message.read_by.add(user)
+
+        # sender/read_by를 요청하지 않으면 관계 로딩 없이 메시지 쿼리 하나로 처리
+        with django_assert_max_num_queries(1) as captured:
+            response = api_client.get(f"/chat-rooms/{chat_room.id}/messages/", {"fields": "id,content,timestamp"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.data[0]) == {"id", "content", "timestamp"}
+        assert response.data[0]["content"] == "sparse"
+        # 요청하지 않은 file/image 컬럼은 SELECT에서 제외(defer)
+        sql = captured.captured_queries[0]["sql"]
+        assert '"content"' in sql
+        assert '"file"' not in sql
+        assert '"image"' not in sql
+
+    def test_list_messages_serializes_each_sender_once(self, api_client: APIClient, create_user, chat_room):
+        from unittest.mock import patch
+
+        from apps.user.serializers import UserSerializer
+
+        senders = [create_user(nickname=f"sender{i}") for i in range(2)]
+        api_client.force_authenticate(user=senders[0])
+        for i in range(6):
+            ChatMessage.objects.create(chat_room=chat_room, sender=senders[i % 2], content=f"message {i}")
+
+        with patch.object(
+            UserSerializer, "to_representation", autospec=True, side_effect=UserSerializer.to_representation
+        ) as to_repr:
+            response = api_client.get(f"/chat-rooms/{chat_room.id}/messages/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert to_repr.call_count == 2
+        assert [m["sender"]["id"] for m in response.data] == [senders[i % 2].id for i in range(6)]
+
+    def test_search_messages_by_content(self, api_client: APIClient, create_user, chat_room):
+        user = create_user(nickname="msguser_search")
+        api_client.force_authenticate(user=user)
+        hello = ChatMessage.objects.create(chat_room=chat_room, sender=user, content="hello world")
+        ChatMessage.objects.create(chat_room=chat_room, sender=user, content="bye")
+
+        response = api_client.get(f"/chat-rooms/{chat_room.id}/messages/", {"search": "hello"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [m["id"] for m in response.data] == [hello.id]
+
+    def test_list_messages_ordering(self, api_client: APIClient, create_user, chat_room):
+        user = create_user(nickname="msguser_order")
+        api_client.force_authenticate(user=user)
+        messages = [ChatMessage.objects.create(chat_room=chat_room, sender=user, content=f"m{i}") for i in range(3)]
+        ChatMessage.objects.filter(pk=messages[0].pk).update(timestamp=timezone.now() - timedelta(minutes=2))
+        ChatMessage.objects.filter(pk=messages[1].pk).update(timestamp=timezone.now() - timedelta(minutes=1))
+        url = f"/chat-rooms/{chat_room.id}/messages/"
+
+        assert [m["id"] for m in api_client.get(url).data] == [m.id for m in messages]
+        assert [m["id"] for m in api_client.get(url, {"ordering": "-timestamp"}).data] == [
+            m.id for m in reversed(messages)
+        ]
+        # 인덱스가 없는 컬럼 정렬은 무시하고 기본 시간순 유지
+        assert [m["id"] for m in api_client.get(url, {"ordering": "message_type"}).data] == [m.id for m in messages]
+
+    def test_retrieve_message_includes_reader_details(self, api_client: APIClient, create_user, chat_room):
+        user = create_user(nickname="msguser_detail")
+        reader = create_user(nickname="detail_reader")
+        api_client.force_authenticate(user=user)
+        message = ChatMessage.objects.create(chat_room=chat_room, sender=user, content="detail")
+        message.read_by.add(reader)
+
+        response = api_client.get(f"/chat-rooms/{chat_room.id}/messages/{message.id}/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"]["read_by"][0]["id"] == reader.id
+        assert response.data["data"]["read_by"][0]["nickname"] == reader.nickname
+        assert response.data["data"]["read_count"] == 1
+
+    def test_retrieve_message_limits_reader_preview(self, api_client: APIClient, create_user, chat_room):
+        user = create_user(nickname="msguser_preview")
+        api_client.force_authenticate(user=user)
+        message = ChatMessage.objects.create(chat_room=chat_room, sender=user, content="group")
+        readers = [create_user(nickname=f"preview_reader{i}") for i in range(5)]
+        message.read_by.set(readers)
+
+        response = api_client.get(f"/chat-rooms/{chat_room.id}/messages/{message.id}/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [u["id"] for u in response.data["data"]["read_by"]] == [reader.id for reader in readers[:3]]
+        assert response.data["data"]["read_count"] == 5
+
+    def test_list_messages_is_read_is_per_user(self, api_client: APIClient, create_user, chat_room):
+        user = create_user(nickname="msguser_reader")
+        other = create_user(nickname="msguser_other")
+        api_client.force_authenticate(user=user)
+        read_message = ChatMessage.objects.create(chat_room=chat_room, sender=other, content="read")
+        read_message.read_by.add(user, other)
+        ChatMessage.objects.create(chat_room=chat_room, sender=other, content="unread").read_by.add(other)
+
+        response = api_client.get(f"/chat-rooms/{chat_room.id}/messages/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [(m["content"], m["is_read"], m["read_count"]) for m in response.data] == [
+            ("read", True, 2),
+            ("unread", False, 1),
+        ]
+
     def test_update_message_within_time_limit(self, api_client: APIClient, create_user, chat_room):
         user = create_user(nickname="msguser4")
         api_client.force_authenticate(user=user)
@@ -96,6 +467,24 @@ class TestChatMessageAPI:
         assert response.status_code == status.HTTP_200_OK
         assert response.data["data"]["content"] == "Updated message"
 
+    def test_update_message_returns_detail_representation(self, api_client: APIClient, create_user, chat_room):
+        user = create_user(nickname="msguser_put")
+        reader = create_user(nickname="msguser_put_reader")
+        api_client.force_authenticate(user=user)
+        message = ChatMessage.objects.create(chat_room=chat_room, sender=user, content="before")
+        message.read_by.add(reader)
+
+        response = api_client.put(
+            f"/chat-rooms/{chat_room.id}/messages/{message.id}/", data={"content": "after"}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.data["data"]
+        assert data["content"] == "after"
+        assert data["sender"]["id"] == user.id
+        assert data["read_count"] == 1
+        assert [u["id"] for u in data["read_by"]] == [reader.id]
+
     def test_update_message_after_time_limit(self, api_client: APIClient, create_user, chat_room):
         user = create_user(nickname="msguser5")
         api_client.force_authenticate(user=user)
@@ -126,6 +515,7 @@ class TestChatMessageAPI:
         response = api_client.delete(f"/chat-rooms/{text_message.chat_room.id}/messages/{text_message.id}/")
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert response.content == b""
         assert not ChatMessage.objects.filter(id=text_message.id).exists()
 
     def test_delete_message_after_time_limit(self, api_client: APIClient, create_user, chat_room):
@@ -171,3 +561,18 @@ class TestChatMessageAPI:
         response = api_client.delete(f"/chat-rooms/{text_message.chat_room.id}/messages/{text_message.id}/")
         assert response.status_code == status.HTTP_403_FORBIDDEN
         assert ChatMessage.objects.filter(id=text_message.id).exists()
+
+
+def test_chat_rate_throttle_skips_anonymous_requests(create_user):
+    from unittest.mock import Mock
+
+    from django.contrib.auth.models import AnonymousUser
+
+    from apps.chat_message.throttles import ChatRateThrottle
+
+    throttle = ChatRateThrottle()
+    anonymous_request = Mock(user=AnonymousUser())
+    assert throttle.get_cache_key(anonymous_request, None) is None
+
+    user = create_user(nickname="throttle_user")
+    assert throttle.get_cache_key(Mock(user=user), None) == f"throttle_chat_{user.pk}"
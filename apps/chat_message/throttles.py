@@ -4,9 +4,14 @@ from rest_framework.throttling import SimpleRateThrottle
 class ChatRateThrottle(SimpleRateThrottle):
     scope = "chat"
 
+    def __init__(self):
+        super().__init__()
+        # scope는 고정값이므로 cache_format("throttle_%(scope)s_%(ident)s")의 접두사를 미리 만들어 둠
+        self._key_prefix = f"throttle_{self.scope}_"
+
     def get_cache_key(self, request, view):
-        if request.user.is_authenticated:
-            ident = request.user.pk
-        else:
-            ident = self.get_ident(request)
-        return self.cache_format % {"scope": self.scope, "ident": ident}
+        # 채팅 API는 인증 사용자 전용이므로 익명 요청은 ident 계산/캐시 조회 없이 제한하지 않음 (None)
+        # (익명 요청은 권한 검사에서 거부되고, 필요 시 AnonRateThrottle이 담당)
+        if not request.user.is_authenticated:
+            return None
+        return self._key_prefix + str(request.user.pk)
@@ -0,0 +1,236 @@
+import hashlib
+import os
+import re
+import tempfile
+import time
+import uuid
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.utils import timezone
+from PIL import Image as PILImage
+
+from apps.image.image_utils import convert_to_webp
+from utils.cache_keys import (
+    CHAT_UPLOAD_CACHE_TIMEOUT,
+    get_chat_upload_cache_key,
+    get_chat_upload_key_cache_key,
+    get_chat_upload_user_cache_key,
+)
+
+# 요청 하나에 담을 수 있는 청크 최대 크기 / 조립된 파일 최대 크기
+CHUNK_MAX_SIZE = 10 * 1024 * 1024
+UPLOAD_MAX_SIZE = 100 * 1024 * 1024
+# 사용자별로 동시에 진행할 수 있는 청크 업로드 수
+UPLOAD_MAX_ACTIVE_PER_USER = 3
+
+# 메시지 타입별 저장 경로 (ChatMessage.file / image 의 upload_to와 동일)
+UPLOAD_DIRS = {"file": "chat_files/", "image": "chat_images/"}
+# 메시지 타입별 허용 확장자 (이미지는 완료 시 Pillow로 검증한 뒤 WebP로 변환)
+UPLOAD_EXTENSIONS = {
+    "file": {".pdf", ".txt", ".csv", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", ".hwp", ".zip"},
+    "image": {".jpg", ".jpeg", ".png", ".gif", ".webp"},
+}
+IMAGE_FORMAT_EXTENSIONS = {"JPEG": ".jpg", "PNG": ".png", "GIF": ".gif", "WEBP": ".webp"}
+# 조립 전 청크를 보관하는 경로. 공유 스토리지(default_storage)에 두어 청크마다 다른 서버가 받아도 이어 쓸 수 있음
+UPLOAD_PARTS_DIR = "chat_uploads/"
+
+CONTENT_RANGE_RE = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
+UPLOAD_ID_RE = re.compile(r"^[0-9a-f]{32}$")
+UPLOAD_KEY_RE = re.compile(r"^chat_(?:files|images)/[0-9a-f]{32}(?:\.[0-9a-z]{1,10})?$")
+PART_NAME_RE = re.compile(r"^([0-9a-f]{32})_\d{12}\.part$")
+
+
+class ChunkUploadError(ValueError):
+    pass
+
+
+def parse_content_range(header, chunk_size):
+    """
+    'bytes start-end/total' 헤더를 (start, total)로 반환합니다.
+    헤더가 없으면 청크 하나로 전체 파일을 보낸 것으로 간주합니다.
+    """
+    if not header:
+        return 0, chunk_size
+    match = CONTENT_RANGE_RE.match(header.strip())
+    if not match:
+        raise ChunkUploadError("Content-Range 헤더 형식이 올바르지 않습니다.")
+    start, end, total = (int(value) for value in match.groups())
+    if end < start or end - start + 1 != chunk_size or end >= total:
+        raise ChunkUploadError("Content-Range 범위가 청크 크기와 일치하지 않습니다.")
+    return start, total
+
+
+def _upload_extension(filename, message_type):
+    extension = os.path.splitext(filename or "")[1].lower()
+    if extension not in UPLOAD_EXTENSIONS[message_type]:
+        allowed = ", ".join(sorted(UPLOAD_EXTENSIONS[message_type]))
+        raise ChunkUploadError(f"허용되지 않는 파일 형식입니다. ({allowed})")
+    return extension
+
+
+def _active_uploads(user_id):
+    """사용자의 진행 중인 업로드 {upload_id: 만료 시각(epoch)} (만료된 항목 제외)"""
+    now = time.time()
+    uploads = cache.get(get_chat_upload_user_cache_key(user_id)) or {}
+    return {upload_id: expires_at for upload_id, expires_at in uploads.items() if expires_at > now}
+
+
+def _save_active_uploads(user_id, uploads):
+    cache.set(get_chat_upload_user_cache_key(user_id), uploads, CHAT_UPLOAD_CACHE_TIMEOUT)
+
+
+def _discard_upload(user_id, upload_id, state):
+    """업로드의 청크 파일과 진행 상태를 삭제합니다."""
+    for part in state["parts"]:
+        default_storage.delete(part)
+    cache.delete(get_chat_upload_cache_key(upload_id))
+    uploads = _active_uploads(user_id)
+    uploads.pop(upload_id, None)
+    _save_active_uploads(user_id, uploads)
+
+
+def _store_image(image_file, md5):
+    """조립된 이미지를 Pillow로 검증하고 WebP로 변환해 저장한 뒤 키를 반환합니다."""
+    try:
+        with PILImage.open(image_file) as img:
+            image_format = img.format
+            img.verify()
+        if image_format not in IMAGE_FORMAT_EXTENSIONS:
+            raise ChunkUploadError("지원하지 않는 이미지 형식입니다.")
+        image_file.seek(0)
+        # 애니메이션 이미지는 변환하지 않고 원본 그대로 반환되므로 실제 형식의 확장자로 저장
+        image_file.name = f"{md5}{IMAGE_FORMAT_EXTENSIONS[image_format]}"
+        converted = convert_to_webp(image_file)
+    except (OSError, SyntaxError, ValueError, PILImage.DecompressionBombError) as e:
+        raise ChunkUploadError("이미지 파일이 올바르지 않습니다.") from e
+
+    upload_key = f"{UPLOAD_DIRS['image']}{os.path.basename(converted.name)}"
+    if not default_storage.exists(upload_key):
+        upload_key = default_storage.save(upload_key, converted)
+    return upload_key
+
+
+def _store_upload(state):
+    """
+    청크를 순서대로 이어 붙여 최종 파일을 저장하고 (upload_key, md5)를 반환합니다.
+    같은 내용(MD5)의 파일이 이미 저장되어 있으면 다시 저장하지 않고 기존 키를 반환합니다.
+    """
+    # 조립은 완료 요청을 받은 서버의 임시 파일에서만 잠시 수행 (업로드 전체를 메모리에 올리지 않음)
+    with tempfile.TemporaryFile() as assembled:
+        digest = hashlib.md5(usedforsecurity=False)
+        for part in state["parts"]:
+            with default_storage.open(part, "rb") as fp:
+                for block in iter(lambda: fp.read(1024 * 1024), b""):
+                    digest.update(block)
+                    assembled.write(block)
+        md5 = digest.hexdigest()
+        assembled.seek(0)
+
+        if state["message_type"] == "image":
+            return _store_image(File(assembled, name=f"{md5}{state['extension']}"), md5), md5
+
+        # 내용 기반 키이므로 이미 존재하면 같은 파일 → 저장 생략
+        upload_key = f"{UPLOAD_DIRS['file']}{md5}{state['extension']}"
+        if not default_storage.exists(upload_key):
+            upload_key = default_storage.save(upload_key, File(assembled, name=upload_key))
+        return upload_key, md5
+
+
+def write_chunk(user_id, chat_room_id, upload_id, chunk, content_range, message_type):
+    """
+    청크를 공유 스토리지에 저장하고, 마지막 청크면 파일을 조립해 저장합니다.
+
+    반환값: {"upload_id", "offset", "total"} (+ 완료 시 "upload_key", "md5")
+    업로드는 시작한 사용자/채팅방/메시지 타입에 묶이며, 마지막 청크 후 CHAT_UPLOAD_CACHE_TIMEOUT 동안
+    이어서 올리지 않으면 만료됩니다.
+    """
+    if message_type not in UPLOAD_DIRS:
+        raise ChunkUploadError("message_type은 file 또는 image 여야 합니다.")
+    if chunk.size > CHUNK_MAX_SIZE:
+        raise ChunkUploadError("청크 크기가 너무 큽니다.")
+    start, total = parse_content_range(content_range, chunk.size)
+    if total > UPLOAD_MAX_SIZE:
+        raise ChunkUploadError("파일 크기가 너무 큽니다.")
+
+    uploads = _active_uploads(user_id)
+    if upload_id is None:
+        if start != 0:
+            raise ChunkUploadError("첫 청크는 0바이트부터 시작해야 합니다.")
+        extension = _upload_extension(chunk.name, message_type)
+        if len(uploads) >= UPLOAD_MAX_ACTIVE_PER_USER:
+            raise ChunkUploadError("진행 중인 업로드가 너무 많습니다. 기존 업로드를 완료한 뒤 다시 시도해 주세요.")
+        upload_id = uuid.uuid4().hex
+        state = {
+            "user_id": user_id,
+            "chat_room_id": chat_room_id,
+            "message_type": message_type,
+            "extension": extension,
+            "total": total,
+            "offset": 0,
+            "parts": [],
+        }
+    else:
+        if not UPLOAD_ID_RE.match(upload_id):
+            raise ChunkUploadError("upload_id가 올바르지 않습니다.")
+        state = cache.get(get_chat_upload_cache_key(upload_id))
+        # 다른 사용자/채팅방/메시지 타입의 업로드에는 이어 쓸 수 없음
+        if state is None or (state["user_id"], state["chat_room_id"], state["message_type"], state["total"]) != (
+            user_id,
+            chat_room_id,
+            message_type,
+            total,
+        ):
+            raise ChunkUploadError("업로드를 찾을 수 없거나 만료되었습니다.")
+    if start != state["offset"]:
+        raise ChunkUploadError(f"다음 청크는 {state['offset']}바이트부터 시작해야 합니다.")
+
+    state["parts"].append(default_storage.save(f"{UPLOAD_PARTS_DIR}{upload_id}_{start:012d}.part", chunk))
+    state["offset"] += chunk.size
+    result = {"upload_id": upload_id, "offset": state["offset"], "total": total}
+    if state["offset"] < total:
+        cache.set(get_chat_upload_cache_key(upload_id), state, CHAT_UPLOAD_CACHE_TIMEOUT)
+        uploads[upload_id] = time.time() + CHAT_UPLOAD_CACHE_TIMEOUT
+        _save_active_uploads(user_id, uploads)
+        return result
+
+    try:
+        upload_key, md5 = _store_upload(state)
+    finally:
+        _discard_upload(user_id, upload_id, state)
+    # 메시지 생성 시 업로드한 사용자/채팅방에서만 이 키를 사용할 수 있도록 기록
+    cache.set(get_chat_upload_key_cache_key(upload_key, user_id, chat_room_id), message_type, CHAT_UPLOAD_CACHE_TIMEOUT)
+    return {**result, "upload_key": upload_key, "md5": md5}
+
+
+def is_upload_key(value, message_type, user_id, chat_room_id):
+    """이 사용자가 이 채팅방에 청크 업로드로 저장한 해당 타입의 키인지(경로 조작 없이) 확인합니다."""
+    return (
+        message_type in UPLOAD_DIRS
+        and bool(UPLOAD_KEY_RE.match(value))
+        and value.startswith(UPLOAD_DIRS[message_type])
+        and cache.get(get_chat_upload_key_cache_key(value, user_id, chat_room_id)) == message_type
+        and default_storage.exists(value)
+    )
+
+
+def purge_expired_upload_parts():
+    """만료되어 더 이상 이어 쓸 수 없는 업로드의 청크 파일을 삭제하고 삭제한 개수를 반환합니다."""
+    try:
+        _, names = default_storage.listdir(UPLOAD_PARTS_DIR)
+    except FileNotFoundError:
+        return 0
+    threshold = timezone.now() - timedelta(seconds=CHAT_UPLOAD_CACHE_TIMEOUT)
+    deleted = 0
+    for name in names:
+        match = PART_NAME_RE.match(name)
+        if not match or cache.get(get_chat_upload_cache_key(match.group(1))) is not None:
+            continue
+        path = f"{UPLOAD_PARTS_DIR}{name}"
+        # 상태가 저장되기 직전의 첫 청크를 지우지 않도록 만료 시간보다 오래된 청크만 삭제
+        if default_storage.get_modified_time(path) < threshold:
+            default_storage.delete(path)
+            deleted += 1
+    return deleted
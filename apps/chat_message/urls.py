@@ -1,6 +1,6 @@
 from django.urls import path
 
-from .views import ChatMessageDetailView, ChatMessageListCreateView
+from .views import ChatMessageChunkUploadView, ChatMessageDetailView, ChatMessageListCreateView
 
 app_name = "chat_message"
 
@@ -10,6 +10,11 @@ urlpatterns = [
         ChatMessageListCreateView.as_view(),
         name="chat-message-list-create",
     ),
+    path(
+        "<int:chat_room_pk>/messages/uploads/",
+        ChatMessageChunkUploadView.as_view(),
+        name="chat-message-upload",
+    ),
     path(
         "<int:chat_room_pk>/messages/<int:pk>/",
         ChatMessageDetailView.as_view(),
@@ -1,39 +1,104 @@
 from datetime import timedelta
 
+from django.db.models import Count, Exists, OuterRef, Prefetch
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
-from rest_framework import filters, generics, permissions
+from rest_framework import filters, generics, permissions, status
+from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.response import Response
 from rest_framework.throttling import AnonRateThrottle, UserRateThrottle
 
+from apps.chat_room.models import ChatRoomParticipant
+from apps.user.models import User
+from apps.user.serializers import USER_SERIALIZER_COLUMNS
 from utils.response import BaseResponseMixin
+from utils.views import SwaggerFakeViewMixin
 
 from .models import ChatMessage
-from .serializers import ChatMessageCreateSerializer, ChatMessageSerializer, ChatMessageUpdateSerializer
+from .serializers import (
+    ChatMessageChunkUploadSerializer,
+    ChatMessageCreateSerializer,
+    ChatMessageDetailSerializer,
+    ChatMessageSerializer,
+    ChatMessageUpdateSerializer,
+)
 from .throttles import ChatRateThrottle
+from .uploads import ChunkUploadError, write_chunk
 
+# 메시지 수정/삭제 허용 시간
+EDIT_WINDOW = timedelta(minutes=5)
 
-class ChatMessageListCreateView(BaseResponseMixin, generics.ListCreateAPIView):
+# 상세 응답에 포함할 읽은 사용자 수 (전체 인원은 read_count로 제공)
+READ_BY_PREVIEW_SIZE = 3
+
+
+def with_read_state(queryset, user):
+    """요청 사용자의 읽음 여부(is_read_by_user)와 읽은 사용자 수(read_count)를 같은 SELECT에서 계산합니다."""
+    read_receipts = ChatMessage.read_by.through.objects.filter(chatmessage_id=OuterRef("pk"), user_id=user.pk)
+    return queryset.annotate(read_count=Count("read_by", distinct=True), is_read_by_user=Exists(read_receipts))
+
+
+class ChatRoomMessagesMixin(SwaggerFakeViewMixin):
+    """
+    목록/상세 뷰가 같은 채팅방 메시지 쿼리셋(채팅방 필터, 발신자 로딩, 읽음 상태 주석)을 공유하도록 모은 Mixin
+    """
+
+    def get_room_messages(self, *, sender=True, read_state=True):
+        queryset = ChatMessage.objects.filter(chat_room_id=self.kwargs["chat_room_pk"])
+        if sender:
+            # 시리얼라이저가 출력하는 sender(및 프로필 이미지)를 한 번에 로드
+            queryset = queryset.select_related("sender").prefetch_related("sender__profile_images")
+        if read_state:
+            queryset = with_read_state(queryset, self.request.user)
+        return queryset
+
+
+class ChatMessageListCreateView(ChatRoomMessagesMixin, BaseResponseMixin, generics.ListCreateAPIView):
     serializer_class = ChatMessageSerializer
     permission_classes = [permissions.IsAuthenticated]
+    # 정렬은 OrderingFilter 대신 get_queryset에서 인덱스 순서(timestamp/-timestamp)만 허용
     filter_backends = [
         DjangoFilterBackend,
         filters.SearchFilter,
-        filters.OrderingFilter,
     ]
     filterset_fields = ["message_type", "sender", "read_by"]
-    search_fields = ["content", "file_url"]
-    ordering_fields = ["timestamp", "message_type"]
+    # 검색은 항상 한 채팅방 안에서만 수행되므로 (chat_room, timestamp) 인덱스로 좁혀진 행만 스캔
+    search_fields = ["content"]
     pagination_class = None  # 페이지네이션 비활성화
     throttle_classes = [UserRateThrottle, AnonRateThrottle, ChatRateThrottle]
 
     def get_queryset(self):
-        if getattr(self, "swagger_fake_view", False):
+        if self.swagger_fake_view:
             return ChatMessage.objects.none()
-        chat_room_id = self.kwargs["chat_room_pk"]
-        return ChatMessage.objects.filter(chat_room__id=chat_room_id).order_by("timestamp")
+        ordering = "-timestamp" if self.request.query_params.get("ordering") == "-timestamp" else "timestamp"
+        # ?fields=로 요청하지 않은 관계/주석은 JOIN/prefetch/서브쿼리 자체를 생략
+        fields = self.get_requested_fields()
+        queryset = self.get_room_messages(
+            sender=fields is None or "sender" in fields,
+            read_state=fields is None or bool({"is_read", "read_count"} & fields),
+        ).order_by(ordering)
+        if fields is not None and not {"file", "image"} & fields:
+            # 첨부 파일 필드를 요청하지 않으면 컬럼 자체를 읽지 않음 (목록 전용, 상세 조회에는 적용하지 않음)
+            queryset = queryset.defer("file", "image")
+        return queryset
+
+    def get_requested_fields(self):
+        """?fields=id,content,timestamp 형태의 sparse fieldset 요청을 집합으로 반환합니다. (없으면 None)"""
+        if self.request.method != "GET":
+            return None
+        fields = self.request.query_params.get("fields")
+        if not fields:
+            return None
+        return {field.strip() for field in fields.split(",") if field.strip()}
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["fields"] = self.get_requested_fields()
+        # 응답 안에서 같은 발신자는 한 번만 직렬화 (MemoizedUserSerializer 참고)
+        context["serialized_users"] = {}
+        return context
 
     def get_serializer_class(self):
         if self.request.method == "POST":
@@ -47,6 +112,24 @@ class ChatMessageListCreateView(BaseResponseMixin, generics.ListCreateAPIView):
         operation_summary="채팅 메시지 목록 조회",
         operation_description="특정 채팅방의 메시지 목록을 조회합니다.",
         tags=["ChatMessage"],
+        manual_parameters=[
+            openapi.Parameter(
+                name="fields",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="응답에 포함할 필드 (쉼표 구분). 지정하지 않으면 전체 필드를 반환합니다.",
+                required=False,
+                example="id,content,timestamp",
+            ),
+            openapi.Parameter(
+                name="ordering",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="정렬 순서. 기본값은 시간순(timestamp)이며 -timestamp만 추가로 지원합니다.",
+                required=False,
+                enum=["timestamp", "-timestamp"],
+            ),
+        ],
         responses={
             200: openapi.Response("채팅 메시지 목록을 정상적으로 조회하였습니다."),
             401: "인증되지 않은 사용자입니다.",
@@ -73,55 +156,132 @@ class ChatMessageListCreateView(BaseResponseMixin, generics.ListCreateAPIView):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
-        data = serializer.data
+        message = serializer.instance
+        # 방금 생성된 메시지는 아직 아무도 읽지 않았으므로 with_read_state 주석 값을 직접 채움
+        message.is_read_by_user = False
+        message.read_count = 0
+        # 전체 메시지 표현(sender 포함)을 한 번만 직렬화 (WebSocket 푸시 등에도 같은 payload 재사용 가능)
+        data = ChatMessageSerializer(message, context=self.get_serializer_context()).data
         return self.success(data=data, message="채팅 메시지가 생성되었습니다.", status=201)
 
 
-class ChatMessageDetailView(BaseResponseMixin, generics.RetrieveUpdateDestroyAPIView):
-    serializer_class = ChatMessageSerializer
+class ChatMessageChunkUploadView(BaseResponseMixin, generics.GenericAPIView):
+    """
+    파일/이미지 메시지용 청크 업로드. 청크를 공유 스토리지에 순서대로 저장하고,
+    마지막 청크에서 조립/검증(이미지는 WebP 변환)한 뒤 MD5 기반 키로 저장해 upload_key를 반환합니다.
+    클라이언트는 이후 같은 채팅방의 메시지 생성 요청에 파일 대신 upload_key를 전달합니다.
+    """
+
+    serializer_class = ChatMessageChunkUploadSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [MultiPartParser, FormParser]
+
+    @swagger_auto_schema(
+        operation_summary="채팅 파일 청크 업로드",
+        operation_description=(
+            "파일을 청크 단위로 업로드합니다. 첫 요청은 upload_id 없이 보내고, "
+            "이후 청크는 응답의 upload_id와 Content-Range 헤더(bytes start-end/total)를 함께 보냅니다. "
+            "같은 내용의 파일이 이미 저장되어 있으면 다시 저장하지 않습니다. "
+            "채팅방 참여자만 업로드할 수 있으며, 업로드는 1시간 동안 이어서 올리지 않으면 만료됩니다."
+        ),
+        tags=["ChatMessage"],
+        manual_parameters=[
+            openapi.Parameter(
+                name="Content-Range",
+                in_=openapi.IN_HEADER,
+                type=openapi.TYPE_STRING,
+                description="청크 범위. 생략하면 파일 전체를 한 번에 보낸 것으로 간주합니다.",
+                required=False,
+                example="bytes 0-10485759/31457280",
+            ),
+        ],
+        responses={
+            200: openapi.Response("청크가 저장되었습니다. 업로드가 끝나면 upload_key가 포함됩니다."),
+            400: "요청 데이터가 올바르지 않습니다.",
+            401: "인증되지 않은 사용자입니다.",
+            404: "채팅방을 찾을 수 없습니다.",
+        },
+    )
+    def post(self, request, *args, **kwargs):
+        chat_room_id = kwargs["chat_room_pk"]
+        is_member = ChatRoomParticipant.objects.filter(
+            chat_room_id=chat_room_id, user_id=request.user.pk, left_at__isnull=True
+        ).exists()
+        if not is_member:
+            return self.error(message="채팅방을 찾을 수 없습니다.", status=404)
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            data = write_chunk(
+                request.user.pk,
+                chat_room_id,
+                serializer.validated_data.get("upload_id"),
+                serializer.validated_data["file"],
+                request.headers.get("Content-Range"),
+                serializer.validated_data["message_type"],
+            )
+        except ChunkUploadError as e:
+            return self.error(message=str(e), status=400)
+        message = "파일 업로드가 완료되었습니다." if "upload_key" in data else "청크가 저장되었습니다."
+        return self.success(data=data, message=message)
+
+
+# PUT/PATCH가 공유하는 스웨거 응답 정의 (모듈 로드 시 한 번만 생성)
+CHAT_MESSAGE_UPDATE_RESPONSES = {
+    200: openapi.Response("채팅 메시지가 정상적으로 수정되었습니다."),
+    400: "요청 데이터가 올바르지 않습니다.",
+    401: "인증되지 않은 사용자입니다.",
+    403: "접근 권한이 없습니다.",
+    404: "채팅 메시지를 찾을 수 없습니다.",
+}
+
+
+class ChatMessageDetailView(ChatRoomMessagesMixin, BaseResponseMixin, generics.RetrieveUpdateDestroyAPIView):
+    serializer_class = ChatMessageDetailSerializer
     permission_classes = [permissions.IsAuthenticated]
     lookup_field = "pk"
 
     def get_queryset(self):
-        if getattr(self, "swagger_fake_view", False):
+        if self.swagger_fake_view:
             return ChatMessage.objects.none()
-        chat_room_id = self.kwargs["chat_room_pk"]
-        return ChatMessage.objects.select_related("sender", "chat_room").filter(chat_room__id=chat_room_id)
+        # 읽은 사용자는 채팅방 인원과 무관하게 앞의 READ_BY_PREVIEW_SIZE명만 로드 (전체 수는 read_count 주석)
+        readers = User.objects.only(*USER_SERIALIZER_COLUMNS).order_by("id").prefetch_related("profile_images")
+        return self.get_room_messages().prefetch_related(
+            Prefetch("read_by", queryset=readers[:READ_BY_PREVIEW_SIZE], to_attr="read_by_preview")
+        )
 
     def get_serializer_class(self):
         if self.request.method in ["PUT", "PATCH"]:
             return ChatMessageUpdateSerializer
-        return ChatMessageSerializer
+        return ChatMessageDetailSerializer
+
+    def check_edit_window(self, instance, action):
+        """메시지 전송 후 EDIT_WINDOW가 지났으면 수정/삭제를 거부합니다."""
+        if instance.timestamp < timezone.now() - EDIT_WINDOW:
+            minutes = int(EDIT_WINDOW.total_seconds() // 60)
+            self.permission_denied(self.request, message=f"메시지 전송 후 {minutes}분 이내에만 {action}할 수 있습니다.")
 
     def perform_update(self, serializer):
         # 메시지 작성자만 수정 가능하도록 제한 및 시간 제한 추가
         if serializer.instance.sender != self.request.user:
             self.permission_denied(self.request)
 
-        # 5분 이내에만 수정 가능
-        time_limit = timedelta(minutes=5)
-        if timezone.now() - serializer.instance.timestamp > time_limit:
-            self.permission_denied(self.request, message="메시지 전송 후 5분 이내에만 수정할 수 있습니다.")
+        # EDIT_WINDOW(5분) 이내에만 수정 가능
+        self.check_edit_window(serializer.instance, "수정")
 
         super().perform_update(serializer)
-        self.logger.info(
-            f"ChatMessage updated by {self.request.user.email if self.request.user.is_authenticated else 'anonymous'}"
-        )
+        self.logger.info("ChatMessage updated by %s", self.request.user.email)
 
     def perform_destroy(self, instance):
         # 메시지 작성자만 삭제 가능하도록 제한 및 시간 제한 추가
         if instance.sender != self.request.user:
             self.permission_denied(self.request)
 
-        # 5분 이내에만 삭제 가능
-        time_limit = timedelta(minutes=5)
-        if timezone.now() - instance.timestamp > time_limit:
-            self.permission_denied(self.request, message="메시지 전송 후 5분 이내에만 삭제할 수 있습니다.")
+        # EDIT_WINDOW(5분) 이내에만 삭제 가능
+        self.check_edit_window(instance, "삭제")
 
         super().perform_destroy(instance)
-        self.logger.info(
-            f"ChatMessage deleted by {self.request.user.email if self.request.user.is_authenticated else 'anonymous'}"
-        )
+        self.logger.info("ChatMessage deleted by %s", self.request.user.email)
 
     @swagger_auto_schema(
         operation_summary="채팅 메시지 상세 조회",
@@ -143,13 +303,7 @@ class ChatMessageDetailView(BaseResponseMixin, generics.RetrieveUpdateDestroyAPI
         operation_summary="채팅 메시지 수정",
         operation_description="특정 채팅 메시지의 내용을 수정합니다. 작성자만 수정할 수 있습니다.",
         tags=["ChatMessage"],
-        responses={
-            200: openapi.Response("채팅 메시지가 정상적으로 수정되었습니다."),
-            400: "요청 데이터가 올바르지 않습니다.",
-            401: "인증되지 않은 사용자입니다.",
-            403: "접근 권한이 없습니다.",
-            404: "채팅 메시지를 찾을 수 없습니다.",
-        },
+        responses=CHAT_MESSAGE_UPDATE_RESPONSES,
     )
     def put(self, request, *args, **kwargs):
         partial = kwargs.pop("partial", False)
@@ -157,29 +311,18 @@ class ChatMessageDetailView(BaseResponseMixin, generics.RetrieveUpdateDestroyAPI
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
         self.perform_update(serializer)
-        response_serializer = ChatMessageSerializer(instance)
-        return self.success(data=response_serializer.data, message="채팅 메시지가 수정되었습니다.")
+        # ChatMessageUpdateSerializer가 이미 로드된 instance로 상세 응답을 만들어 재조회/재직렬화 없음
+        return self.success(data=serializer.data, message="채팅 메시지가 수정되었습니다.")
 
     @swagger_auto_schema(
         operation_summary="채팅 메시지 부분 수정",
         operation_description="특정 채팅 메시지의 일부 내용을 수정합니다. 작성자만 수정할 수 있습니다.",
         tags=["ChatMessage"],
-        responses={
-            200: openapi.Response("채팅 메시지가 정상적으로 수정되었습니다."),
-            400: "요청 데이터가 올바르지 않습니다.",
-            401: "인증되지 않은 사용자입니다.",
-            403: "접근 권한이 없습니다.",
-            404: "채팅 메시지를 찾을 수 없습니다.",
-        },
+        responses=CHAT_MESSAGE_UPDATE_RESPONSES,
     )
     def patch(self, request, *args, **kwargs):
-        partial = True
-        instance = self.get_object()
-        serializer = self.get_serializer(instance, data=request.data, partial=partial)
-        serializer.is_valid(raise_exception=True)
-        self.perform_update(serializer)
-        response_serializer = ChatMessageSerializer(instance)
-        return self.success(data=response_serializer.data, message="채팅 메시지가 수정되었습니다.")
+        kwargs["partial"] = True
+        return self.put(request, *args, **kwargs)
 
     @swagger_auto_schema(
         operation_summary="채팅 메시지 삭제",
@@ -195,4 +338,5 @@ class ChatMessageDetailView(BaseResponseMixin, generics.RetrieveUpdateDestroyAPI
     def delete(self, request, *args, **kwargs):
         instance = self.get_object()
         self.perform_destroy(instance)
-        return self.success(data=None, message="채팅 메시지가 삭제되었습니다.", status=204)
+        # 204는 본문이 없어야 하므로 공통 응답 봉투(success) 없이 빈 응답 반환
+        return Response(status=status.HTTP_204_NO_CONTENT)
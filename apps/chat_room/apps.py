@@ -5,3 +5,6 @@ class ChatRoomConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.chat_room"
     verbose_name = "채팅방"
+
+    def ready(self):
+        import apps.chat_room.signals  # noqa
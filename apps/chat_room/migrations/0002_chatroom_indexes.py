@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+# SearchFilter의 icontains는 PostgreSQL에서 UPPER(name) LIKE UPPER(%검색어%)로 실행되므로 같은 식에 trigram 인덱스 생성
+def create_name_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS chatroom_name_trgm "
+        'ON "chat_room_chatroom" USING gin (UPPER("name"::text) gin_trgm_ops)'
+    )
+
+
+def drop_name_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS chatroom_name_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat_room", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="chatroom",
+            index=models.Index(fields=["is_active", "room_type", "-created_at"], name="chatroom_active_type_idx"),
+        ),
+        migrations.RunPython(create_name_trigram_index, drop_name_trigram_index),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:53
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat_room", "0002_chatroom_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="chatroomparticipant",
+            index=models.Index(
+                condition=models.Q(("left_at__isnull", True)),
+                fields=["chat_room", "user"],
+                name="chatroomparticipant_active_idx",
+            ),
+        ),
+    ]
@@ -29,6 +29,11 @@ class ChatRoom(models.Model):
         verbose_name = _("채팅방")
         verbose_name_plural = _("채팅방들")
         ordering = ["-last_message_at"]
+        # 목록의 is_active/room_type 필터와 created_at 정렬을 하나의 인덱스 범위 스캔으로 처리
+        # (이름 검색용 pg_trgm GIN 인덱스는 PostgreSQL 전용이라 마이그레이션에서 별도로 생성)
+        indexes = [
+            models.Index(fields=["is_active", "room_type", "-created_at"], name="chatroom_active_type_idx"),
+        ]
 
     def __str__(self):
         return self.name
@@ -46,6 +51,15 @@ class ChatRoomParticipant(models.Model):
         verbose_name = _("채팅방 참여자")
         verbose_name_plural = _("채팅방 참여자들")
         unique_together = ("chat_room", "user")
+        # 현재 참여자(left_at IS NULL)만 담는 부분 인덱스: 참여 여부 EXISTS, 참여자 수 서브쿼리,
+        # 퇴장/읽음 처리 UPDATE가 퇴장한 참여자 행을 거치지 않고 인덱스 범위만 탐색
+        indexes = [
+            models.Index(
+                fields=["chat_room", "user"],
+                condition=models.Q(left_at__isnull=True),
+                name="chatroomparticipant_active_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.email} - {self.chat_room.name}"
@@ -1,13 +1,32 @@
+from functools import cached_property
+
+from django.db import transaction
+from django.db.models import Prefetch
 from django.utils import timezone
 from rest_framework import serializers
 
-from apps.user.serializers import UserSerializer
+from apps.user.models import User
+from apps.user.serializers import USER_SERIALIZER_COLUMNS, MemoizedUserSerializer
 
 from .models import ChatRoom, ChatRoomParticipant
 
+# ChatRoomSerializer가 읽는 채팅방 컬럼
+CHAT_ROOM_COLUMNS = (
+    "id",
+    "name",
+    "description",
+    "max_participants",
+    "room_type",
+    "is_active",
+    "created_at",
+    "updated_at",
+    "last_message_at",
+    "created_by",
+)
+
 
 class ChatRoomParticipantSerializer(serializers.ModelSerializer):
-    user = UserSerializer(read_only=True)
+    user = MemoizedUserSerializer(read_only=True)
 
     class Meta:
         model = ChatRoomParticipant
@@ -16,8 +35,8 @@ class ChatRoomParticipantSerializer(serializers.ModelSerializer):
 
 
 class ChatRoomSerializer(serializers.ModelSerializer):
-    participants = UserSerializer(many=True, read_only=True)
-    created_by = UserSerializer(read_only=True)
+    participants = MemoizedUserSerializer(many=True, read_only=True)
+    created_by = MemoizedUserSerializer(read_only=True)
     room_participants = ChatRoomParticipantSerializer(many=True, read_only=True)
     unread_count = serializers.SerializerMethodField()
 
@@ -46,17 +65,107 @@ class ChatRoomSerializer(serializers.ModelSerializer):
             "created_by",
         )
 
-    def get_unread_count(self, obj):
+    @classmethod
+    def get_participants_queryset(cls):
+        return User.objects.only(*USER_SERIALIZER_COLUMNS).prefetch_related("profile_images")
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        이 시리얼라이저가 출력하는 관계(created_by, participants, room_participants.user)와 컬럼만 미리 로드합니다.
+        중첩 필드를 추가/변경하면 여기도 함께 수정해 뷰마다 prefetch를 따로 관리하지 않도록 합니다.
+        """
+        return (
+            queryset.select_related("created_by")
+            .only(*CHAT_ROOM_COLUMNS, *(f"created_by__{column}" for column in USER_SERIALIZER_COLUMNS))
+            .prefetch_related(
+                "created_by__profile_images",
+                Prefetch("participants", queryset=cls.get_participants_queryset()),
+                Prefetch(
+                    "room_participants",
+                    queryset=ChatRoomParticipant.objects.select_related("user").only(
+                        "id",
+                        "chat_room",
+                        "is_admin",
+                        "joined_at",
+                        "left_at",
+                        "last_read_at",
+                        "user",
+                        *(f"user__{column}" for column in USER_SERIALIZER_COLUMNS),
+                    ),
+                ),
+                "room_participants__user__profile_images",
+            )
+        )
+
+    @cached_property
+    def request_user_id(self):
+        """요청 사용자 ID (비로그인이면 None). 목록 직렬화 시 채팅방마다 다시 계산하지 않도록 한 번만 구함"""
         request = self.context.get("request")
-        if request and request.user.is_authenticated:
-            try:
-                participant = obj.room_participants.get(user=request.user)
-                if participant.last_read_at:
-                    return obj.messages.filter(created_at__gt=participant.last_read_at).count()
-                return obj.messages.count()
-            except ChatRoomParticipant.DoesNotExist:
-                return 0
-        return 0
+        return request.user.id if request and request.user.is_authenticated else None
+
+    def get_unread_count(self, obj):
+        user_id = self.request_user_id
+        if user_id is None:
+            return 0
+        # 뷰 쿼리셋에서 with_unread_count로 주석된 값을 우선 사용
+        if hasattr(obj, "unread_count"):
+            return obj.unread_count
+        # 주석이 없으면 room_participants(prefetch 캐시)에서 찾음. user 대신 user_id를 비교해 User 조회 없음
+        participant = next((p for p in obj.room_participants.all() if p.user_id == user_id), None)
+        if participant is None:
+            return 0
+        messages = obj.messages.all()
+        if participant.last_read_at:
+            messages = messages.filter(timestamp__gt=participant.last_read_at)
+        return messages.count()
+
+
+class ChatRoomListSerializer(ChatRoomSerializer):
+    """
+    목록 조회용. 참여자는 닉네임 목록으로, 안 읽은 메시지 수 대신 존재 여부(has_unread)만 반환합니다.
+    참여자별 상세(room_participants)는 상세 조회에서만 출력하고, 목록은 참여자 수(participant_count)만 반환합니다.
+    """
+
+    # 목록에서는 참여자 전체 정보 대신 현재 참여자(퇴장하지 않은 참여자)의 표시용 닉네임만 출력
+    participants = serializers.SerializerMethodField()
+    # 뷰 쿼리셋에서 with_has_unread / participant_count로 주석된 값
+    has_unread = serializers.BooleanField(read_only=True)
+    participant_count = serializers.IntegerField(read_only=True)
+
+    class Meta(ChatRoomSerializer.Meta):
+        fields = (
+            *(field for field in ChatRoomSerializer.Meta.fields if field not in ("unread_count", "room_participants")),
+            "participant_count",
+            "has_unread",
+        )
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        목록에서 출력하는 created_by와 현재 참여자 닉네임만 로드합니다.
+        참여자는 퇴장 시 갱신되지 않는 participants(M2M) 대신 room_participants 중 left_at IS NULL인 행만 가져옵니다.
+        """
+        active_participants = (
+            ChatRoomParticipant.objects.filter(left_at__isnull=True)
+            .select_related("user")
+            .only("id", "chat_room", "user__id", "user__nickname")
+            .order_by("id")
+        )
+        return (
+            queryset.select_related("created_by")
+            .only(*CHAT_ROOM_COLUMNS, *(f"created_by__{column}" for column in USER_SERIALIZER_COLUMNS))
+            .prefetch_related(
+                "created_by__profile_images",
+                Prefetch("room_participants", queryset=active_participants, to_attr="active_participants"),
+            )
+        )
+
+    def get_participants(self, obj):
+        active_participants = getattr(obj, "active_participants", None)
+        if active_participants is None:
+            active_participants = obj.room_participants.filter(left_at__isnull=True).select_related("user")
+        return [participant.user.nickname for participant in active_participants]
 
 
 class ChatRoomCreateSerializer(serializers.ModelSerializer):
@@ -77,37 +186,44 @@ class ChatRoomCreateSerializer(serializers.ModelSerializer):
         if len(participant_ids) < 2:
             raise serializers.ValidationError("최소 2명 이상의 참여자가 필요합니다.")
 
-        max_participants = attrs.get("max_participants", 10)
+        # 기본값은 모델 필드 정의를 그대로 사용 (값을 중복 정의하지 않음)
+        max_participants = attrs.get("max_participants", ChatRoom._meta.get_field("max_participants").default)
         if len(participant_ids) > max_participants:
             raise serializers.ValidationError(
                 f"참여자 수({len(participant_ids)})가 최대 참여자 수({max_participants})를 초과합니다."
             )
 
+        # 존재하지 않는 사용자 ID는 INSERT 단계의 FK 오류 대신 한 번의 조회로 검증
+        existing_ids = set(User.objects.filter(pk__in=set(participant_ids)).values_list("pk", flat=True))
+        missing_ids = set(participant_ids) - existing_ids
+        if missing_ids:
+            raise serializers.ValidationError({"participant_ids": f"존재하지 않는 사용자입니다: {sorted(missing_ids)}"})
+
         return attrs
 
+    @transaction.atomic
     def create(self, validated_data):
+        # 채팅방/참여자/M2M INSERT를 하나의 트랜잭션으로 묶어 한 번만 커밋 (중간 실패 시 채팅방도 롤백)
         participant_ids = validated_data.pop("participant_ids")
         chat_room = super().create(validated_data)
 
-        # participant_ids에서 중복 제거
-        unique_participant_ids = list(set(participant_ids))
-
-        # User 모델과 ChatRoomParticipant 모델 참조용 리스트
-        users = []
-
-        # 참여자 추가
-        for user_id in unique_participant_ids:
-            participant = ChatRoomParticipant.objects.create(
-                chat_room=chat_room,
-                user_id=user_id,
-                is_admin=(user_id == self.context["request"].user.id),
-                joined_at=timezone.now(),
-            )
-            users.append(participant.user)
+        # participant_ids에서 요청 순서를 유지하며 중복 제거 (존재 여부는 validate에서 확인)
+        unique_participant_ids = list(dict.fromkeys(participant_ids))
+
+        # 참여자 추가 (사용자별 INSERT 대신 한 번의 bulk INSERT)
+        creator_id = self.context["request"].user.id
+        now = timezone.now()
+        ChatRoomParticipant.objects.bulk_create(
+            [
+                ChatRoomParticipant(
+                    chat_room=chat_room, user_id=user_id, is_admin=(user_id == creator_id), joined_at=now
+                )
+                for user_id in unique_participant_ids
+            ]
+        )
 
-        # participants ManyToMany 필드에 사용자들 추가
-        chat_room.participants.set(users)
-        chat_room.save()
+        # participants ManyToMany 필드에 사용자들 추가 (pk를 그대로 넘겨 추가 SELECT 없이 INSERT)
+        chat_room.participants.add(*unique_participant_ids)
 
         return chat_room
 
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from utils.cache_helpers import invalidate_chat_room_admin_cache
+
+from .models import ChatRoomParticipant
+
+
+@receiver([post_save, post_delete], sender=ChatRoomParticipant)
+def invalidate_chat_room_admin(sender, instance, **kwargs):
+    """참여자 행이 저장/삭제되면(관리자 지정/해제, 채팅방 삭제 포함) 관리자 여부 캐시를 무효화합니다."""
+    invalidate_chat_room_admin_cache(instance.chat_room_id, [instance.user_id])
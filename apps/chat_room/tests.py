@@ -1,13 +1,38 @@
 from datetime import timedelta
+from unittest.mock import patch
 
 import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.db import DatabaseError, connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework.test import APIClient, APIRequestFactory
 
+from apps.chat_message.models import ChatMessage
 from apps.chat_room.models import ChatRoom, ChatRoomParticipant
+from apps.chat_room.serializers import ChatRoomSerializer
 from apps.user.models import User
+from apps.user.serializers import UserSerializer
+
+# URL 해석은 모듈 로드 시 한 번만 하고, 테스트에서는 pk만 채워 사용
+LIST_URL = reverse("chat_room:chat-room-list-create")
+ROOM_URLS = {
+    name: reverse(f"chat_room:{name}", kwargs={"pk": 0}).replace("/0/", "/{pk}/", 1)
+    for name in (
+        "chat-room-detail",
+        "chat-room-add-participants",
+        "chat-room-remove-participants",
+        "chat-room-leave",
+        "chat-room-mark-as-read",
+        "chat-room-join",
+    )
+}
+
+
+def room_url(name, pk):
+    return ROOM_URLS[name].format(pk=pk)
 
 
 @pytest.fixture
@@ -33,28 +58,50 @@ def authenticate_client(api_client):
     return _authenticate_client
 
 
-@pytest.fixture
-def create_chat_room(db, create_user):
-    def _create_chat_room(creator, participants=None, room_type=ChatRoom.RoomType.GROUP, **kwargs):
-        timestamp = timezone.now().timestamp()
-        chat_room = ChatRoom.objects.create(
-            name=kwargs.pop("name", f"Test Chat Room {timestamp}"),
-            room_type=room_type,
-            created_by=creator,
-            **kwargs,
+@pytest.fixture(scope="module")
+def read_only_chat_rooms(django_db_setup, django_db_blocker):
+    """
+    조회 전용 테스트에서 공유하는 사용자/채팅방을 모듈당 한 번만 생성합니다.
+    테스트별 트랜잭션 밖에서 커밋되므로 이 데이터를 수정하는 테스트에는 사용하지 말고 create_chat_room을 사용하세요.
+    """
+
+    def _user(key):
+        return User.objects.create_user(
+            email=f"read_only_{key}@example.com", password=None, nickname=f"read_only_{key}", is_active=True
+        )
+
+    def _room(creator, name, participants=(), **kwargs):
+        chat_room = ChatRoom.objects.create(name=name, created_by=creator, **kwargs)
+        now = timezone.now()
+        ChatRoomParticipant.objects.bulk_create(
+            [ChatRoomParticipant(chat_room=chat_room, user=creator, is_admin=True, joined_at=now)]
+            + [ChatRoomParticipant(chat_room=chat_room, user=user, joined_at=now) for user in participants]
         )
-        ChatRoomParticipant.objects.create(chat_room=chat_room, user=creator, is_admin=True, joined_at=timezone.now())
-        if participants:
-            for participant_user in participants:
-                if participant_user != creator:
-                    ChatRoomParticipant.objects.create(
-                        chat_room=chat_room,
-                        user=participant_user,
-                        joined_at=timezone.now(),
-                    )
         return chat_room
 
-    return _create_chat_room
+    with django_db_blocker.unblock():
+        users = {key: _user(key) for key in ("member", "other", "outsider", "type", "active", "search", "sort")}
+        data = {
+            "users": users,
+            "member_room": _room(users["member"], "Member Room", [users["other"]]),
+            "other_room": _room(users["other"], "Other Room", [users["outsider"]]),
+        }
+        _room(users["type"], "Direct Chat", room_type=ChatRoom.RoomType.DIRECT)
+        _room(users["type"], "Group Chat", room_type=ChatRoom.RoomType.GROUP)
+        _room(users["active"], "Active Room", is_active=True)
+        _room(users["active"], "Inactive Room", is_active=False)
+        _room(users["search"], "Alpha Chat Room")
+        _room(users["search"], "Beta Chat Room")
+        for name, days_ago in (("Old Room", 2), ("New Room", 1)):
+            # created_at은 auto_now_add라 생성 후 UPDATE로 지정
+            sort_room = _room(users["sort"], name)
+            ChatRoom.objects.filter(pk=sort_room.pk).update(created_at=timezone.now() - timedelta(days=days_ago))
+
+    yield data
+
+    with django_db_blocker.unblock():
+        ChatRoom.objects.filter(created_by__in=users.values()).delete()
+        User.objects.filter(pk__in=[user.pk for user in users.values()]).delete()
 
 
 @pytest.mark.django_db
@@ -68,39 +115,89 @@ class TestChatRoomAPI:
             "participant_ids": [],
         }
 
+    def test_create_chat_room_adds_participants(self, api_client, authenticate_client, create_users, chat_room_data):
+        user = authenticate_client()
+        others = create_users(3)
+        chat_room_data["participant_ids"] = [user.pk, *(other.pk for other in others), others[0].pk]
+
+        url = LIST_URL
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.post(url, chat_room_data, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        # 참여자 수와 무관하게 참여자 INSERT는 한 번
+        participant_inserts = [
+            query for query in context.captured_queries if 'INTO "chat_room_chatroomparticipant"' in query["sql"]
+        ]
+        assert len(participant_inserts) == 1
+        chat_room = ChatRoom.objects.get(pk=response.data["data"]["id"])
+        assert set(chat_room.participants.values_list("id", flat=True)) == {user.pk, *(other.pk for other in others)}
+        participants = ChatRoomParticipant.objects.filter(chat_room=chat_room)
+        # 중복은 제거하되 요청한 순서대로 참여자 생성
+        assert list(participants.order_by("id").values_list("user_id", flat=True)) == [
+            user.pk,
+            *(other.pk for other in others),
+        ]
+        assert set(participants.filter(is_admin=True).values_list("user_id", flat=True)) == {user.pk}
+
+    def test_create_chat_room_rejects_unknown_participants(self, api_client, authenticate_client, chat_room_data):
+        user = authenticate_client()
+        chat_room_data["participant_ids"] = [user.pk, 999999]
+
+        url = LIST_URL
+        response = api_client.post(url, chat_room_data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "999999" in str(response.data["participant_ids"])
+        assert not ChatRoom.objects.filter(name=chat_room_data["name"]).exists()
+
+    def test_create_chat_room_rolls_back_on_participant_failure(
+        self, api_client, authenticate_client, create_user, chat_room_data
+    ):
+        user = authenticate_client()
+        other = create_user("rollback_member@example.com", "testpass123!")
+        chat_room_data["participant_ids"] = [user.pk, other.pk]
+
+        url = LIST_URL
+        with patch.object(ChatRoomParticipant.objects, "bulk_create", side_effect=DatabaseError):
+            with pytest.raises(DatabaseError):
+                api_client.post(url, chat_room_data, format="json")
+
+        assert not ChatRoom.objects.filter(name=chat_room_data["name"]).exists()
+
     def test_list_chat_rooms(self, api_client, authenticate_client, chat_room):
         authenticate_client()
-        url = reverse("chat_room:chat-room-list-create")
+        url = LIST_URL
         response = api_client.get(url)
         assert response.status_code == status.HTTP_200_OK
 
     def test_retrieve_chat_room(self, api_client, authenticate_client, chat_room):
         authenticate_client()
-        url = reverse("chat_room:chat-room-detail", kwargs={"pk": chat_room.pk})
+        url = room_url("chat-room-detail", chat_room.pk)
         response = api_client.get(url)
         assert response.status_code == status.HTTP_200_OK
 
     def test_update_chat_room_by_creator(self, api_client, authenticate_client, chat_room):
         authenticate_client(user=chat_room.created_by)  # chat_room의 생성자로 인증
-        url = reverse("chat_room:chat-room-detail", kwargs={"pk": chat_room.pk})
+        url = room_url("chat-room-detail", chat_room.pk)
         response = api_client.patch(url, {"name": "Updated Room"}, format="json")
         assert response.status_code == status.HTTP_200_OK
 
     def test_update_chat_room_by_non_creator(self, api_client, authenticate_client, chat_room, another_user):
         authenticate_client(user=another_user)
-        url = reverse("chat_room:chat-room-detail", kwargs={"pk": chat_room.pk})
+        url = room_url("chat-room-detail", chat_room.pk)
         response = api_client.patch(url, {"name": "Updated Room"}, format="json")
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
     def test_delete_chat_room_by_creator(self, api_client, authenticate_client, chat_room):
         authenticate_client(user=chat_room.created_by)  # chat_room의 생성자로 인증
-        url = reverse("chat_room:chat-room-detail", kwargs={"pk": chat_room.pk})
+        url = room_url("chat-room-detail", chat_room.pk)
         response = api_client.delete(url)
         assert response.status_code == status.HTTP_204_NO_CONTENT
 
     def test_delete_chat_room_by_non_creator(self, api_client, authenticate_client, chat_room, another_user):
         authenticate_client(user=another_user)
-        url = reverse("chat_room:chat-room-detail", kwargs={"pk": chat_room.pk})
+        url = room_url("chat-room-detail", chat_room.pk)
         response = api_client.delete(url)
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
@@ -110,18 +207,71 @@ class TestChatRoomAPI:
         chat_room = create_chat_room(creator=user1)
 
         api_client.force_authenticate(user=user2)
-        url = reverse("chat_room:chat-room-join", kwargs={"pk": chat_room.pk})
+        url = room_url("chat-room-join", chat_room.pk)
         response = api_client.post(url)
         assert response.status_code == status.HTTP_200_OK
         assert ChatRoomParticipant.objects.filter(chat_room=chat_room, user=user2).exists()
 
+    def test_join_chat_room_uses_single_lookup(
+        self, api_client, authenticate_client, create_user, create_chat_room, django_assert_max_num_queries
+    ):
+        chat_room = create_chat_room(creator=create_user())
+        authenticate_client()
+
+        url = room_url("chat-room-join", chat_room.pk)
+        # 채팅방/참여 여부/참여자 수 조회 1번 + INSERT 1번 (+ 트랜잭션 SAVEPOINT)
+        with django_assert_max_num_queries(4) as captured:
+            response = api_client.post(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len([q for q in captured.captured_queries if q["sql"].startswith("SELECT")]) == 1
+        assert api_client.post(url).status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_rejoin_full_chat_room_is_rejected(
+        self, api_client, authenticate_client, create_users, create_chat_room, django_assert_num_queries
+    ):
+        creator, member, left = create_users(3)
+        chat_room = create_chat_room(creator=creator, participants=[member, left], max_participants=2)
+        ChatRoomParticipant.objects.filter(chat_room=chat_room, user=left).update(left_at=timezone.now())
+        authenticate_client(user=left)
+
+        # 정원 확인은 잠금 조회 한 번으로 끝나고, 가득 차면 INSERT/UPDATE 없이 거절
+        with django_assert_num_queries(3) as captured:
+            response = api_client.post(room_url("chat-room-join", chat_room.pk))
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not any(q["sql"].startswith(("INSERT", "UPDATE")) for q in captured.captured_queries)
+        assert ChatRoomParticipant.objects.get(chat_room=chat_room, user=left).left_at is not None
+
+    def test_rejoin_chat_room_after_leaving(self, api_client, authenticate_client, create_user, create_chat_room):
+        member = create_user()
+        chat_room = create_chat_room(creator=create_user(), participants=[member])
+        ChatRoomParticipant.objects.filter(chat_room=chat_room, user=member).update(left_at=timezone.now())
+        authenticate_client(user=member)
+
+        response = api_client.post(room_url("chat-room-join", chat_room.pk))
+
+        assert response.status_code == status.HTTP_200_OK
+        participant = ChatRoomParticipant.objects.get(chat_room=chat_room, user=member)
+        assert participant.left_at is None
+
+    def test_join_missing_chat_room(self, api_client, authenticate_client, django_assert_max_num_queries):
+        authenticate_client()
+
+        # 없는 채팅방은 조회 한 번 뒤 바로 404 (쓰기 쿼리 없음)
+        with django_assert_max_num_queries(3) as captured:
+            response = api_client.post(room_url("chat-room-join", 999999))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert not any(q["sql"].startswith(("INSERT", "UPDATE")) for q in captured.captured_queries)
+
     def test_join_full_chat_room(self, api_client, authenticate_client, create_user, create_chat_room):
         user1 = authenticate_client()
         user2 = create_user("user2@example.com", "testpass123!")
         chat_room = create_chat_room(creator=user1, max_participants=1)
 
         api_client.force_authenticate(user=user2)
-        url = reverse("chat_room:chat-room-join", kwargs={"pk": chat_room.pk})
+        url = room_url("chat-room-join", chat_room.pk)
         response = api_client.post(url)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
@@ -131,7 +281,7 @@ class TestChatRoomAPI:
         chat_room = create_chat_room(creator=user1, participants=[user2])
 
         api_client.force_authenticate(user=user2)
-        url = reverse("chat_room:chat-room-leave", kwargs={"pk": chat_room.pk})
+        url = room_url("chat-room-leave", chat_room.pk)
         response = api_client.post(url)
         assert response.status_code == status.HTTP_200_OK
         participant = ChatRoomParticipant.objects.get(chat_room=chat_room, user=user2)
@@ -139,35 +289,47 @@ class TestChatRoomAPI:
 
     def test_leave_chat_room_not_participant(self, api_client, authenticate_client, chat_room, another_user):
         api_client.force_authenticate(user=another_user)
-        url = reverse("chat_room:chat-room-leave", kwargs={"pk": chat_room.pk})
+        url = room_url("chat-room-leave", chat_room.pk)
         response = api_client.post(url)
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
     def test_creator_cannot_leave_chat_room(self, api_client, authenticate_client, chat_room):
         authenticate_client(user=chat_room.created_by)  # chat_room의 생성자로 인증
-        url = reverse("chat_room:chat-room-leave", kwargs={"pk": chat_room.pk})
+        url = room_url("chat-room-leave", chat_room.pk)
         response = api_client.post(url)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_get_chat_room_list(self, api_client, authenticate_client, create_user, create_chat_room):
-        user1 = authenticate_client()
-        user2 = create_user("user2@example.com", "testpass123!")
-        user3 = create_user("user3@example.com", "testpass123!")
+    def test_update_chat_room_loads_and_writes_only_editable_columns(
+        self, api_client, authenticate_client, create_chat_room
+    ):
+        user = authenticate_client()
+        chat_room = create_chat_room(creator=user, description="유지되어야 할 설명")
 
-        room1 = create_chat_room(creator=user1, participants=[user2])
-        room2 = create_chat_room(creator=user2, participants=[user3])
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.patch(room_url("chat-room-detail", chat_room.pk), {"name": "새 이름"}, format="json")
 
-        url = reverse("chat_room:chat-room-list-create")
+        assert response.status_code == status.HTTP_200_OK
+        select_sql, update_sql = (q["sql"] for q in ctx.captured_queries if q["sql"].startswith(("SELECT", "UPDATE")))
+        # 안 읽은 메시지 수 서브쿼리, 설명 등 수정과 무관한 컬럼은 조회/저장하지 않음
+        assert "description" not in select_sql and "chat_message" not in select_sql
+        assert "description" not in update_sql
+        chat_room.refresh_from_db()
+        assert (chat_room.name, chat_room.description) == ("새 이름", "유지되어야 할 설명")
+
+    def test_get_chat_room_list(self, api_client, authenticate_client, read_only_chat_rooms):
+        authenticate_client(user=read_only_chat_rooms["users"]["member"])
+
+        url = LIST_URL
         response = api_client.get(url)
         assert response.status_code == status.HTTP_200_OK
         assert response.data["count"] == 1  # user1이 참여 중인 채팅방만 보여야 함
         assert len(response.data["results"]) == 1
 
-    def test_get_chat_room_detail(self, api_client, authenticate_client, create_chat_room):
-        user = authenticate_client()
-        chat_room = create_chat_room(creator=user)
+    def test_get_chat_room_detail(self, api_client, authenticate_client, read_only_chat_rooms):
+        authenticate_client(user=read_only_chat_rooms["users"]["member"])
+        chat_room = read_only_chat_rooms["member_room"]
 
-        url = reverse("chat_room:chat-room-detail", kwargs={"pk": chat_room.pk})
+        url = room_url("chat-room-detail", chat_room.pk)
         response = api_client.get(url)
         assert response.status_code == status.HTTP_200_OK
         assert response.data["name"] == chat_room.name
@@ -176,28 +338,152 @@ class TestChatRoomAPI:
         user = authenticate_client()
         chat_room = create_chat_room(creator=user, room_type=ChatRoom.RoomType.GROUP)
 
-        url = reverse("chat_room:chat-room-detail", kwargs={"pk": chat_room.pk})
+        url = room_url("chat-room-detail", chat_room.pk)
         updated_data = {"name": "Updated Chat Room Name", "is_active": False}
         response = api_client.patch(url, updated_data, format="json")
         assert response.status_code == status.HTTP_200_OK
 
-    def test_add_participants(self, api_client, authenticate_client, create_user, create_chat_room):
+    def test_add_participants(self, api_client, authenticate_client, create_users, create_chat_room):
         admin_user = authenticate_client(is_staff=True)
         chat_room = create_chat_room(creator=admin_user)
-        user3 = create_user("user3@example.com", "testpass123!")
-        user4 = create_user("user4@example.com", "testpass123!")
+        user3, user4 = create_users(2)
 
-        url = reverse("chat_room:chat-room-add-participants", kwargs={"pk": chat_room.pk})
+        url = room_url("chat-room-add-participants", chat_room.pk)
         data = {"user_ids": [user3.pk, user4.pk]}
         response = api_client.post(url, data, format="json")
         assert response.status_code == status.HTTP_200_OK
 
+    def test_add_participants_skips_existing_in_single_insert(
+        self, api_client, authenticate_client, create_user, create_chat_room
+    ):
+        admin_user = authenticate_client()
+        member = create_user()
+        chat_room = create_chat_room(creator=admin_user, participants=[member])
+        new_user = create_user()
+
+        url = room_url("chat-room-add-participants", chat_room.pk)
+        data = {"user_ids": [admin_user.pk, member.pk, new_user.pk, new_user.pk]}
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        inserts = [
+            q for q in ctx.captured_queries if q["sql"].startswith("INSERT") and "chatroomparticipant" in q["sql"]
+        ]
+        assert len(inserts) == 1
+        participants = ChatRoomParticipant.objects.filter(chat_room=chat_room)
+        assert participants.count() == 3
+        # 기존 참여자(방장)의 관리자 권한은 유지되어야 함
+        assert participants.get(user=admin_user).is_admin
+
+    def test_participant_admin_views_check_room_and_permission_in_one_query(
+        self, api_client, authenticate_client, create_user, create_chat_room, django_assert_num_queries
+    ):
+        member = create_user()
+        chat_room = create_chat_room(creator=create_user(), participants=[member])
+        authenticate_client(user=member)
+
+        # 첫 요청은 조회 1번, 이후 관리 요청은 캐시된 관리자 여부로 쿼리 없이 거절
+        for name, expected_queries in (("chat-room-add-participants", 1), ("chat-room-remove-participants", 0)):
+            with django_assert_num_queries(expected_queries):
+                response = api_client.post(room_url(name, chat_room.pk), {"user_ids": []}, format="json")
+            assert response.status_code == status.HTTP_403_FORBIDDEN
+            missing = api_client.post(room_url(name, 0), {"user_ids": []}, format="json")
+            assert missing.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_admin_check_cache_is_invalidated_on_admin_change(
+        self, api_client, authenticate_client, create_users, create_chat_room
+    ):
+        creator, co_admin, member = create_users(3)
+        chat_room = create_chat_room(creator=creator, participants=[co_admin, member])
+        add_url = room_url("chat-room-add-participants", chat_room.pk)
+        authenticate_client(user=co_admin)
+        assert api_client.post(add_url, {"user_ids": []}, format="json").status_code == status.HTTP_403_FORBIDDEN
+
+        # 관리자 지정(save)은 시그널로 캐시 무효화
+        participant = ChatRoomParticipant.objects.get(chat_room=chat_room, user=co_admin)
+        participant.is_admin = True
+        participant.save()
+        assert api_client.post(add_url, {"user_ids": []}, format="json").status_code == status.HTTP_200_OK
+
+        # 참여자 제거(QuerySet.update)로 관리자에서 빠지면 캐시와 무관하게 바로 권한을 잃음
+        authenticate_client(user=creator)
+        api_client.post(
+            room_url("chat-room-remove-participants", chat_room.pk), {"user_ids": [co_admin.pk]}, format="json"
+        )
+        authenticate_client(user=co_admin)
+        assert api_client.post(add_url, {"user_ids": []}, format="json").status_code == status.HTTP_403_FORBIDDEN
+
+    def test_removed_admin_cannot_manage_participants(
+        self, api_client, authenticate_client, create_users, create_chat_room
+    ):
+        creator, co_admin, member = create_users(3)
+        chat_room = create_chat_room(creator=creator, participants=[co_admin, member])
+        ChatRoomParticipant.objects.filter(chat_room=chat_room, user=co_admin).update(
+            is_admin=True, left_at=timezone.now()
+        )
+        authenticate_client(user=co_admin)
+
+        for name in ("chat-room-add-participants", "chat-room-remove-participants"):
+            response = api_client.post(room_url(name, chat_room.pk), {"user_ids": [member.pk]}, format="json")
+            assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert ChatRoomParticipant.objects.get(chat_room=chat_room, user=member).left_at is None
+
+    def test_add_participants_reactivates_removed_participant(
+        self, api_client, authenticate_client, create_users, create_chat_room
+    ):
+        admin_user, removed = create_users(2)
+        chat_room = create_chat_room(creator=admin_user, participants=[removed])
+        authenticate_client(user=admin_user)
+
+        api_client.post(
+            room_url("chat-room-remove-participants", chat_room.pk), {"user_ids": [removed.pk]}, format="json"
+        )
+        response = api_client.post(
+            room_url("chat-room-add-participants", chat_room.pk), {"user_ids": [removed.pk]}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert ChatRoomParticipant.objects.get(chat_room=chat_room, user=removed).left_at is None
+
+    def test_re_added_admin_does_not_regain_admin_rights(
+        self, api_client, authenticate_client, create_users, create_chat_room
+    ):
+        creator, co_admin, member = create_users(3)
+        chat_room = create_chat_room(creator=creator, participants=[co_admin, member])
+        ChatRoomParticipant.objects.filter(chat_room=chat_room, user=co_admin).update(is_admin=True)
+        authenticate_client(user=creator)
+        remove_url = room_url("chat-room-remove-participants", chat_room.pk)
+        add_url = room_url("chat-room-add-participants", chat_room.pk)
+
+        api_client.post(remove_url, {"user_ids": [co_admin.pk]}, format="json")
+        api_client.post(add_url, {"user_ids": [co_admin.pk]}, format="json")
+
+        participant = ChatRoomParticipant.objects.get(chat_room=chat_room, user=co_admin)
+        assert participant.left_at is None
+        assert not participant.is_admin
+        authenticate_client(user=co_admin)
+        assert api_client.post(remove_url, {"user_ids": [member.pk]}, format="json").status_code == 403
+
+    def test_rejoined_admin_does_not_regain_admin_rights(
+        self, api_client, authenticate_client, create_users, create_chat_room
+    ):
+        creator, co_admin = create_users(2)
+        chat_room = create_chat_room(creator=creator, participants=[co_admin])
+        ChatRoomParticipant.objects.filter(chat_room=chat_room, user=co_admin).update(
+            is_admin=True, left_at=timezone.now()
+        )
+        authenticate_client(user=co_admin)
+
+        assert api_client.post(room_url("chat-room-join", chat_room.pk)).status_code == 200
+        assert not ChatRoomParticipant.objects.get(chat_room=chat_room, user=co_admin).is_admin
+
     def test_remove_participants(self, api_client, authenticate_client, create_user, create_chat_room):
         admin_user = authenticate_client(is_staff=True)
         user_to_remove = create_user("user_rm@example.com", "testpass123!")
         chat_room = create_chat_room(creator=admin_user, participants=[user_to_remove])
 
-        url = reverse("chat_room:chat-room-remove-participants", kwargs={"pk": chat_room.pk})
+        url = room_url("chat-room-remove-participants", chat_room.pk)
         data = {"user_ids": [user_to_remove.pk]}
         response = api_client.post(url, data, format="json")
         assert response.status_code == status.HTTP_200_OK
@@ -208,73 +494,249 @@ class TestChatRoomAPI:
         chat_room = create_chat_room(creator=user1, participants=[user2])
 
         api_client.force_authenticate(user=user2)
-        url = reverse("chat_room:chat-room-mark-as-read", kwargs={"pk": chat_room.pk})
+        url = room_url("chat-room-mark-as-read", chat_room.pk)
         response = api_client.post(url)
         assert response.status_code == status.HTTP_200_OK
 
-    def test_filter_chat_room_by_room_type(self, api_client, authenticate_client, create_chat_room):
-        user1 = authenticate_client()
-        room_direct = create_chat_room(creator=user1, room_type=ChatRoom.RoomType.DIRECT, name="Direct Chat")
-        room_group = create_chat_room(creator=user1, room_type=ChatRoom.RoomType.GROUP, name="Group Chat")
+    def test_leave_and_mark_as_read_issue_single_update(
+        self, api_client, authenticate_client, create_user, create_chat_room, django_assert_num_queries
+    ):
+        member = create_user()
+        chat_room = create_chat_room(creator=create_user(), participants=[member])
+        authenticate_client(user=member)
+
+        with django_assert_num_queries(1):
+            response = api_client.post(room_url("chat-room-mark-as-read", chat_room.pk))
+        assert response.status_code == status.HTTP_200_OK
+        with django_assert_num_queries(1):
+            response = api_client.post(room_url("chat-room-leave", chat_room.pk))
+        assert response.status_code == status.HTTP_200_OK
+
+        participant = ChatRoomParticipant.objects.get(chat_room=chat_room, user=member)
+        assert participant.last_read_at is not None
+        assert participant.left_at is not None
+        # 퇴장 후에는 읽음 처리/재퇴장 모두 404
+        assert api_client.post(room_url("chat-room-mark-as-read", chat_room.pk)).status_code == 404
+        assert api_client.post(room_url("chat-room-leave", chat_room.pk)).status_code == 404
+
+    def test_chat_room_list_has_unread(
+        self, api_client, authenticate_client, create_user, create_chat_room, django_assert_max_num_queries
+    ):
+        user = authenticate_client()
+        other = create_user("unread_other@example.com", "testpass123!")
+        never_read_room = create_chat_room(creator=user, participants=[other])
+        read_room = create_chat_room(creator=user, participants=[other])
+        for room in (never_read_room, read_room):
+            ChatMessage.objects.create(chat_room=room, sender=other, content="old")
+        ChatRoomParticipant.objects.filter(chat_room=read_room, user=user).update(last_read_at=timezone.now())
+        ChatMessage.objects.create(chat_room=read_room, sender=other, content="new")
+        for _ in range(3):
+            create_chat_room(creator=user, participants=[other])
+
+        ChatMessage.objects.create(chat_room=read_room, sender=other, content="newer")
+
+        url = LIST_URL
+        # 채팅방 수와 무관하게 고정된 쿼리 수로 has_unread 계산 (room_participants는 목록에서 로드하지 않음)
+        with django_assert_max_num_queries(5):
+            response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        has_unread = {room["id"]: room["has_unread"] for room in response.data["results"]}
+        assert "unread_count" not in response.data["results"][0]
+        assert has_unread[never_read_room.id] is True
+        assert has_unread[read_room.id] is True
+        assert sum(has_unread.values()) == 2
+
+        detail_url = room_url("chat-room-detail", read_room.pk)
+        assert api_client.get(detail_url).data["unread_count"] == 2
+
+    def test_chat_room_detail_unread_count_for_never_read_and_non_participant(
+        self, api_client, authenticate_client, create_user, create_chat_room
+    ):
+        user = authenticate_client()
+        outsider = create_user("unread_outsider@example.com", "testpass123!")
+        chat_room = create_chat_room(creator=user)
+        for content in ("a", "b"):
+            ChatMessage.objects.create(chat_room=chat_room, sender=user, content=content)
+        url = room_url("chat-room-detail", chat_room.pk)
+
+        # 한 번도 읽지 않은 참여자는 전체 메시지, 참여자가 아니면 0
+        assert api_client.get(url).data["unread_count"] == 2
+        api_client.force_authenticate(user=outsider)
+        assert api_client.get(url).data["unread_count"] == 0
+
+    def test_unread_count_without_annotation_uses_prefetched_participants(
+        self, create_users, create_chat_room, django_assert_num_queries
+    ):
+        user, other = create_users(2)
+        chat_room = create_chat_room(creator=user, participants=[other])
+        ChatMessage.objects.create(chat_room=chat_room, sender=other, content="hello")
+        chat_room = ChatRoom.objects.prefetch_related("room_participants").get(pk=chat_room.pk)
+        request = APIRequestFactory().get("/")
+        request.user = user
+        serializer = ChatRoomSerializer(context={"request": request})
+
+        # 참여자 조회 없이 메시지 COUNT 한 번만 실행
+        with django_assert_num_queries(1):
+            assert serializer.get_unread_count(chat_room) == 1
+
+    def test_chat_room_list_serializes_each_user_once(
+        self, api_client, authenticate_client, create_user, create_chat_room
+    ):
+        user = authenticate_client()
+        other = create_user("memo_other@example.com", "testpass123!")
+        for _ in range(2):
+            create_chat_room(creator=user, participants=[other])
+        create_chat_room(creator=other, participants=[user])
+
+        url = LIST_URL
+        with patch.object(
+            UserSerializer, "to_representation", autospec=True, side_effect=UserSerializer.to_representation
+        ) as mocked:
+            response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) == 3
+        # 여러 채팅방의 created_by로 반복해서 나오는 사용자는 요청당 한 번만 직렬화
+        assert sorted(call.args[1].pk for call in mocked.call_args_list) == sorted([user.pk, other.pk])
+
+    def test_chat_room_list_returns_participant_nicknames(
+        self, api_client, authenticate_client, create_user, create_chat_room
+    ):
+        user = authenticate_client()
+        other = create_user("pk_list_other@example.com", "testpass123!")
+        chat_room = create_chat_room(creator=user, participants=[other])
+        chat_room.participants.add(user, other)
+
+        list_response = api_client.get(LIST_URL)
+        detail_response = api_client.get(room_url("chat-room-detail", chat_room.pk))
 
-        url = reverse("chat_room:chat-room-list-create") + f"?room_type={ChatRoom.RoomType.DIRECT}"
+        # 목록은 참여자 닉네임만, 상세는 참여자 정보까지 출력
+        assert sorted(list_response.data["results"][0]["participants"]) == sorted([user.nickname, other.nickname])
+        assert sorted(p["id"] for p in detail_response.data["participants"]) == sorted([user.pk, other.pk])
+
+    def test_chat_room_list_nicknames_exclude_departed_participants(
+        self, api_client, authenticate_client, create_users, create_chat_room
+    ):
+        user = authenticate_client()
+        stayed, removed, joined = create_users(3)
+        chat_room = create_chat_room(creator=user, participants=[stayed, removed])
+        # participants(M2M)는 생성 시점 값 그대로라 퇴장/참여가 반영되지 않음
+        chat_room.participants.add(user, stayed, removed)
+        ChatRoomParticipant.objects.filter(chat_room=chat_room, user=removed).update(left_at=timezone.now())
+        ChatRoomParticipant.objects.create(chat_room=chat_room, user=joined)
+
+        response = api_client.get(LIST_URL)
+
+        assert sorted(response.data["results"][0]["participants"]) == sorted(
+            [user.nickname, stayed.nickname, joined.nickname]
+        )
+
+    def test_chat_room_list_returns_active_participant_count(
+        self, api_client, authenticate_client, create_users, create_chat_room
+    ):
+        user = authenticate_client()
+        stayed, left = create_users(2)
+        chat_room = create_chat_room(creator=user, participants=[stayed, left])
+        ChatRoomParticipant.objects.filter(chat_room=chat_room, user=left).update(left_at=timezone.now())
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.get(LIST_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 1
+        assert not any("DISTINCT" in q["sql"] for q in ctx.captured_queries)
+        room = response.data["results"][0]
+        # 목록은 참여자별 상세 대신 퇴장하지 않은 참여자 수만 반환
+        assert room["participant_count"] == 2
+        assert "room_participants" not in room
+
+        # 퇴장한 참여자의 목록에는 나오지 않음
+        authenticate_client(user=left)
+        assert api_client.get(LIST_URL).data["count"] == 0
+
+    def test_chat_room_detail_query_count_does_not_grow_with_participants(
+        self, api_client, authenticate_client, create_users, create_chat_room, django_assert_max_num_queries
+    ):
+        user = authenticate_client()
+        others = create_users(5)
+        chat_room = create_chat_room(creator=user, participants=others)
+        chat_room.participants.add(user, *others)
+
+        url = room_url("chat-room-detail", chat_room.pk)
+        with django_assert_max_num_queries(8):
+            response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["room_participants"]) == 6
+
+    def test_unread_count_is_zero_for_anonymous_request(self, create_user, create_chat_room, django_assert_num_queries):
+        user = create_user("unread_anon@example.com", "testpass123!")
+        chat_room = create_chat_room(creator=user)
+        ChatMessage.objects.create(chat_room=chat_room, sender=user, content="hello")
+        request = APIRequestFactory().get("/")
+        request.user = AnonymousUser()
+        serializer = ChatRoomSerializer(context={"request": request})
+
+        with django_assert_num_queries(0):
+            assert serializer.get_unread_count(chat_room) == 0
+
+    def test_filter_chat_room_by_room_type(self, api_client, authenticate_client, read_only_chat_rooms):
+        authenticate_client(user=read_only_chat_rooms["users"]["type"])
+
+        url = LIST_URL + f"?room_type={ChatRoom.RoomType.DIRECT}"
         response = api_client.get(url)
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 1
         assert response.data["results"][0]["room_type"] == ChatRoom.RoomType.DIRECT
 
-    def test_filter_chat_room_by_is_active(self, api_client, authenticate_client, create_chat_room):
-        user1 = authenticate_client()
-        room_active = create_chat_room(creator=user1, is_active=True, name="Active Room")
-        room_inactive = create_chat_room(creator=user1, is_active=False, name="Inactive Room")
+    def test_filter_chat_room_by_is_active(self, api_client, authenticate_client, read_only_chat_rooms):
+        authenticate_client(user=read_only_chat_rooms["users"]["active"])
 
-        url = reverse("chat_room:chat-room-list-create") + "?is_active=true"
+        url = LIST_URL + "?is_active=true"
         response = api_client.get(url)
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 1
         assert response.data["results"][0]["is_active"] == True
 
-    def test_search_chat_room_by_name(self, api_client, authenticate_client, create_chat_room):
-        user1 = authenticate_client()
-        room_alpha = create_chat_room(creator=user1, name="Alpha Chat Room")
-        room_beta = create_chat_room(creator=user1, name="Beta Chat Room")
+    def test_search_chat_room_by_name(self, api_client, authenticate_client, read_only_chat_rooms):
+        authenticate_client(user=read_only_chat_rooms["users"]["search"])
 
-        url = reverse("chat_room:chat-room-list-create") + "?search=Alpha"
+        url = LIST_URL + "?search=Alpha"
         response = api_client.get(url)
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 1
         assert "Alpha" in response.data["results"][0]["name"]
 
-    def test_sort_chat_room_by_created_at(self, api_client, authenticate_client, create_chat_room):
-        user1 = authenticate_client()
-        room_old = create_chat_room(creator=user1, name="Old Room", created_at=timezone.now() - timedelta(days=2))
-        room_new = create_chat_room(creator=user1, name="New Room", created_at=timezone.now() - timedelta(days=1))
+    @pytest.mark.parametrize(
+        "ordering, expected_names",
+        [("created_at", ["Old Room", "New Room"]), ("-created_at", ["New Room", "Old Room"])],
+    )
+    def test_sort_chat_room_by_created_at(
+        self, api_client, authenticate_client, read_only_chat_rooms, ordering, expected_names
+    ):
+        authenticate_client(user=read_only_chat_rooms["users"]["sort"])
 
-        url = reverse("chat_room:chat-room-list-create") + "?ordering=created_at"
-        response = api_client.get(url)
+        response = api_client.get(LIST_URL, {"ordering": ordering})
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data["results"]) == 2
-        assert response.data["results"][0]["name"] == "Old Room"
-        assert response.data["results"][1]["name"] == "New Room"
+        assert [room["name"] for room in response.data["results"]] == expected_names
+
+    def test_unauthorized_access_detail(self, api_client, read_only_chat_rooms):
+        url = room_url("chat-room-detail", read_only_chat_rooms["member_room"].pk)
+        response = api_client.get(url)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    def test_unauthorized_access_create(self, api_client, create_user):
-        user1 = create_user("unauth1@example.com", "testpass123!")
-        user2 = create_user("unauth2@example.com", "testpass123!")
 
-        url = reverse("chat_room:chat-room-list-create")
+class TestChatRoomAnonymousAPI:
+    """인증 단계에서 401로 끝나 DB를 사용하지 않는 테스트 (django_db 트랜잭션 래핑 없음)"""
+
+    def test_unauthorized_access_create(self, api_client):
+        url = LIST_URL
         data = {
             "name": "New Chat Room",
             "max_participants": 5,
             "description": "Test Description",
-            "participant_ids": [user2.pk],
+            "participant_ids": [1, 2],
         }
         response = api_client.post(url, data, format="json")
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-    def test_unauthorized_access_detail(self, api_client, create_user, create_chat_room):
-        user = create_user("unauth_detail@example.com", "testpass123!")
-        chat_room = create_chat_room(creator=user)
-
-        url = reverse("chat_room:chat-room-detail", kwargs={"pk": chat_room.pk})
-        response = api_client.get(url)
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -1,4 +1,10 @@
-from django.db.models import Count
+from datetime import datetime
+from datetime import timezone as dt_timezone
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, DateTimeField, Exists, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_yasg import openapi
@@ -7,17 +13,118 @@ from rest_framework import filters, generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.chat_message.models import ChatMessage
+from utils.cache_helpers import invalidate_chat_room_admin_cache
+from utils.cache_keys import CHAT_ROOM_ADMIN_CACHE_TIMEOUT, get_chat_room_admin_cache_key
 from utils.response import BaseResponseMixin
 
 from .models import ChatRoom, ChatRoomParticipant
 from .serializers import (
     ChatRoomCreateSerializer,
+    ChatRoomListSerializer,
     ChatRoomParticipantAddSerializer,
     ChatRoomParticipantRemoveSerializer,
     ChatRoomSerializer,
     ChatRoomUpdateSerializer,
 )
 
+# 한 번도 읽지 않은 참여자의 기준 시각 (모든 메시지가 안 읽은 메시지)
+UNREAD_SINCE_DEFAULT = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def _room_message_count(**filters):
+    """채팅방별 메시지 수를 상관 서브쿼리로 계산합니다. (메시지가 없으면 0)"""
+    messages = (
+        ChatMessage.objects.filter(chat_room=OuterRef("pk"), **filters)
+        .order_by()
+        .values("chat_room")
+        .annotate(count=Count("pk"))
+        .values("count")[:1]
+    )
+    return Coalesce(Subquery(messages), Value(0))
+
+
+def _room_participant_count():
+    """채팅방별 현재 참여자 수(퇴장하지 않은 참여자)를 상관 서브쿼리로 계산합니다."""
+    participants = (
+        ChatRoomParticipant.objects.filter(chat_room=OuterRef("pk"), left_at__isnull=True)
+        .order_by()
+        .values("chat_room")
+        .annotate(count=Count("pk"))
+        .values("count")[:1]
+    )
+    return Coalesce(Subquery(participants), Value(0))
+
+
+def _room_has_messages(**filters):
+    """채팅방에 조건에 맞는 메시지가 있는지 EXISTS로 확인합니다. (첫 행에서 탐색 중단)"""
+    return Exists(ChatMessage.objects.filter(chat_room=OuterRef("pk"), **filters))
+
+
+def _annotate_unread(queryset, user, name, unread):
+    """
+    요청 사용자 기준 안 읽은 메시지 주석(name)을 채팅방 쿼리와 같은 SELECT에서 계산합니다.
+    한 번도 읽지 않았으면 last_read_at 대신 UNREAD_SINCE_DEFAULT를 써서 전체 메시지를 하나의 조건으로 처리하고,
+    참여자가 아니면 기준 시각이 NULL이라 조건에 맞는 메시지가 없습니다. ((chat_room, timestamp) 인덱스 사용)
+    """
+    read_since = (
+        ChatRoomParticipant.objects.filter(chat_room=OuterRef("pk"), user_id=user.pk)
+        .annotate(read_since=Coalesce("last_read_at", Value(UNREAD_SINCE_DEFAULT, output_field=DateTimeField())))
+        .values("read_since")[:1]
+    )
+    return queryset.annotate(
+        my_last_read=Subquery(read_since),
+        **{name: unread(timestamp__gt=OuterRef("my_last_read"))},
+    )
+
+
+def with_unread_count(queryset, user):
+    """상세 조회용: 안 읽은 메시지 수(unread_count)"""
+    return _annotate_unread(queryset, user, "unread_count", _room_message_count)
+
+
+def with_has_unread(queryset, user):
+    """목록 조회용: 안 읽은 메시지 존재 여부(has_unread). COUNT 대신 EXISTS라 전체 메시지를 세지 않음"""
+    return _annotate_unread(queryset, user, "has_unread", _room_has_messages)
+
+
+def _room_admin_error(request, pk, message):
+    """
+    채팅방 존재 여부와 요청 사용자의 관리자 여부를 한 번의 쿼리로 확인합니다.
+    채팅방이 없으면 404, 관리자가 아니면(퇴장/제거된 관리자 포함) 403 응답을, 관리자면 None을 반환합니다.
+    존재하는 채팅방의 관리자 여부는 잠시 캐시해 연속된 관리 요청에서는 쿼리 없이 확인합니다.
+    """
+    cache_key = get_chat_room_admin_cache_key(pk, request.user.pk)
+    is_admin = cache.get(cache_key)
+    if is_admin is None:
+        is_admin = _query_room_admin(pk, request.user.pk)
+        if is_admin is not None:
+            cache.set(cache_key, is_admin, CHAT_ROOM_ADMIN_CACHE_TIMEOUT)
+    if is_admin is None:
+        return Response(
+            {"error": "채팅방을 찾을 수 없습니다."},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+    if not is_admin:
+        return Response({"error": message}, status=status.HTTP_403_FORBIDDEN)
+    return None
+
+
+def _query_room_admin(pk, user_id):
+    """채팅방이 없으면 None, 있으면 사용자가 현재 관리자(퇴장하지 않은)인지를 반환합니다."""
+    return (
+        ChatRoom.objects.filter(pk=pk)
+        .annotate(
+            is_admin=Exists(
+                ChatRoomParticipant.objects.filter(
+                    chat_room=OuterRef("pk"), user_id=user_id, is_admin=True, left_at__isnull=True
+                )
+            )
+        )
+        .values_list("is_admin", flat=True)
+        .first()
+    )
+
 
 class ChatRoomListCreateView(BaseResponseMixin, generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
@@ -33,17 +140,14 @@ class ChatRoomListCreateView(BaseResponseMixin, generics.ListCreateAPIView):
     def get_queryset(self):
         if getattr(self, "swagger_fake_view", False):
             return ChatRoom.objects.none()
-        return (
-            ChatRoom.objects.filter(
-                room_participants__user=self.request.user,
-                room_participants__left_at__isnull=True,
-            )
-            .select_related("created_by")
-            .prefetch_related("participants", "room_participants")
-            .only("id", "name", "created_by", "created_at")
-            .annotate(participant_count=Count("participants"))
-            .distinct()
+        # 참여 여부는 JOIN 대신 EXISTS로 확인 (채팅방 행이 중복되지 않아 DISTINCT 불필요)
+        is_member = ChatRoomParticipant.objects.filter(
+            chat_room=OuterRef("pk"), user_id=self.request.user.pk, left_at__isnull=True
         )
+        queryset = ChatRoom.objects.filter(Exists(is_member)).annotate(participant_count=_room_participant_count())
+        # 직렬화에 필요한 관계/컬럼 로딩은 시리얼라이저가 정의
+        queryset = ChatRoomListSerializer.setup_eager_loading(queryset)
+        return with_has_unread(queryset, self.request.user)
 
     @swagger_auto_schema(
         operation_summary="채팅방 목록 조회",
@@ -72,18 +176,22 @@ class ChatRoomListCreateView(BaseResponseMixin, generics.ListCreateAPIView):
         """채팅방 생성"""
         return super().post(request, *args, **kwargs)
 
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        # 응답 안에서 같은 사용자는 한 번만 직렬화 (MemoizedUserSerializer 참고)
+        context["serialized_users"] = {}
+        return context
+
     def get_serializer_class(self):
         if self.request.method == "POST":
             return ChatRoomCreateSerializer
-        return ChatRoomSerializer
+        return ChatRoomListSerializer
 
     def perform_create(self, serializer):
         chat_room = serializer.save(created_by=self.request.user)
         # 생성 후 상세 정보를 반환하기 위해 ChatRoomSerializer 사용
-        response_serializer = ChatRoomSerializer(chat_room, context={"request": self.request})
-        self.logger.info(
-            f"ChatRoom created by {self.request.user.email if self.request.user.is_authenticated else 'anonymous'}"
-        )
+        response_serializer = ChatRoomSerializer(chat_room, context=self.get_serializer_context())
+        self.logger.info("ChatRoom created by %s", self.request.user.email)
         return self.success(data=response_serializer.data, message="채팅방이 생성되었습니다.", status=201)
 
     def create(self, request, *args, **kwargs):
@@ -99,7 +207,18 @@ class ChatRoomDetailView(generics.RetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if getattr(self, "swagger_fake_view", False):
             return ChatRoom.objects.none()
-        return ChatRoom.objects.all()
+        queryset = ChatRoom.objects.all()
+        if self.request.method != "GET":
+            # 수정/삭제는 권한 확인(created_by)과 수정 가능한 컬럼만 로드 (save 시에도 로드한 컬럼만 UPDATE)
+            return queryset.only("id", "created_by", "name", "is_active", "updated_at")
+        queryset = ChatRoomSerializer.setup_eager_loading(queryset)
+        return with_unread_count(queryset, self.request.user)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        # 응답 안에서 같은 사용자는 한 번만 직렬화 (MemoizedUserSerializer 참고)
+        context["serialized_users"] = {}
+        return context
 
     def get_serializer_class(self):
         if self.request.method in ["PUT", "PATCH"]:
@@ -110,7 +229,8 @@ class ChatRoomDetailView(generics.RetrieveUpdateDestroyAPIView):
         super().check_object_permissions(request, obj)
         # 수정 또는 삭제 시에는 creator인지 확인
         if request.method in ["PUT", "PATCH", "DELETE"]:
-            if obj.created_by != request.user:
+            # created_by 대신 created_by_id를 비교해 생성자 User 조회 없이 확인
+            if obj.created_by_id != request.user.pk:
                 self.permission_denied(request, message="채팅방 생성자만 수정/삭제할 수 있습니다.")
 
     @swagger_auto_schema(
@@ -164,127 +284,122 @@ class ChatRoomParticipantAddView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request, pk):
-        try:
-            chat_room = ChatRoom.objects.get(pk=pk)
-            # 관리자 권한 확인
-            if not chat_room.room_participants.filter(user=request.user, is_admin=True).exists():
-                return Response(
-                    {"error": "관리자만 참여자를 추가할 수 있습니다."},
-                    status=status.HTTP_403_FORBIDDEN,
+        # 채팅방 존재 및 관리자 권한 확인
+        error = _room_admin_error(request, pk, "관리자만 참여자를 추가할 수 있습니다.")
+        if error:
+            return error
+
+        serializer = ChatRoomParticipantAddSerializer(data=request.data)
+        if serializer.is_valid():
+            user_ids = dict.fromkeys(serializer.validated_data["user_ids"])
+            with transaction.atomic():
+                # 퇴장/제거됐던 사용자는 기존 행을 새 참여자와 같은 상태로 다시 활성화 (이전 관리자 권한은 복원하지 않음)
+                ChatRoomParticipant.objects.filter(chat_room_id=pk, user_id__in=user_ids, left_at__isnull=False).update(
+                    left_at=None, joined_at=timezone.now(), is_admin=False
                 )
-
-            serializer = ChatRoomParticipantAddSerializer(data=request.data)
-            if serializer.is_valid():
-                user_ids = serializer.validated_data["user_ids"]
-                for user_id in user_ids:
-                    ChatRoomParticipant.objects.get_or_create(
-                        chat_room=chat_room,
-                        user_id=user_id,
-                        defaults={"is_admin": False},
-                    )
-                return Response({"message": "참여자가 추가되었습니다."})
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        except ChatRoom.DoesNotExist:
-            return Response(
-                {"error": "채팅방을 찾을 수 없습니다."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
+                # 나머지 중 이미 행이 있는 사용자는 (chat_room, user) unique 제약으로 건너뛰고 한 번의 INSERT로 추가
+                ChatRoomParticipant.objects.bulk_create(
+                    [ChatRoomParticipant(chat_room_id=pk, user_id=user_id, is_admin=False) for user_id in user_ids],
+                    ignore_conflicts=True,
+                )
+            return Response({"message": "참여자가 추가되었습니다."})
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
 class ChatRoomParticipantRemoveView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request, pk):
-        try:
-            chat_room = ChatRoom.objects.get(pk=pk)
-            # 관리자 권한 확인
-            if not chat_room.room_participants.filter(user=request.user, is_admin=True).exists():
-                return Response(
-                    {"error": "관리자만 참여자를 제거할 수 있습니다."},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
-
-            serializer = ChatRoomParticipantRemoveSerializer(data=request.data)
-            if serializer.is_valid():
-                user_ids = serializer.validated_data["user_ids"]
-                ChatRoomParticipant.objects.filter(chat_room=chat_room, user_id__in=user_ids).update(
-                    left_at=timezone.now(),
-                )
-                return Response({"message": "참여자가 제거되었습니다."})
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        except ChatRoom.DoesNotExist:
-            return Response(
-                {"error": "채팅방을 찾을 수 없습니다."},
-                status=status.HTTP_404_NOT_FOUND,
+        # 채팅방 존재 및 관리자 권한 확인
+        error = _room_admin_error(request, pk, "관리자만 참여자를 제거할 수 있습니다.")
+        if error:
+            return error
+
+        serializer = ChatRoomParticipantRemoveSerializer(data=request.data)
+        if serializer.is_valid():
+            user_ids = serializer.validated_data["user_ids"]
+            ChatRoomParticipant.objects.filter(chat_room_id=pk, user_id__in=user_ids).update(
+                left_at=timezone.now(),
             )
+            # 제거된 관리자가 캐시로 관리 권한을 유지하지 않도록 무효화 (QuerySet.update는 시그널을 보내지 않음)
+            invalidate_chat_room_admin_cache(pk, user_ids)
+            return Response({"message": "참여자가 제거되었습니다."})
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
 class ChatRoomLeaveView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request, pk):
-        try:
-            chat_room = ChatRoom.objects.get(pk=pk)
-
-            try:
-                participant = chat_room.room_participants.get(user=request.user, left_at__isnull=True)
-                # 방장은 나갈 수 없음
-                if participant.is_admin:
-                    return Response({"error": "방장은 채팅방을 나갈 수 없습니다."}, status=status.HTTP_400_BAD_REQUEST)
-                participant.left_at = timezone.now()
-                participant.save()
-                return Response({"message": "채팅방을 나갔습니다."})
-            except ChatRoomParticipant.DoesNotExist:
-                return Response(
-                    {"error": "채팅방 참여자가 아닙니다."},
-                    status=status.HTTP_404_NOT_FOUND,
-                )
-        except (ChatRoom.DoesNotExist, ChatRoomParticipant.DoesNotExist):
+        participation = ChatRoomParticipant.objects.filter(chat_room_id=pk, user=request.user, left_at__isnull=True)
+        # 방장이 아닌 참여자면 조회 없이 UPDATE 한 번으로 퇴장 처리
+        if participation.filter(is_admin=False).update(left_at=timezone.now()):
+            return Response({"message": "채팅방을 나갔습니다."})
+
+        # 퇴장하지 못한 경우에만 원인을 조회
+        if participation.exists():
+            # 방장은 나갈 수 없음
+            return Response({"error": "방장은 채팅방을 나갈 수 없습니다."}, status=status.HTTP_400_BAD_REQUEST)
+        if ChatRoom.objects.filter(pk=pk).exists():
             return Response(
-                {"error": "채팅방을 찾을 수 없습니다."},
+                {"error": "채팅방 참여자가 아닙니다."},
                 status=status.HTTP_404_NOT_FOUND,
             )
+        return Response(
+            {"error": "채팅방을 찾을 수 없습니다."},
+            status=status.HTTP_404_NOT_FOUND,
+        )
 
 
 class ChatRoomMarkAsReadView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request, pk):
-        try:
-            chat_room = ChatRoom.objects.get(pk=pk)
-            participant = chat_room.room_participants.get(user=request.user, left_at__isnull=True)
-            participant.last_read_at = timezone.now()
-            participant.save()
+        # 참여자 행을 가져오지 않고 last_read_at만 UPDATE (채팅방이 없거나 참여자가 아니면 0건)
+        updated = ChatRoomParticipant.objects.filter(chat_room_id=pk, user=request.user, left_at__isnull=True).update(
+            last_read_at=timezone.now()
+        )
+        if updated:
             return Response({"message": "모든 메시지를 읽음 처리했습니다."})
-        except (ChatRoom.DoesNotExist, ChatRoomParticipant.DoesNotExist):
-            return Response(
-                {"error": "채팅방을 찾을 수 없습니다."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
+        return Response(
+            {"error": "채팅방을 찾을 수 없습니다."},
+            status=status.HTTP_404_NOT_FOUND,
+        )
 
 
 class ChatRoomJoinView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request, pk):
-        try:
-            chat_room = ChatRoom.objects.get(pk=pk)
+        my_participation = ChatRoomParticipant.objects.filter(chat_room=OuterRef("pk"), user_id=request.user.pk)
+        with transaction.atomic():
+            # 참여 여부/현재 참여자 수를 채팅방 행 잠금과 함께 한 번에 조회 (동시 참여 시 정원 초과 방지)
+            # 존재하지 않는 pk는 .get()의 예외 처리 대신 None으로 받아 바로 404 응답
+            chat_room = (
+                ChatRoom.objects.select_for_update()
+                .only("id", "max_participants")
+                .annotate(
+                    active_count=_room_participant_count(),
+                    is_participant=Exists(my_participation.filter(left_at__isnull=True)),
+                    has_left=Exists(my_participation.filter(left_at__isnull=False)),
+                )
+                .filter(pk=pk)
+                .first()
+            )
 
-            # 이미 참여중인지 확인
-            if chat_room.room_participants.filter(user=request.user, left_at__isnull=True).exists():
+            if chat_room is None:
+                return Response({"error": "채팅방을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+            if chat_room.is_participant:
                 return Response({"error": "이미 참여 중인 채팅방입니다."}, status=status.HTTP_400_BAD_REQUEST)
-
-            # 최대 참여자 수 확인
-            current_participants = chat_room.room_participants.filter(left_at__isnull=True).count()
-            if current_participants >= chat_room.max_participants:
+            if chat_room.active_count >= chat_room.max_participants:
                 return Response({"error": "채팅방이 가득 찼습니다."}, status=status.HTTP_400_BAD_REQUEST)
 
-            # 참여자 추가
-            ChatRoomParticipant.objects.create(chat_room=chat_room, user=request.user, is_admin=False)
+            # 퇴장했던 사용자는 (chat_room, user) unique 제약이 있으므로 기존 행을 일반 참여자로 다시 활성화
+            if chat_room.has_left:
+                ChatRoomParticipant.objects.filter(chat_room=chat_room, user=request.user).update(
+                    left_at=None, joined_at=timezone.now(), is_admin=False
+                )
+            else:
+                ChatRoomParticipant.objects.create(chat_room=chat_room, user=request.user, is_admin=False)
 
-            return Response({"message": "채팅방에 참여했습니다."})
-        except ChatRoom.DoesNotExist:
-            return Response(
-                {"error": "채팅방을 찾을 수 없습니다."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
+        return Response({"message": "채팅방에 참여했습니다."})
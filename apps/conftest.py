@@ -12,14 +12,16 @@ import factory
 import pytest
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.core.cache import cache
 from django.urls import reverse
 from django.utils import timezone
 from faker import Faker
 from rest_framework.test import APIClient
-from rest_framework.throttling import AnonRateThrottle, UserRateThrottle
+from rest_framework.throttling import SimpleRateThrottle
+from rest_framework_simplejwt.tokens import AccessToken
 
-from apps.chat_room.models import ChatRoom
+from apps.chat_room.models import ChatRoom, ChatRoomParticipant
 from apps.cs_post.models import CSPost
 from apps.order.models import Order
 from apps.preset_message.models import PresetMessage
@@ -41,9 +43,9 @@ TESTING_CACHE_CONFIG = {
 }
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def override_cache_settings():
-    """캐시 설정을 테스트용으로 오버라이드합니다."""
+    """캐시 설정을 테스트용으로 오버라이드합니다. (세션 동안 한 번만 적용)"""
     original_cache = getattr(settings, "CACHES", {})
     settings.CACHES = TESTING_CACHE_CONFIG
     yield
@@ -52,38 +54,22 @@ def override_cache_settings():
 
 @pytest.fixture(autouse=True)
 def clear_cache():
-    """각 테스트 전후로 캐시를 초기화합니다."""
-    cache.clear()
-    yield
+    """각 테스트 전에 캐시를 초기화합니다."""
     cache.clear()
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def disable_throttling():
-    """테스트 환경에서 모든 Throttling을 비활성화합니다."""
-    throttle_classes = [
-        UserRateThrottle,
-        AnonRateThrottle,
-        LoginAttemptThrottle,
-    ]
-
-    patches = []
-    for throttle_class in throttle_classes:
-        # allow_request와 get_rate만 패치
-        patches.extend(
-            [
-                patch.object(throttle_class, "allow_request", return_value=True),
-                patch.object(throttle_class, "get_rate", return_value=None),
-            ]
-        )
-
-    for p in patches:
-        p.start()
-
-    yield
-
-    for p in patches:
-        p.stop()
+    """
+    테스트 환경에서 모든 Throttling을 비활성화합니다.
+    테스트마다 patch를 시작/종료하지 않고 세션 동안 한 번만 패치합니다.
+    - SimpleRateThrottle.get_rate가 None이면 allow_request가 항상 통과 (User/Anon/Chat/Order 등 하위 클래스 포함)
+    - LoginAttemptThrottle은 allow_request를 직접 구현하므로 별도로 패치
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(SimpleRateThrottle, "get_rate", lambda self: None)
+        monkeypatch.setattr(LoginAttemptThrottle, "allow_request", lambda self, request, view: True)
+        yield
 
 
 @pytest.fixture
@@ -92,6 +78,29 @@ def api_client():
     return client
 
 
+@pytest.fixture(scope="session")
+def jwt_access_tokens():
+    """세션 동안 발급한 access token 캐시 {user.pk: token}"""
+    return {}
+
+
+@pytest.fixture
+def authenticate_client_cached(api_client, jwt_access_tokens):
+    """
+    로그인 API 없이 JWT access token을 발급해 Authorization 헤더로 인증합니다. (JWTAuthentication 경로는 그대로 사용)
+    토큰은 user_id 클레임만 담으므로 같은 pk의 사용자에게는 세션 동안 캐시된 토큰을 재사용합니다.
+    """
+
+    def _authenticate_client_cached(user):
+        token = jwt_access_tokens.get(user.pk)
+        if token is None:
+            token = jwt_access_tokens[user.pk] = str(AccessToken.for_user(user))
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        return user
+
+    return _authenticate_client_cached
+
+
 @pytest.fixture
 def auth_headers(user_factory):
     """인증에 필요한 헤더를 반환하는 fixture"""
@@ -175,19 +184,28 @@ def authenticated_client(user_factory) -> Callable[..., Tuple[APIClient, object]
 @pytest.fixture
 def create_chat_room(user_factory):
     """
-    채팅방을 생성하는 fixture (creator 필수)
+    채팅방을 생성하는 fixture (creator 미지정 시 자동 생성)
+    creator는 관리자로, participants는 일반 참여자로 한 번의 bulk INSERT로 등록합니다.
     """
 
-    def _create_chat_room(creator=None, **kwargs):
+    def _create_chat_room(creator=None, participants=None, room_type=ChatRoom.RoomType.GROUP, **kwargs):
         if creator is None:
             creator = user_factory()
-        chat_room_data = {
-            "title": kwargs.get("title", fake.sentence()),
-            "description": kwargs.get("description", fake.text()),
-            "creator": creator,
+        chat_room = ChatRoom.objects.create(
+            name=kwargs.pop("name", f"Test Chat Room {timezone.now().timestamp()}"),
+            room_type=room_type,
+            created_by=creator,
             **kwargs,
-        }
-        return ChatRoom.objects.create(**chat_room_data)
+        )
+        now = timezone.now()
+        to_create = [ChatRoomParticipant(chat_room=chat_room, user=creator, is_admin=True, joined_at=now)]
+        to_create += [
+            ChatRoomParticipant(chat_room=chat_room, user=participant_user, joined_at=now)
+            for participant_user in participants or []
+            if participant_user != creator
+        ]
+        ChatRoomParticipant.objects.bulk_create(to_create)
+        return chat_room
 
     return _create_chat_room
 
@@ -289,6 +307,34 @@ def create_user(user_factory):
     return _create_user
 
 
+@pytest.fixture
+def create_users(db):
+    """
+    사용자 n명을 한 번의 bulk INSERT로 생성합니다. 비밀번호는 한 번만 해싱해 모든 사용자에 공유합니다.
+    예시: user1, user2 = create_users(2)
+    """
+
+    def _create_users(n, password="testpass123!", **kwargs):
+        hashed_password = make_password(password)
+        prefix = uuid.uuid4().hex[:8]
+        User = get_user_model()
+        return User.objects.bulk_create(
+            [
+                User(
+                    email=f"user_{prefix}_{i}@example.com",
+                    nickname=f"testuser_{prefix}_{i}",
+                    password=hashed_password,
+                    is_active=True,
+                    is_email_verified=True,
+                    **kwargs,
+                )
+                for i in range(n)
+            ]
+        )
+
+    return _create_users
+
+
 @pytest.fixture
 def another_user(user_factory):
     """채팅방 등에서 인증되지 않은 다른 사용자 fixture"""
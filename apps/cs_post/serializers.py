@@ -1,13 +1,32 @@
 from django.conf import settings
 from rest_framework import serializers
 
-from apps.user.serializers import UserSerializer
+from apps.user.serializers import USER_SERIALIZER_COLUMNS, UserSerializer
 from utils.profanity_filter import ProfanityFilter
 
 from .models import CSPost
 
 profanity_filter = ProfanityFilter()
 
+# 문의 유형/상태 선택지 (정적 값이라 모듈 로드 시 한 번만 생성해 목록/상세 응답에 그대로 사용)
+CHOICE_OPTIONS = {
+    "type_choices": [{"value": value, "display": display} for value, display in CSPost.POST_TYPE_CHOICES],
+    "status_choices": [{"value": value, "display": display} for value, display in CSPost.STATUS_CHOICES],
+}
+
+# CSPostSerializer가 읽는 CSPost 컬럼
+CS_POST_COLUMNS = (
+    "id",
+    "author",
+    "post_type",
+    "title",
+    "content",
+    "status",
+    "attachment",
+    "created_at",
+    "updated_at",
+)
+
 
 class CSPostSerializer(serializers.ModelSerializer):
     author = UserSerializer(read_only=True)
@@ -33,23 +52,22 @@ class CSPostSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ("author", "created_at", "updated_at", "status")
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        작성자(author)와 프로필 이미지를 미리 로드해 목록에서 게시물마다 추가 쿼리가 발생하지 않도록 합니다.
+        """
+        return (
+            queryset.select_related("author")
+            .only(*CS_POST_COLUMNS, *(f"author__{column}" for column in USER_SERIALIZER_COLUMNS))
+            .prefetch_related("author__profile_images")
+        )
+
     def get_attachment_url(self, obj):
         if obj.attachment and hasattr(obj.attachment, "url"):
             return f"{settings.MEDIA_URL}{obj.attachment.name}"
         return None
 
-    def to_representation(self, instance):
-        representation = super().to_representation(instance)
-        # POST_TYPE_CHOICES와 STATUS_CHOICES 정보 추가
-        if self.context.get("request") and self.context["request"].method == "GET":
-            representation["type_choices"] = [
-                {"value": choice[0], "display": choice[1]} for choice in CSPost.POST_TYPE_CHOICES
-            ]
-            representation["status_choices"] = [
-                {"value": choice[0], "display": choice[1]} for choice in CSPost.STATUS_CHOICES
-            ]
-        return representation
-
 
 class CSPostCreateSerializer(serializers.ModelSerializer):
     attachment_url = serializers.URLField(required=False, write_only=True)
@@ -16,7 +16,7 @@ def api_client():
 
 
 @pytest.fixture
-def authenticate_client(api_client):
+def authenticate_client(authenticate_client_cached):
     def _authenticate_client(user=None, is_staff=False):
         if user is None:
             timestamp = timezone.now().timestamp()
@@ -26,18 +26,8 @@ def authenticate_client(api_client):
                 nickname=f"test_user_{timestamp}",
                 is_staff=is_staff,
             )
-        login_url = reverse("user:token_login")
-        response = api_client.post(login_url, {"email": user.email, "password": "testpass123!"})
-        if response.status_code == status.HTTP_429_TOO_MANY_REQUESTS:
-            # throttle 제한에 걸린 경우: 강제로 인증
-            api_client.force_authenticate(user=user)
-        else:
-            access_token = response.data.get("data", {}).get("access_token")
-            if access_token:
-                api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
-            else:
-                api_client.force_authenticate(user=user)
-        return user
+        # 로그인 API 호출 없이 (캐시된) JWT로 인증
+        return authenticate_client_cached(user)
 
     return _authenticate_client
 
@@ -94,6 +84,10 @@ class TestCSPostAPI:
         # 일반 사용자는 본인이 작성한 게시물만 볼 수 있음
         assert response.data["data"]["count"] == 1  # pagination 적용
         assert response.data["data"]["results"][0]["author"]["id"] == user.id
+        # 선택지는 목록 응답에 한 번만 포함되고 게시물마다 반복되지 않음
+        assert response.data["data"]["type_choices"][0] == {"value": "inquiry", "display": "문의"}
+        assert "status_choices" in response.data["data"]
+        assert "type_choices" not in response.data["data"]["results"][0]
 
     def test_list_cs_posts_admin(self, api_client, create_user):
         admin = create_user(is_staff=True)
@@ -119,6 +113,21 @@ class TestCSPostAPI:
         # 관리자는 모든 게시물을 볼 수 있음
         assert response.data["data"]["count"] == 2  # pagination 적용
 
+    def test_list_cs_posts_query_count(
+        self, api_client, create_user, create_users, create_cs_post, django_assert_max_num_queries
+    ):
+        admin = create_user(is_staff=True)
+        api_client.force_authenticate(user=admin)
+        for author in create_users(5):
+            create_cs_post(author)
+        url = reverse("cs_post:cspost-list-create")
+
+        # count + 게시물(작성자 JOIN) + 프로필 이미지 prefetch → 작성자 수와 무관
+        with django_assert_max_num_queries(3):
+            response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"]["count"] == 5
+
     def test_get_cs_post_detail(self, api_client, create_user, create_cs_post):
         user = create_user()
         cs_post = create_cs_post(author=user)
@@ -128,6 +137,12 @@ class TestCSPostAPI:
         assert response.status_code == status.HTTP_200_OK
         assert response.data["data"]["id"] == cs_post.id
         assert response.data["data"]["title"] == cs_post.title
+        assert [choice["value"] for choice in response.data["data"]["status_choices"]] == [
+            "pending",
+            "in_progress",
+            "completed",
+            "closed",
+        ]
 
     def test_get_other_user_cs_post_detail(self, api_client, create_user, create_cs_post):
         user1 = create_user()
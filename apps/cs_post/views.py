@@ -7,7 +7,7 @@ from rest_framework.response import Response
 from utils.response import BaseResponseMixin
 
 from .models import CSPost
-from .serializers import CSPostCreateSerializer, CSPostSerializer, CSPostUpdateSerializer
+from .serializers import CHOICE_OPTIONS, CSPostCreateSerializer, CSPostSerializer, CSPostUpdateSerializer
 
 
 class CSPostListCreateView(BaseResponseMixin, generics.ListCreateAPIView):
@@ -25,9 +25,10 @@ class CSPostListCreateView(BaseResponseMixin, generics.ListCreateAPIView):
         if getattr(self, "swagger_fake_view", False):
             return CSPost.objects.none()
         # 사용자는 본인이 작성한 게시물만 조회 가능, 관리자는 모든 게시물 조회
+        queryset = CSPostSerializer.setup_eager_loading(CSPost.objects.all())
         if self.request.user.is_staff:
-            return CSPost.objects.select_related("author").all()
-        return CSPost.objects.select_related("author").filter(author=self.request.user)
+            return queryset
+        return queryset.filter(author=self.request.user)
 
     def get_serializer_class(self):
         if self.request.method == "POST":
@@ -67,7 +68,7 @@ class CSPostListCreateView(BaseResponseMixin, generics.ListCreateAPIView):
         serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
         response_serializer = CSPostSerializer(serializer.instance)
-        self.logger.info(f"CSPost created by {request.user.email if request.user.is_authenticated else 'anonymous'}")
+        self.logger.info("CSPost created by %s", request.user.email)
         return self.success(data=response_serializer.data, message="문의가 등록되었습니다.", status=201)
 
     def list(self, request, *args, **kwargs):
@@ -81,6 +82,8 @@ class CSPostListCreateView(BaseResponseMixin, generics.ListCreateAPIView):
                     "next": self.paginator.get_next_link(),
                     "previous": self.paginator.get_previous_link(),
                     "results": serializer.data,
+                    # 선택지는 게시물마다 반복하지 않고 목록 응답에 한 번만 포함
+                    **CHOICE_OPTIONS,
                 },
                 message="문의 목록을 조회했습니다.",
             )
@@ -97,9 +100,10 @@ class CSPostDetailView(BaseResponseMixin, generics.RetrieveUpdateDestroyAPIView)
         if getattr(self, "swagger_fake_view", False):
             return CSPost.objects.none()
         # 사용자는 본인이 작성한 게시물만 조회/수정/삭제 가능, 관리자는 모든 게시물 조회/수정/삭제
+        queryset = CSPostSerializer.setup_eager_loading(CSPost.objects.all())
         if self.request.user.is_staff:
-            return CSPost.objects.select_related("author").all()
-        return CSPost.objects.select_related("author").filter(author=self.request.user)
+            return queryset
+        return queryset.filter(author=self.request.user)
 
     def get_serializer_class(self):
         if self.request.method in ["PUT", "PATCH"]:
@@ -111,18 +115,14 @@ class CSPostDetailView(BaseResponseMixin, generics.RetrieveUpdateDestroyAPIView)
         if serializer.instance.author != self.request.user and not self.request.user.is_staff:
             self.permission_denied(self.request, message="문의 작성자 또는 관리자만 수정할 수 있습니다.")
         super().perform_update(serializer)
-        self.logger.info(
-            f"CSPost updated by {self.request.user.email if self.request.user.is_authenticated else 'anonymous'}"
-        )
+        self.logger.info("CSPost updated by %s", self.request.user.email)
 
     def perform_destroy(self, instance):
         # 작성자 또는 관리자만 삭제 가능
         if instance.author != self.request.user and not self.request.user.is_staff:
             self.permission_denied(self.request, message="문의 작성자 또는 관리자만 삭제할 수 있습니다.")
         super().perform_destroy(instance)
-        self.logger.info(
-            f"CSPost deleted by {self.request.user.email if self.request.user.is_authenticated else 'anonymous'}"
-        )
+        self.logger.info("CSPost deleted by %s", self.request.user.email)
 
     @swagger_auto_schema(
         operation_summary="문의 상세 조회",
@@ -170,7 +170,7 @@ class CSPostDetailView(BaseResponseMixin, generics.RetrieveUpdateDestroyAPIView)
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
         serializer = self.get_serializer(instance)
-        return self.success(data=serializer.data, message="문의 상세 정보를 조회했습니다.")
+        return self.success(data={**serializer.data, **CHOICE_OPTIONS}, message="문의 상세 정보를 조회했습니다.")
 
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop("partial", False)
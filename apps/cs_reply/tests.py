@@ -28,12 +28,8 @@ def authenticate_client(api_client):
                 is_staff=is_staff,
                 nickname=nickname,
             )
-        response = api_client.post(reverse("user:token_login"), {"email": user.email, "password": "testpass123!"})
-        assert response.status_code == status.HTTP_200_OK, f"Login failed: {response.data}"
-        assert "message" in response.data
-        assert "data" in response.data
-        access_token = response.data["data"]["access_token"]
-        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
+        # 로그인 API는 user 앱 테스트에서 검증하므로 여기서는 토큰 발급 없이 인증
+        api_client.force_authenticate(user=user)
         return user
 
     return _authenticate_client
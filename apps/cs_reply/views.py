@@ -61,7 +61,7 @@ class CSReplyListCreateView(BaseResponseMixin, generics.ListCreateAPIView):
         instance = serializer.instance
         response_serializer = CSReplySerializer(instance)
         data = response_serializer.data
-        self.logger.info(f"CSReply created by {request.user.email if request.user.is_authenticated else 'anonymous'}")
+        self.logger.info("CSReply created by %s", request.user.email)
         return self.success(data=data, message="CS 답변이 생성되었습니다.", status=201)
 
     @swagger_auto_schema(
@@ -147,17 +147,13 @@ class CSReplyDetailView(BaseResponseMixin, generics.RetrieveUpdateDestroyAPIView
         if not self.request.user.is_staff:
             self.permission_denied(self.request, message="관리자만 답변을 수정할 수 있습니다.")
         super().perform_update(serializer)
-        self.logger.info(
-            f"CSReply updated by {self.request.user.email if self.request.user.is_authenticated else 'anonymous'}"
-        )
+        self.logger.info("CSReply updated by %s", self.request.user.email)
 
     def perform_destroy(self, instance):
         if not self.request.user.is_staff:
             self.permission_denied(self.request, message="관리자만 답변을 삭제할 수 있습니다.")
         super().perform_destroy(instance)
-        self.logger.info(
-            f"CSReply deleted by {self.request.user.email if self.request.user.is_authenticated else 'anonymous'}"
-        )
+        self.logger.info("CSReply deleted by %s", self.request.user.email)
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
@@ -42,15 +42,11 @@ class DashboardSummaryListView(BaseResponseMixin, generics.ListAPIView):
         if page is not None:
             serializer = self.get_serializer(page, many=True)
             paginated_response = self.get_paginated_response(serializer.data)
-            self.logger.info(
-                f"DashboardSummary list viewed by {request.user.email if request.user.is_authenticated else 'anonymous'}"
-            )
+            self.logger.info("DashboardSummary list viewed by %s", request.user.email)
             return self.success(data=paginated_response.data, message="대시보드 요약 정보 목록을 조회했습니다.")
 
         serializer = self.get_serializer(queryset, many=True)
-        self.logger.info(
-            f"DashboardSummary list viewed by {request.user.email if request.user.is_authenticated else 'anonymous'}"
-        )
+        self.logger.info("DashboardSummary list viewed by %s", request.user.email)
         return self.success(
             data={"count": len(serializer.data), "next": None, "previous": None, "results": serializer.data},
             message="대시보드 요약 정보 목록을 조회했습니다.",
@@ -94,7 +90,5 @@ class DashboardSummaryView(BaseResponseMixin, generics.RetrieveAPIView):
             message = "전역 대시보드 요약 정보를 조회했습니다."
         else:
             message = "대시보드 요약 정보를 조회했습니다."
-        self.logger.info(
-            f"DashboardSummary detail viewed by {request.user.email if request.user.is_authenticated else 'anonymous'}"
-        )
+        self.logger.info("DashboardSummary detail viewed by %s", request.user.email)
         return self.success(data=serializer.data, message=message)
@@ -93,7 +93,7 @@ class FAQListCreateView(BaseResponseMixin, generics.ListCreateAPIView):
         serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
         data = serializer.data
-        self.logger.info(f"FAQ created by {request.user.email if request.user.is_authenticated else 'anonymous'}")
+        self.logger.info("FAQ created by %s", request.user.email)
         return self.success(data=data, message="FAQ가 생성되었습니다.", status=201)
 
 
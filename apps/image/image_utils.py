@@ -9,7 +9,9 @@ import cloudinary.uploader
 from django.conf import settings
 from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import InMemoryUploadedFile
 from PIL import Image as PILImage
+from PIL import ImageOps
 
 logger = logging.getLogger(__name__)
 
@@ -83,6 +85,39 @@ def optimize_image(image_file, max_size=(800, 800), quality=85):
         raise
 
 
+def convert_to_webp(image_file, max_size=(1024, 720), quality=82):
+    """
+    이미지를 최대 크기 안으로 줄이고 WebP로 변환합니다.
+
+    Args:
+    ----
+        image_file: 업로드된 이미지 파일
+        max_size: 최대 크기 (width, height)
+        quality: WebP 품질 (1-100)
+
+    Returns:
+    -------
+        InMemoryUploadedFile: .webp 확장자의 변환된 이미지 (애니메이션 이미지는 원본 그대로 반환)
+
+    """
+    img = PILImage.open(image_file)
+    if getattr(img, "is_animated", False):
+        image_file.seek(0)
+        return image_file
+
+    # 저장 시 EXIF가 빠지므로 휴대폰 사진의 회전 정보(Orientation)를 먼저 픽셀에 반영
+    img = ImageOps.exif_transpose(img)
+    if img.size[0] > max_size[0] or img.size[1] > max_size[1]:
+        img.thumbnail(max_size, PILImage.Resampling.LANCZOS)
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA" if "A" in img.getbands() or "transparency" in img.info else "RGB")
+
+    output = BytesIO()
+    img.save(output, format="WEBP", quality=quality)
+    name = f"{os.path.splitext(os.path.basename(image_file.name))[0]}.webp"
+    return InMemoryUploadedFile(output, "image", name, "image/webp", output.tell(), None)
+
+
 def generate_unique_filename(original_filename):
     """
     고유한 파일명을 생성합니다.
@@ -3,12 +3,13 @@ import io
 import pytest
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.urls import reverse
 from django.utils import timezone
 from PIL import Image as PilImage
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from apps.image.image_utils import convert_to_webp
+
 User = get_user_model()
 
 
@@ -31,13 +32,7 @@ def user(create_user):
 @pytest.fixture
 def auth_client(user):
     client = APIClient()
-    response = client.post(
-        reverse("user:token_login"),
-        {"email": user.email, "password": "password123"},
-        format="json",
-    )
-    token = response.data["data"]["access_token"]
-    client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    client.force_authenticate(user=user)
     return client
 
 
@@ -98,3 +93,19 @@ def auth_client(user):
 #     response = auth_client.delete(url, data=delete_data, format="multipart")
 #     assert response.status_code == status.HTTP_200_OK
 #     assert response.data["data"]["deleted"] is True
+
+
+def test_convert_to_webp_applies_exif_orientation():
+    # 가로 20 x 세로 10 픽셀, EXIF Orientation=6(시계 방향 90도 회전해서 표시)
+    buffer = io.BytesIO()
+    exif = PilImage.Exif()
+    exif[0x0112] = 6
+    PilImage.new("RGB", (20, 10), color="blue").save(buffer, "JPEG", exif=exif)
+    image_file = SimpleUploadedFile("phone.jpg", buffer.getvalue(), content_type="image/jpeg")
+
+    converted = convert_to_webp(image_file)
+
+    converted.seek(0)
+    with PilImage.open(converted) as result:
+        assert result.format == "WEBP"
+        assert result.size == (10, 20)
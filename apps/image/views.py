@@ -50,9 +50,7 @@ class ImageUploadView(BaseResponseMixin, GenericAPIView):
                 }
                 for image in images
             ]
-            self.logger.info(
-                f"Image uploaded by {request.user.email if request.user.is_authenticated else 'anonymous'}"
-            )
+            self.logger.info("Image uploaded by %s", request.user.email)
             return self.success(data=response_data, message=UPLOAD_SUCCESS["message"], status=201)
         except Exception as e:
             self.logger.error(f"Image upload failed: {e}", exc_info=True)
@@ -74,7 +72,7 @@ class ImageUploadView(BaseResponseMixin, GenericAPIView):
         try:
             serializer.is_valid(raise_exception=True)
             deleted_count = serializer.delete()
-            logger.info(f"{deleted_count} images deleted by user {request.user.email}")
+            logger.info("%s images deleted by user %s", deleted_count, request.user.email)
             return success_response(
                 message=f"{deleted_count}개의 이미지가 삭제되었습니다.",
                 data={"deleted": True, "deleted_count": deleted_count},
@@ -80,7 +80,7 @@ class LikeListCreateView(BaseResponseMixin, generics.ListCreateAPIView):
         serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
         data = serializer.data
-        self.logger.info(f"Like created by {request.user.email if request.user.is_authenticated else 'anonymous'}")
+        self.logger.info("Like created by %s", request.user.email)
         return self.success(data=data, message="좋아요가 생성되었습니다.", status=201)
 
 
@@ -120,5 +120,5 @@ class LikeDestroyView(BaseResponseMixin, generics.DestroyAPIView):
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
         self.perform_destroy(instance)
-        self.logger.info(f"Like deleted by {request.user.email if request.user.is_authenticated else 'anonymous'}")
+        self.logger.info("Like deleted by %s", request.user.email)
         return self.success(data=None, message="좋아요가 삭제되었습니다.", status=204)
@@ -80,7 +80,7 @@ class NoticeListCreateView(BaseResponseMixin, generics.ListCreateAPIView):
         instance = serializer.instance
         response_serializer = NoticeSerializer(instance, context=self.get_serializer_context())
         data = response_serializer.data
-        self.logger.info(f"Notice created by {request.user.email if request.user.is_authenticated else 'anonymous'}")
+        self.logger.info("Notice created by %s", request.user.email)
         return self.success(data=data, message="공지사항이 생성되었습니다.", status=201)
 
     def perform_create(self, serializer):
@@ -29,10 +29,8 @@ def authenticate_client(api_client):
                 password="testpass123!",
                 is_staff=is_staff,
             )
-        login_url = reverse("user:token_login")
-        response = api_client.post(login_url, {"email": user.email, "password": "testpass123!"})
-        access_token = response.data["data"]["access_token"]
-        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
+        # 로그인 API는 user 앱 테스트에서 검증하므로 여기서는 토큰 발급 없이 인증
+        api_client.force_authenticate(user=user)
         return user
 
     return _authenticate_client
@@ -61,9 +61,7 @@ class NotificationListCreateView(BaseResponseMixin, generics.ListCreateAPIView):
         instance = serializer.instance
         response_serializer = NotificationSerializer(instance, context=self.get_serializer_context())
         data = response_serializer.data
-        self.logger.info(
-            f"Notification created by {request.user.email if request.user.is_authenticated else 'anonymous'}"
-        )
+        self.logger.info("Notification created by %s", request.user.email)
         return self.success(data=data, message="알림이 생성되었습니다.", status=201)
 
     @swagger_auto_schema(
@@ -117,18 +115,14 @@ class NotificationDetailView(BaseResponseMixin, generics.RetrieveUpdateDestroyAP
         if serializer.instance.user != self.request.user and not self.request.user.is_staff:
             self.permission_denied(self.request)
         super().perform_update(serializer)
-        self.logger.info(
-            f"Notification updated by {self.request.user.email if self.request.user.is_authenticated else 'anonymous'}"
-        )
+        self.logger.info("Notification updated by %s", self.request.user.email)
 
     def perform_destroy(self, instance):
         # 알림 소유자 또는 관리자만 삭제 가능
         if instance.user != self.request.user and not self.request.user.is_staff:
             self.permission_denied(self.request)
         super().perform_destroy(instance)
-        self.logger.info(
-            f"Notification deleted by {self.request.user.email if self.request.user.is_authenticated else 'anonymous'}"
-        )
+        self.logger.info("Notification deleted by %s", self.request.user.email)
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
@@ -88,7 +88,7 @@ class OrderListCreateView(BaseResponseMixin, generics.ListCreateAPIView):
         self.perform_create(serializer)
         order = serializer.instance
         output_serializer = OrderSerializer(order, context=self.get_serializer_context())
-        self.logger.info(f"Order created by {request.user.email if request.user.is_authenticated else 'anonymous'}")
+        self.logger.info("Order created by %s", request.user.email)
         return self.success(data=output_serializer.data, message="주문이 생성되었습니다.", status=201)
 
 
@@ -87,9 +87,7 @@ class PresetMessageListCreateView(BaseResponseMixin, generics.ListCreateAPIView)
         # 생성된 인스턴스를 전체 필드로 직렬화
         response_serializer = PresetMessageSerializer(serializer.instance)
         data = response_serializer.data
-        self.logger.info(
-            f"PresetMessage created by {request.user.email if request.user.is_authenticated else 'anonymous'}"
-        )
+        self.logger.info("PresetMessage created by %s", request.user.email)
         return self.success(data=data, message="프리셋 메시지가 생성되었습니다.", status=201)
 
 
@@ -156,17 +154,13 @@ class PresetMessageDetailView(BaseResponseMixin, generics.RetrieveUpdateDestroyA
         if serializer.instance.user != self.request.user and serializer.instance.user is not None:
             self.permission_denied(self.request)
         super().perform_update(serializer)
-        self.logger.info(
-            f"PresetMessage updated by {self.request.user.email if self.request.user.is_authenticated else 'anonymous'}"
-        )
+        self.logger.info("PresetMessage updated by %s", self.request.user.email)
 
     def perform_destroy(self, instance):
         if instance.user != self.request.user and instance.user is not None:
             self.permission_denied(self.request)
         super().perform_destroy(instance)
-        self.logger.info(
-            f"PresetMessage deleted by {self.request.user.email if self.request.user.is_authenticated else 'anonymous'}"
-        )
+        self.logger.info("PresetMessage deleted by %s", self.request.user.email)
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
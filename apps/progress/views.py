@@ -105,7 +105,7 @@ class ProgressListCreateView(BaseResponseMixin, generics.ListCreateAPIView):
         # 생성된 인스턴스를 전체 필드로 직렬화
         response_serializer = ProgressListSerializer(serializer.instance)
         data = response_serializer.data
-        self.logger.info(f"Progress created by {request.user.email if request.user.is_authenticated else 'anonymous'}")
+        self.logger.info("Progress created by %s", request.user.email)
         return self.success(data=data, message="진행상황이 생성되었습니다.", status=201)
 
 
@@ -178,15 +178,11 @@ class ProgressDetailView(BaseResponseMixin, generics.RetrieveUpdateDestroyAPIVie
 
     def perform_update(self, serializer):
         serializer.save(last_updated_by=self.request.user)
-        self.logger.info(
-            f"Progress updated by {self.request.user.email if self.request.user.is_authenticated else 'anonymous'}"
-        )
+        self.logger.info("Progress updated by %s", self.request.user.email)
 
     def perform_destroy(self, instance):
         super().perform_destroy(instance)
-        self.logger.info(
-            f"Progress deleted by {self.request.user.email if self.request.user.is_authenticated else 'anonymous'}"
-        )
+        self.logger.info("Progress deleted by %s", self.request.user.email)
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
@@ -86,7 +86,7 @@ class ReviewListCreateView(BaseResponseMixin, generics.ListCreateAPIView):
         # 생성된 인스턴스를 전체 필드로 직렬화
         response_serializer = self.get_serializer(serializer.instance)
         data = response_serializer.data
-        self.logger.info(f"Review created by {request.user.email if request.user.is_authenticated else 'anonymous'}")
+        self.logger.info("Review created by %s", request.user.email)
         return self.success(data=data, message="리뷰가 생성되었습니다.", status=201)
 
     @swagger_auto_schema(
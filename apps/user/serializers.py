@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from django.contrib.auth import get_user_model
 from django.contrib.auth.hashers import make_password
 from django.contrib.contenttypes.models import ContentType
@@ -140,12 +142,17 @@ class UserSerializer(serializers.ModelSerializer):
             return profile_image.image_url
         return None
 
+    @cached_property
+    def is_staff_request(self):
+        """요청 사용자가 관리자인지. 목록/중첩 직렬화에서 사용자마다 request.user를 다시 확인하지 않도록 한 번만 계산"""
+        request = self.context.get("request")
+        return bool(request and request.user.is_staff)
+
     def to_representation(self, instance):
         data = super().to_representation(instance)
-        request = self.context.get("request")
 
         # 관리자가 아닌 경우 민감한 정보 제거
-        if not (request and request.user.is_staff):
+        if not self.is_staff_request:
             data.pop("phone", None)
             data.pop("is_active", None)
             data.pop("is_email_verified", None)
@@ -153,6 +160,36 @@ class UserSerializer(serializers.ModelSerializer):
         return data
 
 
+# UserSerializer가 읽는 User 컬럼 (관계 조회 시 .only()로 password 등 불필요한 컬럼 제외)
+USER_SERIALIZER_COLUMNS = (
+    "id",
+    "email",
+    "nickname",
+    "phone",
+    "user_type",
+    "user_grade",
+    "is_active",
+    "is_email_verified",
+    "created_at",
+)
+
+
+class MemoizedUserSerializer(UserSerializer):
+    """
+    context["serialized_users"]가 주어지면 같은 사용자를 응답 내에서 한 번만 직렬화하고 재사용합니다.
+    (여러 채팅방/메시지에 같은 사용자가 반복해서 나올 때 UserSerializer 반복 호출 방지)
+    """
+
+    def to_representation(self, instance):
+        serialized_users = self.context.get("serialized_users")
+        if serialized_users is None:
+            return super().to_representation(instance)
+        data = serialized_users.get(instance.pk)
+        if data is None:
+            data = serialized_users[instance.pk] = super().to_representation(instance)
+        return data
+
+
 class ProfileUpdateSerializer(serializers.ModelSerializer):
     profile_image_file = serializers.ImageField(write_only=True, required=False, allow_null=True)
 
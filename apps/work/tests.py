@@ -17,7 +17,7 @@ def api_client():
 
 
 @pytest.fixture
-def authenticate_client(api_client, user_factory):
+def authenticate_client(authenticate_client_cached, user_factory):
     def _authenticate_client(user=None, is_staff=False):
         if user is None:
             user = user_factory(
@@ -25,11 +25,8 @@ def authenticate_client(api_client, user_factory):
                 password="testpass123!",
                 is_staff=is_staff,
             )
-        login_url = reverse("user:token_login")
-        response = api_client.post(login_url, {"email": user.email, "password": "testpass123!"})
-        access_token = response.data["data"]["access_token"]
-        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
-        return user
+        # 로그인 API 호출 없이 (캐시된) JWT로 인증
+        return authenticate_client_cached(user)
 
     return _authenticate_client
 
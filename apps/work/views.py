@@ -91,7 +91,7 @@ class WorkListCreateView(BaseResponseMixin, generics.ListCreateAPIView):
         # 생성된 인스턴스를 전체 필드로 직렬화
         response_serializer = WorkSerializer(serializer.instance)
         data = response_serializer.data
-        self.logger.info(f"Work created by {request.user.email if request.user.is_authenticated else 'anonymous'}")
+        self.logger.info("Work created by %s", request.user.email)
         return self.success(data=data, message="작업이 생성되었습니다.", status=201)
 
 
@@ -191,7 +191,7 @@ class WorkDetailView(BaseResponseMixin, generics.RetrieveUpdateDestroyAPIView):
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
         self.perform_update(serializer)
-        self.logger.info(f"Work updated by {request.user.email if request.user.is_authenticated else 'anonymous'}")
+        self.logger.info("Work updated by %s", request.user.email)
         return self.success(data=serializer.data, message="작업이 수정되었습니다.")
 
     def perform_destroy(self, instance):
@@ -203,5 +203,5 @@ class WorkDetailView(BaseResponseMixin, generics.RetrieveUpdateDestroyAPIView):
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
         self.perform_destroy(instance)
-        self.logger.info(f"Work deleted by {request.user.email if request.user.is_authenticated else 'anonymous'}")
+        self.logger.info("Work deleted by %s", request.user.email)
         return self.success(data=None, message="작업이 삭제되었습니다.", status=204)
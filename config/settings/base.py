@@ -267,6 +267,9 @@ SWAGGER_SETTINGS = {
     },
     "JSON_EDITOR": True,
 }
+# 스웨거 스키마 응답 캐시 시간(초). 0이면 요청마다 스키마를 새로 생성 (개발 중 코드 변경 즉시 반영)
+# CI/스키마 비교 파이프라인처럼 스키마를 반복 요청하는 환경에서는 3600 등으로 설정
+SWAGGER_SCHEMA_CACHE_TIMEOUT = int(ENV.get("SWAGGER_SCHEMA_CACHE_TIMEOUT", 0))
 
 # DRF YASG settings for OpenAPI 3.0
 SPECTACULAR_SETTINGS = {
@@ -293,6 +296,10 @@ AUTH_PASSWORD_VALIDATORS = [
 # Custom Password Validator
 AUTH_PASSWORD_VALIDATORS.append({"NAME": "apps.user.validators.CustomPasswordValidator"})
 
+# 테스트에서는 PBKDF2 대신 MD5 해셔를 사용해 사용자 생성/로그인 시 비밀번호 해싱 비용을 줄임
+if TESTING:
+    PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
 # Internationalization
 LANGUAGE_CODE = "ko-kr"
 TIME_ZONE = "Asia/Seoul"
@@ -360,6 +367,12 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
 
+# 이벤트 로그 생성 API를 Redis 큐 적재(202) + Celery 일괄 저장으로 처리할지 여부 (Redis 캐시 필요)
+ANALYTICS_EVENT_LOG_QUEUE_ENABLED = ENV.get("ANALYTICS_EVENT_LOG_QUEUE_ENABLED", "False").lower() == "true"
+# 이벤트 로그 보존 기간(일). 설정한 경우에만 purge_old_event_logs 태스크가 지난 로그를 삭제 (기본값: 삭제하지 않음)
+_event_log_retention_days = ENV.get("ANALYTICS_EVENT_LOG_RETENTION_DAYS")
+ANALYTICS_EVENT_LOG_RETENTION_DAYS = int(_event_log_retention_days) if _event_log_retention_days else None
+
 # Celery Beat 스케줄 예시 (알림 리마인더, 예약 작업 등)
 from celery.schedules import crontab
 
@@ -369,6 +382,16 @@ CELERY_BEAT_SCHEDULE = {
         "task": "apps.notification.tasks.daily_cleanup",
         "schedule": crontab(minute=0, hour=0),
     },
+    # 매일 0시 10분에 전날 일별 분석(DailyAnalytics) 집계
+    "refresh_daily_analytics": {
+        "task": "apps.analytics.tasks.refresh_daily_analytics",
+        "schedule": crontab(minute=10, hour=0),
+    },
+    # 매시 정각에 만료된 채팅 파일 청크 업로드의 청크 파일 삭제
+    "purge_expired_chat_uploads": {
+        "task": "apps.chat_message.tasks.purge_expired_chat_uploads",
+        "schedule": crontab(minute=0),
+    },
     # 예시: 매일 오전 9시에 특정 사용자에게 리마인더 알림 전송
     # "send_reminder_notification": {
     #     "task": "apps.notification.tasks.send_reminder_notification",
@@ -377,6 +400,20 @@ CELERY_BEAT_SCHEDULE = {
     # },
 }
 
+# 이벤트 로그 큐를 사용하는 경우에만 10초마다 Redis 큐에 쌓인 이벤트 로그를 일괄 저장
+if ANALYTICS_EVENT_LOG_QUEUE_ENABLED:
+    CELERY_BEAT_SCHEDULE["flush_event_log_queue"] = {
+        "task": "apps.analytics.tasks.flush_event_log_queue",
+        "schedule": 10.0,
+    }
+
+# 이벤트 로그 보존 기간을 설정한 경우에만 매일 새벽 3시에 지난 이벤트 로그 삭제
+if ANALYTICS_EVENT_LOG_RETENTION_DAYS:
+    CELERY_BEAT_SCHEDULE["purge_old_event_logs"] = {
+        "task": "apps.analytics.tasks.purge_old_event_logs",
+        "schedule": crontab(minute=0, hour=3),
+    }
+
 # --- Sentry 연동 (운영 환경에서만 활성화 권장) ---
 SENTRY_DSN = ENV.get("SENTRY_DSN", "")
 if SENTRY_DSN:
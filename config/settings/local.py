@@ -50,6 +50,8 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        # 테스트 DB는 메모리에서 생성 (커밋마다 디스크 fsync 없음)
+        "TEST": {"NAME": ":memory:"},
     },
 }
 
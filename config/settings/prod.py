@@ -14,6 +14,16 @@ DATABASES = {
         "PASSWORD": ENV.get("DB_PASSWORD", ""),
         "HOST": ENV.get("DB_HOST", "localhost"),
         "PORT": ENV.get("DB_PORT", "5432"),
+        # 요청마다 새로 연결하지 않고 연결을 재사용 (재사용 전 상태 확인)
+        "CONN_MAX_AGE": int(ENV.get("DB_CONN_MAX_AGE", 60)),
+        "CONN_HEALTH_CHECKS": True,
+        # pgbouncer(transaction 모드) 경유 시 서버 사이드 커서는 트랜잭션을 넘어 유지되지 않으므로 비활성화
+        "DISABLE_SERVER_SIDE_CURSORS": ENV.get("DB_DISABLE_SERVER_SIDE_CURSORS", "False").lower() == "true",
+        "OPTIONS": {
+            # 오래 걸리는 쿼리가 연결을 점유하지 않도록 문장 단위 제한(ms). 0이면 제한 없음
+            # (Celery 집계 작업/인덱스 생성 마이그레이션도 같은 설정을 쓰므로 API 기준보다 여유 있게 설정)
+            "options": f"-c statement_timeout={int(ENV.get('DB_STATEMENT_TIMEOUT_MS', 30000))}",
+        },
     },
 }
 
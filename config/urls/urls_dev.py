@@ -67,17 +67,17 @@ if settings.DEBUG:
     urlpatterns += [
         path(
             "swagger<format>/",
-            schema_view.without_ui(cache_timeout=0),
+            schema_view.without_ui(cache_timeout=settings.SWAGGER_SCHEMA_CACHE_TIMEOUT),
             name="schema-json",
         ),
         path(
             "swagger/",
-            schema_view.with_ui("swagger", cache_timeout=0),
+            schema_view.with_ui("swagger", cache_timeout=settings.SWAGGER_SCHEMA_CACHE_TIMEOUT),
             name="schema-swagger-ui",
         ),
         path(
             "redoc/",
-            schema_view.with_ui("redoc", cache_timeout=0),
+            schema_view.with_ui("redoc", cache_timeout=settings.SWAGGER_SCHEMA_CACHE_TIMEOUT),
             name="schema-redoc",
         ),
     ]
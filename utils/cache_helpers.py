@@ -2,7 +2,12 @@ import logging
 
 from django.core.cache import cache
 
-from utils.cache_keys import get_user_list_cache_key, get_user_profile_cache_key
+from utils.cache_keys import (
+    DAILY_ANALYTICS_CACHE_VERSION_KEY,
+    get_chat_room_admin_cache_key,
+    get_user_list_cache_key,
+    get_user_profile_cache_key,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -45,3 +50,22 @@ def invalidate_all_user_caches():
     except Exception as e:
         logger.error(f"Cache invalidation failed: {e!s}")
         raise
+
+
+def get_daily_analytics_cache_version():
+    """일별 분석 목록 캐시의 현재 버전을 반환합니다."""
+    return cache.get_or_set(DAILY_ANALYTICS_CACHE_VERSION_KEY, 1, None)
+
+
+def invalidate_daily_analytics_cache():
+    """일별 분석 목록 캐시 버전을 올려 기존 캐시 키를 모두 무효화합니다."""
+    try:
+        cache.incr(DAILY_ANALYTICS_CACHE_VERSION_KEY)
+    except ValueError:
+        # 버전 키가 없으면 기본 버전(1)과 다른 값으로 초기화
+        cache.set(DAILY_ANALYTICS_CACHE_VERSION_KEY, 2, None)
+
+
+def invalidate_chat_room_admin_cache(chat_room_id, user_ids):
+    """채팅방 참여자들의 관리자 여부 캐시를 무효화합니다."""
+    cache.delete_many([get_chat_room_admin_cache_key(chat_room_id, user_id) for user_id in user_ids])
@@ -1,5 +1,9 @@
 USER_PROFILE_CACHE_TIMEOUT = 300  # 5분
 USER_LIST_CACHE_TIMEOUT = 120  # 2분
+DAILY_ANALYTICS_LIST_CACHE_TIMEOUT = 60 * 60  # 1시간
+DAILY_ANALYTICS_CACHE_VERSION_KEY = "daily_analytics_version"
+CHAT_ROOM_ADMIN_CACHE_TIMEOUT = 30  # 30초
+CHAT_UPLOAD_CACHE_TIMEOUT = 60 * 60  # 1시간
 
 
 def get_user_profile_cache_key(user_id):
@@ -17,3 +21,35 @@ def get_user_list_cache_key(page=1, filters=None):
     if filters:
         filters_str = "_".join(f"{k}:{v}" for k, v in sorted(filters.items()))
     return f"user_list_{page}_{filters_str}"
+
+
+def get_daily_analytics_list_cache_key(version, params=None):
+    """
+    일별 분석 목록 캐시 키를 생성합니다.
+
+    조회 조건(기간/정렬/페이지 등 쿼리 파라미터)과 캐시 버전을 키에 포함합니다.
+    """
+    params_str = ""
+    if params:
+        params_str = "_".join(f"{k}:{v}" for k, v in sorted(params.items()))
+    return f"daily_analytics_list_{version}_{params_str}"
+
+
+def get_chat_room_admin_cache_key(chat_room_id, user_id):
+    """채팅방 관리자 여부 캐시 키를 생성합니다."""
+    return f"chat_room_admin_{chat_room_id}_{user_id}"
+
+
+def get_chat_upload_cache_key(upload_id):
+    """진행 중인 채팅 파일 청크 업로드 상태 캐시 키를 생성합니다."""
+    return f"chat_upload_{upload_id}"
+
+
+def get_chat_upload_user_cache_key(user_id):
+    """사용자별 진행 중인 채팅 파일 청크 업로드 목록 캐시 키를 생성합니다."""
+    return f"chat_upload_user_{user_id}"
+
+
+def get_chat_upload_key_cache_key(upload_key, user_id, chat_room_id):
+    """완료된 청크 업로드(upload_key)를 업로드한 사용자/채팅방에 묶어 두는 캐시 키를 생성합니다."""
+    return f"chat_upload_key_{user_id}_{chat_room_id}_{upload_key}"
@@ -0,0 +1,42 @@
+import csv
+import io
+
+import orjson
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+_json_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    orjson으로 응답을 직렬화하는 JSON 렌더러
+    Decimal/lazy 문자열 등 orjson이 모르는 타입은 DRF JSONEncoder 규칙으로 변환합니다.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        return orjson.dumps(data, default=_json_encoder.default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class CSVRenderer(BaseRenderer):
+    """
+    text/csv 요청(Accept 헤더, ?format=csv)을 협상하기 위한 렌더러
+    CSV 본문은 뷰가 StreamingHttpResponse로 직접 보내고, 여기서는 오류 응답(dict)만 key,value 행으로 렌더링합니다.
+    """
+
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if isinstance(data, dict):
+            writer.writerows(data.items())
+        else:
+            writer.writerow([data])
+        return buffer.getvalue().encode(self.charset)
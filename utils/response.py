@@ -34,9 +34,9 @@ class BaseResponseMixin:
     logger = logging.getLogger("apps")
 
     def success(self, data=None, message="성공", code=200, status=200):
-        self.logger.info(f"SUCCESS: {message}")
+        self.logger.info("SUCCESS: %s", message)
         return Response({"success": True, "code": code, "message": message, "data": data}, status=status)
 
     def error(self, message="오류", code=400, status=400, data=None):
-        self.logger.warning(f"ERROR: {message}")
+        self.logger.warning("ERROR: %s", message)
         return Response({"success": False, "code": code, "message": message, "data": data}, status=status)
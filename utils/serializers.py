@@ -1,3 +1,5 @@
+import copy
+
 from rest_framework import serializers
 
 
@@ -17,3 +19,36 @@ class BaseSerializer(serializers.ModelSerializer):
     def validate(self, attrs):
         # ...필요시 공통 유효성 검사 추가...
         return super().validate(attrs)
+
+
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    get_fields() 결과를 시리얼라이저 클래스별로 캐시하는 ModelSerializer
+    인스턴스마다 필드 트리를 deepcopy/재구성하지 않고, 캐시된 필드를 얕은 복사해 사용합니다.
+    (get_fields()가 context/request에 따라 달라지는 시리얼라이저에는 사용하지 않습니다.)
+    """
+
+    _fields_cache: dict = {}
+
+    def get_fields(self):
+        cls = type(self)
+        fields = self._fields_cache.get(cls)
+        if fields is None:
+            fields = self._fields_cache[cls] = super().get_fields()
+        return {field_name: copy.copy(field) for field_name, field in fields.items()}
+
+
+class DynamicFieldsSerializerMixin:
+    """
+    fields 인자 또는 context["fields"]로 지정한 필드만 직렬화하는 Mixin (sparse fieldset)
+    예시: ?fields=id,content,timestamp → 나머지 필드는 to_representation에서 아예 계산하지 않음
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", None)
+        super().__init__(*args, **kwargs)
+        if fields is None:
+            fields = self.context.get("fields")
+        if fields:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
@@ -0,0 +1,9 @@
+class SwaggerFakeViewMixin:
+    """
+    drf-yasg가 스키마 생성 시 뷰 인스턴스에 설정하는 swagger_fake_view의 기본값을 클래스 속성으로 제공합니다.
+
+    get_queryset에서 getattr(self, "swagger_fake_view", False) 대신 self.swagger_fake_view로
+    바로 확인할 수 있어, 일반 요청마다 속성 탐색 실패(AttributeError) 처리 경로를 거치지 않습니다.
+    """
+
+    swagger_fake_view = False